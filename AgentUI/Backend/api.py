@@ -36,7 +36,7 @@ except ImportError:
 from fastapi import FastAPI, HTTPException, Query, Request, Response, File, Form, UploadFile
 from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 import uvicorn
 
@@ -1720,6 +1720,11 @@ async def get_chat_task_summary(agent_id: Optional[str] = None, user_name: Optio
 # Gmail Integration Endpoints
 # ============================================================================
 
+def _clear_search_cache(user_id: str):
+    """Drop a user's cached search responses once their Google credentials change"""
+    from Integrations.Google.Search.orchestrator import get_search_orchestrator
+    get_search_orchestrator().clear_cache(user_id)
+
 @app.get("/api/gmail/auth-url")
 async def get_gmail_auth_url(user_id: str = Query(...)):
     """Get Gmail OAuth2 authorization URL"""
@@ -1760,6 +1765,8 @@ async def handle_gmail_callback(request: GmailCallbackRequest):
         from Integrations.Google.Gmail.gmail_manager import gmail_manager
         
         result = gmail_manager.complete_oauth_flow(request.user_id, request.code, request.state)
+        if result.get('success'):
+            _clear_search_cache(request.user_id)
         return result
         
     except Exception as e:
@@ -1846,6 +1853,7 @@ async def get_gmail_status(user_id: str = Query(...)):
                     credentials = gmail_auth_service.get_credentials(token_data, user_id)
                     if credentials and not credentials.expired:
                         logger.info("✅ Successfully refreshed expired tokens automatically!")
+                        _clear_search_cache(user_id)
                         # Get updated status
                         status = gmail_manager.get_connection_status(user_id)
                     else:
@@ -1875,6 +1883,8 @@ async def disconnect_gmail(request: GmailDisconnectRequest):
         from Integrations.Google.Gmail.gmail_manager import gmail_manager
         
         result = gmail_manager.disconnect_gmail(request.user_id)
+        if result.get('success'):
+            _clear_search_cache(request.user_id)
         return result
         
     except Exception as e:
@@ -3122,7 +3132,7 @@ from Integrations.Google.Search.query_interpreter import SearchSource
 hybrid_search_adapter = get_search_adapter()
 logger.info("✅ Hybrid search system loaded successfully")
 
-@app.get("/api/search/unified")
+@app.get("/api/search/unified", response_class=ORJSONResponse)
 async def unified_search(
     query: str = Query(..., description="Natural language search query (supports Romanian/English)"),
     max_results: int = Query(25, ge=1, le=100, description="Maximum number of results"),
@@ -3141,7 +3151,7 @@ async def unified_search(
     """
     try:
         # Use hybrid search adapter for unified search
-        result = hybrid_search_adapter.unified_search(
+        result = await hybrid_search_adapter.unified_search_async(
             query=query,
             max_results=max_results,
             user_id=user_id,
@@ -3160,7 +3170,7 @@ async def unified_search(
             "results": []
         }
 
-@app.get("/api/search/emails")
+@app.get("/api/search/emails", response_class=ORJSONResponse)
 async def search_emails(
     query: str = Query(..., description="Email search query (supports Romanian operators)"),
     max_results: int = Query(25, ge=1, le=100, description="Maximum number of results"),
@@ -3176,7 +3186,7 @@ async def search_emails(
     - "mesaje înainte de:2025-01-01"
     """
     try:
-        results = hybrid_search_adapter.search_emails(
+        results = await hybrid_search_adapter.search_emails_async(
             query=query,
             user_id=user_id,
             max_results=max_results
@@ -3201,7 +3211,7 @@ async def search_emails(
             "results": []
         }
 
-@app.get("/api/search/files")
+@app.get("/api/search/files", response_class=ORJSONResponse)
 async def search_files_hybrid(
     query: str = Query(..., description="File search query (supports Romanian operators)"),
     max_results: int = Query(25, ge=1, le=100, description="Maximum number of results"),
@@ -3218,7 +3228,7 @@ async def search_files_hybrid(
     - "fișiere conținut:plan trimestrial"
     """
     try:
-        results = hybrid_search_adapter.search_files(
+        results = await hybrid_search_adapter.search_files_async(
             query=query,
             folder_filter=folder_filter,
             file_type_filter=file_type,
@@ -3515,7 +3525,7 @@ async def search_gdrive_files_legacy(
     """Legacy endpoint - redirected to hybrid search system"""
     try:
         # Use hybrid search adapter with legacy parameter mapping
-        results = hybrid_search_adapter.search_files(
+        results = await hybrid_search_adapter.search_files_async(
             query=query,
             folder_filter=folder,
             file_type_filter=file_type,
@@ -554,7 +554,7 @@ class SimpleAgentManager:
                     logger.info(f"🔍 CALLING hybrid search: query='{query}', folder='{derived_folder}', user_id='{user_id}'")
                     
                     # Use hybrid search system
-                    search_results = hybrid_search.unified_search(
+                    search_results = await hybrid_search.unified_search_async(
                         query=query,
                         max_results=5,
                         user_id=user_id,
@@ -55,6 +55,8 @@ class GoogleDriveManager:
         self.credentials_path = credentials_path
         self.token_path = token_path
         self.service = None
+        # Kept so callers running requests from several threads can give each its own HTTP client
+        self.credentials = None
         self.rate_limiter = RateLimitHandler()
         
     def authenticate(self) -> bool:
@@ -84,6 +86,7 @@ class GoogleDriveManager:
                     token.write(creds.to_json())
             
             # Build the service
+            self.credentials = creds
             self.service = build('drive', 'v3', credentials=creds)
             logger.info("Successfully authenticated with Google Drive")
             return True
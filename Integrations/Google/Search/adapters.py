@@ -6,7 +6,7 @@ Maintains existing API signatures while using the new hybrid search orchestrator
 import logging
 from typing import List, Dict, Any, Optional
 
-from .orchestrator import get_search_orchestrator, SearchRequest
+from .orchestrator import get_search_orchestrator, SearchRequest, SearchResponse
 from .query_interpreter import SearchSource
 
 logger = logging.getLogger(__name__)
@@ -57,59 +57,87 @@ class SearchAdapter:
                            user_id: Optional[str]) -> List[Dict[str, Any]]:
         """Execute search using hybrid orchestrator"""
         try:
-            # Modify query to include file type filter if specified
-            enhanced_query = query
-            if file_type_filter:
-                # Map common file types to Romanian-aware query enhancement
-                type_mappings = {
-                    'pdf': 'tip:pdf',
-                    'doc': 'tip:docx',
-                    'docx': 'tip:docx', 
-                    'excel': 'tip:xlsx',
-                    'xlsx': 'tip:xlsx',
-                    'ppt': 'tip:pptx',
-                    'pptx': 'tip:pptx'
-                }
-                type_query = type_mappings.get(file_type_filter.lower(), f'tip:{file_type_filter}')
-                enhanced_query = f"{query} {type_query}"
-            
-            request = SearchRequest(
-                query=enhanced_query,
-                max_results=max_results,
-                user_id=user_id,
-                sources=[SearchSource.DRIVE],  # Files only
-                folder_filter=folder_filter
-            )
-            
+            request = self._files_request(query, folder_filter, file_type_filter, max_results, user_id)
             response = self.orchestrator.search(request)
+            return self._legacy_files(response)
             
-            # Convert to legacy format
-            legacy_results = []
-            for result in response.results:
-                if result.get('source') == 'drive':
-                    # Convert hybrid format to legacy GoogleDriveSearchResult format
-                    legacy_result = {
-                        'file_id': result['id'],
-                        'name': result['name'],
-                        'folder_path': result.get('folder_path', ''),
-                        'full_path': f"{result.get('folder_path', '')}/{result['name']}".strip('/'),
-                        'mime_type': result['mime_type'],
-                        'size': result.get('size', 0),
-                        'modified_time': result['modified_time'],
-                        'web_view_link': result['web_view_link'],
-                        'download_link': result['download_link'],
-                        'file_type': result.get('file_type', 'Unknown File Type'),
-                        'ranking_score': result.get('ranking_score', 0.0)
-                    }
-                    legacy_results.append(legacy_result)
-            
-            logger.info(f"✅ Hybrid search returned {len(legacy_results)} files")
-            return legacy_results
+        except Exception as e:
+            logger.error(f"❌ Hybrid file search failed: {e}")
+            return []
+
+    async def search_files_async(self, 
+                                 query: str, 
+                                 folder_filter: Optional[str] = None,
+                                 file_type_filter: Optional[str] = None,
+                                 max_results: int = 10,
+                                 user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """search_files() for async callers, awaiting the orchestrator instead of blocking the event loop"""
+        logger.info(f"🔍 Hybrid search_files_async: '{query}'")
+        
+        try:
+            request = self._files_request(query, folder_filter, file_type_filter, max_results, user_id)
+            response = await self.orchestrator.search_async(request)
+            return self._legacy_files(response)
             
         except Exception as e:
             logger.error(f"❌ Hybrid file search failed: {e}")
             return []
 
+    @staticmethod
+    def _files_request(query: str, 
+                       folder_filter: Optional[str],
+                       file_type_filter: Optional[str], 
+                       max_results: int, 
+                       user_id: Optional[str]) -> SearchRequest:
+        """Build the Drive-only search request for a legacy file search"""
+        # Modify query to include file type filter if specified
+        enhanced_query = query
+        if file_type_filter:
+            # Map common file types to Romanian-aware query enhancement
+            type_mappings = {
+                'pdf': 'tip:pdf',
+                'doc': 'tip:docx',
+                'docx': 'tip:docx', 
+                'excel': 'tip:xlsx',
+                'xlsx': 'tip:xlsx',
+                'ppt': 'tip:pptx',
+                'pptx': 'tip:pptx'
+            }
+            type_query = type_mappings.get(file_type_filter.lower(), f'tip:{file_type_filter}')
+            enhanced_query = f"{query} {type_query}"
+        
+        return SearchRequest(
+            query=enhanced_query,
+            max_results=max_results,
+            user_id=user_id,
+            sources=[SearchSource.DRIVE],  # Files only
+            folder_filter=folder_filter
+        )
+
+    @staticmethod
+    def _legacy_files(response: SearchResponse) -> List[Dict[str, Any]]:
+        """Convert hybrid Drive results to the legacy GoogleDriveSearchResult format"""
+        legacy_results = []
+        for result in response.results:
+            if result.get('source') == 'drive':
+                legacy_result = {
+                    'file_id': result['id'],
+                    'name': result['name'],
+                    'folder_path': result.get('folder_path', ''),
+                    'full_path': f"{result.get('folder_path', '')}/{result['name']}".strip('/'),
+                    'mime_type': result['mime_type'],
+                    'size': result.get('size', 0),
+                    'modified_time': result['modified_time'],
+                    'web_view_link': result['web_view_link'],
+                    'download_link': result['download_link'],
+                    'file_type': result.get('file_type', 'Unknown File Type'),
+                    'ranking_score': result.get('ranking_score', 0.0)
+                }
+                legacy_results.append(legacy_result)
+        
+        logger.info(f"✅ Hybrid search returned {len(legacy_results)} files")
+        return legacy_results
+
 
 
     def search_emails(self, 
@@ -137,45 +165,65 @@ class SearchAdapter:
                             max_results: int) -> List[Dict[str, Any]]:
         """Execute email search using hybrid orchestrator"""
         try:
-            request = SearchRequest(
-                query=query,
-                max_results=max_results,
-                user_id=user_id,
-                sources=[SearchSource.GMAIL],  # Emails only
-                include_content=True
-            )
-            
-            response = self.orchestrator.search(request)
-            
-            # Convert to legacy format
-            legacy_results = []
-            for result in response.results:
-                if result.get('source') == 'gmail':
-                    # Convert hybrid format to legacy SearchResult format
-                    legacy_result = {
-                        'id': result['id'],
-                        'title': result.get('subject', '(No Subject)'),
-                        'content': result.get('snippet', ''),
-                        'full_content': result.get('content', ''),
-                        'sender': result.get('sender', '(Unknown Sender)'),
-                        'recipient': result.get('recipient', ''),
-                        'date': result['date'],
-                        'url': result.get('url', ''),
-                        'source': 'email',
-                        'file_path': f"Gmail/{result['id']}.eml",
-                        'ranking_score': result.get('ranking_score', 0.0),
-                        'labels': result.get('labels', []),
-                        'has_attachments': result.get('has_attachments', False)
-                    }
-                    legacy_results.append(legacy_result)
+            response = self.orchestrator.search(self._emails_request(query, user_id, max_results))
+            return self._legacy_emails(response)
             
-            logger.info(f"✅ Hybrid email search returned {len(legacy_results)} emails")
-            return legacy_results
+        except Exception as e:
+            logger.error(f"❌ Hybrid email search failed: {e}")
+            return []
+
+    async def search_emails_async(self, 
+                                  query: str, 
+                                  user_id: str, 
+                                  max_results: int = 10) -> List[Dict[str, Any]]:
+        """search_emails() for async callers, awaiting the orchestrator instead of blocking the event loop"""
+        logger.info(f"📧 Hybrid search_emails_async: '{query}'")
+        
+        try:
+            response = await self.orchestrator.search_async(self._emails_request(query, user_id, max_results))
+            return self._legacy_emails(response)
             
         except Exception as e:
             logger.error(f"❌ Hybrid email search failed: {e}")
             return []
 
+    @staticmethod
+    def _emails_request(query: str, user_id: str, max_results: int) -> SearchRequest:
+        """Build the Gmail-only search request for a legacy email search"""
+        return SearchRequest(
+            query=query,
+            max_results=max_results,
+            user_id=user_id,
+            sources=[SearchSource.GMAIL],  # Emails only
+            include_content=True
+        )
+
+    @staticmethod
+    def _legacy_emails(response: SearchResponse) -> List[Dict[str, Any]]:
+        """Convert hybrid Gmail results to the legacy SearchResult format"""
+        legacy_results = []
+        for result in response.results:
+            if result.get('source') == 'gmail':
+                legacy_result = {
+                    'id': result['id'],
+                    'title': result.get('subject', '(No Subject)'),
+                    'content': result.get('snippet', ''),
+                    'full_content': result.get('content', ''),
+                    'sender': result.get('sender', '(Unknown Sender)'),
+                    'recipient': result.get('recipient', ''),
+                    'date': result['date'],
+                    'url': result.get('url', ''),
+                    'source': 'email',
+                    'file_path': f"Gmail/{result['id']}.eml",
+                    'ranking_score': result.get('ranking_score', 0.0),
+                    'labels': result.get('labels', []),
+                    'has_attachments': result.get('has_attachments', False)
+                }
+                legacy_results.append(legacy_result)
+        
+        logger.info(f"✅ Hybrid email search returned {len(legacy_results)} emails")
+        return legacy_results
+
 
 
     def unified_search(self, 
@@ -211,45 +259,77 @@ class SearchAdapter:
                              include_files: bool) -> Dict[str, Any]:
         """Execute unified search using hybrid orchestrator"""
         try:
-            # Determine sources
-            sources = []
-            if include_emails:
-                sources.append(SearchSource.GMAIL)
-            if include_files:
-                sources.append(SearchSource.DRIVE)
-            
-            if not sources:
-                sources = [SearchSource.AUTO]
-            
-            request = SearchRequest(
-                query=query,
-                max_results=max_results,
-                user_id=user_id,
-                sources=sources,
-                include_content=True
-            )
+            request = self._unified_request(query, max_results, user_id, include_emails, include_files)
+            return self._unified_result(self.orchestrator.search(request))
             
-            response = self.orchestrator.search(request)
-            
-            return {
-                "success": True,
-                "results": response.results,
-                "total_results": response.total_results,
-                "sources_searched": response.sources_searched,
-                "query_interpretation": response.query_interpretation,
-                "performance": response.performance_metrics,
-                "hybrid_search": True
-            }
+        except Exception as e:
+            return self._unified_error(e)
+
+    async def unified_search_async(self, 
+                                   query: str, 
+                                   max_results: int = 25, 
+                                   user_id: Optional[str] = None,
+                                   include_emails: bool = True,
+                                   include_files: bool = True) -> Dict[str, Any]:
+        """unified_search() for async callers, awaiting the orchestrator instead of blocking the event loop"""
+        logger.info(f"🔍 Unified hybrid search (async): '{query}'")
+        
+        try:
+            request = self._unified_request(query, max_results, user_id, include_emails, include_files)
+            return self._unified_result(await self.orchestrator.search_async(request))
             
         except Exception as e:
-            logger.error(f"❌ Hybrid unified search failed: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "results": [],
-                "total_results": 0,
-                "hybrid_search": True
-            }
+            return self._unified_error(e)
+
+    @staticmethod
+    def _unified_request(query: str, 
+                         max_results: int, 
+                         user_id: Optional[str],
+                         include_emails: bool, 
+                         include_files: bool) -> SearchRequest:
+        """Build the search request for a unified search"""
+        # Determine sources
+        sources = []
+        if include_emails:
+            sources.append(SearchSource.GMAIL)
+        if include_files:
+            sources.append(SearchSource.DRIVE)
+        
+        if not sources:
+            sources = [SearchSource.AUTO]
+        
+        return SearchRequest(
+            query=query,
+            max_results=max_results,
+            user_id=user_id,
+            sources=sources,
+            include_content=True
+        )
+
+    @staticmethod
+    def _unified_result(response: SearchResponse) -> Dict[str, Any]:
+        """Unified search payload for a search response"""
+        return {
+            "success": True,
+            "results": list(response.results),
+            "total_results": response.total_results,
+            "sources_searched": response.sources_searched,
+            "query_interpretation": response.query_interpretation,
+            "performance": response.performance_metrics,
+            "hybrid_search": True
+        }
+
+    @staticmethod
+    def _unified_error(error: Exception) -> Dict[str, Any]:
+        """Unified search payload for a failed search"""
+        logger.error(f"❌ Hybrid unified search failed: {error}")
+        return {
+            "success": False,
+            "error": str(error),
+            "results": [],
+            "total_results": 0,
+            "hybrid_search": True
+        }
 
 
 
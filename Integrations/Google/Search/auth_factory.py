@@ -20,10 +20,39 @@ from google.oauth2.service_account import Credentials as ServiceAccountCredentia
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+class OrjsonModel(JsonModel):
+    """
+    JsonModel that decodes response bodies with orjson instead of stdlib json
+    Drive list pages with nested owners/parents are dominated by JSON parse cost
+    """
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Keep JsonModel semantics for non-JSON payloads (e.g. media exports)
+            return super().deserialize(content)
+        
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+def _response_model() -> Optional[JsonModel]:
+    """Response model passed to build(); None keeps the googleapiclient default"""
+    return OrjsonModel(data_wrapper=False) if orjson is not None else None
+
+
 class GoogleAuthFactory:
     """
     Centralized factory for Google API authentication
@@ -87,7 +116,7 @@ class GoogleAuthFactory:
             
             try:
                 credentials = self._get_credentials(self.GMAIL_SCOPES, user_id)
-                service = build('gmail', 'v1', credentials=credentials)
+                service = build('gmail', 'v1', credentials=credentials, model=_response_model())
                 self._clients_cache[cache_key] = service
                 logger.info(f"✅ Gmail service created for user: {user_id or 'default'}")
                 return service
@@ -114,7 +143,7 @@ class GoogleAuthFactory:
             
             try:
                 credentials = self._get_credentials(self.DRIVE_SCOPES, user_id)
-                service = build('drive', 'v3', credentials=credentials)
+                service = build('drive', 'v3', credentials=credentials, model=_response_model())
                 self._clients_cache[cache_key] = service
                 logger.info(f"✅ Drive service created for user: {user_id or 'default'}")
                 return service
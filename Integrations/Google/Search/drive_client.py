@@ -9,6 +9,7 @@ import os
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from dataclasses import dataclass
+from functools import cached_property
 
 from tenacity import retry, stop_after_attempt, wait_exponential_jitter
 from googleapiclient.errors import HttpError
@@ -19,6 +20,18 @@ from .query_interpreter import SearchSpec
 logger = logging.getLogger(__name__)
 
 
+def _parse_drive_datetime(datetime_str: Optional[str]) -> datetime:
+    """Parse Drive API datetime string"""
+    if not datetime_str:
+        return datetime.now()
+    
+    try:
+        # Drive API returns RFC 3339 format
+        return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+    except (ValueError, AttributeError):
+        return datetime.now()
+
+
 @dataclass 
 class DriveFile:
     """Google Drive file result"""
@@ -26,8 +39,8 @@ class DriveFile:
     name: str
     mime_type: str
     size: Optional[int]
-    modified_time: datetime
-    created_time: datetime
+    modified_time_str: str
+    created_time_str: str
     owners: List[str]
     parents: List[str]
     folder_path: str
@@ -36,14 +49,24 @@ class DriveFile:
     thumbnail_link: Optional[str] = None
     description: Optional[str] = None
     
+    @cached_property
+    def modified_time(self) -> datetime:
+        """Modification time, parsed lazily from the raw RFC 3339 string"""
+        return _parse_drive_datetime(self.modified_time_str)
+    
+    @cached_property
+    def created_time(self) -> datetime:
+        """Creation time, parsed lazily from the raw RFC 3339 string"""
+        return _parse_drive_datetime(self.created_time_str)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "name": self.name,
             "mime_type": self.mime_type,
             "size": self.size,
-            "modified_time": self.modified_time.isoformat(),
-            "created_time": self.created_time.isoformat(),
+            "modified_time": self.modified_time_str or self.modified_time.isoformat(),
+            "created_time": self.created_time_str or self.created_time.isoformat(),
             "owners": self.owners,
             "parents": self.parents,
             "folder_path": self.folder_path,
@@ -270,10 +293,6 @@ class DriveClient:
     def _parse_file_data(self, file_data: Dict[str, Any]) -> Optional[DriveFile]:
         """Parse Drive API file data into DriveFile object"""
         try:
-            # Parse dates
-            modified_time = self._parse_drive_datetime(file_data.get('modifiedTime'))
-            created_time = self._parse_drive_datetime(file_data.get('createdTime'))
-            
             # Extract owners
             owners = []
             for owner in file_data.get('owners', []):
@@ -292,8 +311,8 @@ class DriveClient:
                 name=file_data['name'],
                 mime_type=file_data.get('mimeType', ''),
                 size=int(file_data['size']) if file_data.get('size') else None,
-                modified_time=modified_time,
-                created_time=created_time,
+                modified_time_str=file_data.get('modifiedTime', ''),
+                created_time_str=file_data.get('createdTime', ''),
                 owners=owners,
                 parents=parents,
                 folder_path=folder_path,
@@ -307,17 +326,6 @@ class DriveClient:
             logger.error(f"❌ Failed to parse Drive file {file_data.get('id', 'unknown')}: {e}")
             return None
 
-    def _parse_drive_datetime(self, datetime_str: Optional[str]) -> datetime:
-        """Parse Drive API datetime string"""
-        if not datetime_str:
-            return datetime.now()
-        
-        try:
-            # Drive API returns RFC 3339 format
-            return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
-        except (ValueError, AttributeError):
-            return datetime.now()
-
     def _get_folder_path(self, folder_id: str) -> str:
         """Get folder path by ID (with caching)"""
         if folder_id in self._folder_cache:
@@ -11,6 +11,8 @@ from datetime import datetime
 import base64
 from email.mime.text import MIMEText
 from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from functools import cached_property
 
 from tenacity import retry, stop_after_attempt, wait_exponential_jitter
 from googleapiclient.errors import HttpError
@@ -20,6 +22,20 @@ from .query_interpreter import SearchSpec
 
 logger = logging.getLogger(__name__)
 
+# HTML-to-text for multipart/alternative mails without a usable text/plain part.
+# lxml's C parser is preferred; BeautifulSoup is the fallback when lxml is missing.
+try:
+    import lxml.etree
+    import lxml.html
+    _HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8', recover=True)
+except ImportError:
+    lxml = None
+    _HTML_PARSER = None
+    try:
+        from bs4 import BeautifulSoup
+    except ImportError:
+        BeautifulSoup = None
+
 
 @dataclass
 class GmailMessage:
@@ -29,13 +45,21 @@ class GmailMessage:
     subject: str
     sender: str
     recipient: str
-    date: datetime
+    date_str: str
     snippet: str
     labels: List[str]
     has_attachments: bool
     content: str = ""
     url: str = ""
     
+    @cached_property
+    def date(self) -> datetime:
+        """Message date, parsed lazily from the raw RFC 2822 header"""
+        try:
+            return parsedate_to_datetime(self.date_str)
+        except (ValueError, TypeError):
+            return datetime.now()
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -43,7 +67,8 @@ class GmailMessage:
             "subject": self.subject,
             "sender": self.sender,
             "recipient": self.recipient,
-            "date": self.date.isoformat(),
+            # Raw header, as the API returned it; serializing shouldn't force the lazy parse
+            "date": self.date_str or self.date.isoformat(),
             "snippet": self.snippet,
             "labels": self.labels,
             "has_attachments": self.has_attachments,
@@ -64,6 +89,8 @@ class GmailClient:
         self.auth_factory = get_auth_factory()
         self._service = None
         self.max_results_per_page = int(os.getenv('GMAIL_PAGE_SIZE', '50'))
+        # Gmail batch endpoint accepts up to 100 calls; Google recommends <= 50
+        self.batch_size = min(int(os.getenv('GMAIL_BATCH_SIZE', '50')), 100)
         
     @property
     def service(self):
@@ -171,19 +198,55 @@ class GmailClient:
     def _fetch_message_batch(self, 
                             message_ids: List[str], 
                             include_content: bool = False) -> List[GmailMessage]:
-        """Fetch batch of messages with parallel processing"""
-        messages = []
+        """Fetch batch of messages through Gmail batch HTTP requests"""
+        fetched: Dict[str, GmailMessage] = {}
+        failed_ids: List[str] = []
         
-        for msg_id in message_ids:
+        def handle_response(request_id, response, exception):
+            if exception is not None:
+                failed_ids.append(request_id)
+                return
+            message = self._parse_message_data(response, include_content)
+            if message:
+                fetched[request_id] = message
+        
+        for start in range(0, len(message_ids), self.batch_size):
+            chunk_ids = message_ids[start:start + self.batch_size]
+            try:
+                batch = self.service.new_batch_http_request(callback=handle_response)
+                for msg_id in chunk_ids:
+                    batch.add(self._build_get_request(msg_id, include_content), request_id=msg_id)
+                batch.execute()
+            except Exception as e:
+                logger.warning(f"⚠️ Gmail batch fetch failed, falling back to single requests: {e}")
+                failed_ids.extend(msg_id for msg_id in chunk_ids if msg_id not in fetched)
+        
+        # Retry individual failures (e.g. per-part 429s) with the single-message path
+        for msg_id in dict.fromkeys(failed_ids):
+            if msg_id in fetched:
+                continue
             try:
                 message = self._fetch_single_message(msg_id, include_content)
                 if message:
-                    messages.append(message)
+                    fetched[msg_id] = message
             except Exception as e:
                 logger.warning(f"⚠️ Failed to fetch message {msg_id}: {e}")
                 continue
         
-        return messages
+        # Preserve the API's result ordering
+        return [fetched[msg_id] for msg_id in message_ids if msg_id in fetched]
+
+    def _build_get_request(self, message_id: str, include_content: bool = False):
+        """Build (without executing) a messages.get request"""
+        format_type = 'full' if include_content else 'metadata'
+        metadata_headers = ['Message-ID', 'Subject', 'From', 'To', 'Date']
+        
+        return self.service.users().messages().get(
+            userId='me',
+            id=message_id,
+            format=format_type,
+            metadataHeaders=metadata_headers
+        )
 
     @retry(
         stop=stop_after_attempt(2),
@@ -194,15 +257,7 @@ class GmailClient:
                              message_id: str, 
                              include_content: bool = False) -> Optional[GmailMessage]:
         """Fetch single message with metadata"""
-        format_type = 'full' if include_content else 'metadata'
-        metadata_headers = ['Message-ID', 'Subject', 'From', 'To', 'Date']
-        
-        msg_data = self.service.users().messages().get(
-            userId='me',
-            id=message_id,
-            format=format_type,
-            metadataHeaders=metadata_headers
-        ).execute()
+        msg_data = self._build_get_request(message_id, include_content).execute()
         
         return self._parse_message_data(msg_data, include_content)
 
@@ -219,15 +274,6 @@ class GmailClient:
             sender = headers.get('from', '(Unknown Sender)')
             recipient = headers.get('to', '(Unknown Recipient)')
             
-            # Parse date
-            date_str = headers.get('date', '')
-            try:
-                # Gmail dates are in RFC 2822 format
-                from email.utils import parsedate_to_datetime
-                date = parsedate_to_datetime(date_str)
-            except (ValueError, TypeError):
-                date = datetime.now()
-            
             # Extract snippet and labels
             snippet = msg_data.get('snippet', '')
             labels = msg_data.get('labelIds', [])
@@ -252,7 +298,7 @@ class GmailClient:
                 subject=subject,
                 sender=sender,
                 recipient=recipient,
-                date=date,
+                date_str=headers.get('date', ''),
                 snippet=snippet,
                 labels=labels,
                 has_attachments=has_attachments,
@@ -277,23 +323,58 @@ class GmailClient:
         return parts
 
     def _extract_message_content(self, payload: Dict[str, Any]) -> str:
-        """Extract text content from message payload"""
-        content_parts = []
+        """Extract text content from message payload (text/plain, falling back to text/html)"""
+        plain_parts = []
+        html_parts = []
         
         for part in self._get_message_parts(payload):
             mime_type = part.get('mimeType', '')
             
             if mime_type == 'text/plain':
-                body_data = part.get('body', {}).get('data')
-                if body_data:
-                    try:
-                        # Decode base64 URL-safe content
-                        decoded = base64.urlsafe_b64decode(body_data + '===').decode('utf-8')
-                        content_parts.append(decoded)
-                    except (UnicodeDecodeError, ValueError):
-                        continue
+                decoded = self._decode_part_body(part)
+                if decoded:
+                    plain_parts.append(decoded)
+            elif mime_type == 'text/html' and not plain_parts:
+                decoded = self._decode_part_body(part)
+                if decoded:
+                    html_parts.append(decoded)
+        
+        if plain_parts:
+            return '\n\n'.join(plain_parts)
+        
+        # No usable plain text part - strip tags from the HTML alternative
+        return '\n\n'.join(
+            text for text in (self._html_to_text(html) for html in html_parts) if text
+        )
+
+    def _decode_part_body(self, part: Dict[str, Any]) -> str:
+        """Decode base64 URL-safe body data of a single message part"""
+        body_data = part.get('body', {}).get('data')
+        if not body_data:
+            return ""
+        
+        try:
+            return base64.urlsafe_b64decode(body_data + '===').decode('utf-8')
+        except (UnicodeDecodeError, ValueError):
+            return ""
+
+    def _html_to_text(self, html: str) -> str:
+        """Strip HTML tags and return visible text"""
+        try:
+            if lxml is not None:
+                root = lxml.html.fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+                # CSS and scripts are element text too; drop them (keeping their tails) before extracting
+                lxml.etree.strip_elements(root, 'style', 'script', with_tail=False)
+                return root.text_content().strip()
+            if BeautifulSoup is not None:
+                soup = BeautifulSoup(html, 'html.parser')
+                for element in soup(['style', 'script']):
+                    element.decompose()
+                return soup.get_text(separator=' ').strip()
+        except Exception as e:
+            logger.debug(f"📧 Failed to strip HTML content: {e}")
         
-        return '\n\n'.join(content_parts)
+        return ""
 
     def build_query_from_spec(self, spec: SearchSpec) -> str:
         """
@@ -3,12 +3,21 @@ Hybrid Search Orchestrator
 Coordinates Gmail and Drive search with bilingual support and unified results
 """
 
+import asyncio
+import copy
 import logging
+import threading
 import time
 import os
-from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from secrets import token_hex
+from typing import List, Dict, Any, Optional, Union, Iterator, Tuple, Sequence, Callable
+from dataclasses import dataclass, replace
+from collections import abc
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+import numpy as np
+from cachetools import LRUCache, TTLCache
 
 from .query_interpreter import QueryInterpreter, SearchSpec, SearchSource
 from .gmail_client import GmailClient, GmailMessage
@@ -17,8 +26,129 @@ from .reranker import HybridReranker, RankingResult, create_reranker
 
 logger = logging.getLogger(__name__)
 
+# Environment configuration, parsed once at import
+_GMAIL_QPS_BUDGET = int(os.getenv('GMAIL_QPS_BUDGET', '10'))
+_DRIVE_QPS_BUDGET = int(os.getenv('DRIVE_QPS_BUDGET', '10'))
+# Enough workers to use the whole Gmail + Drive concurrency budget; more would only queue on the semaphores
+_SEARCH_MAX_WORKERS = int(os.getenv('SEARCH_MAX_WORKERS', str(_GMAIL_QPS_BUDGET + _DRIVE_QPS_BUDGET)))
+_SEARCH_MAX_RESULTS = int(os.getenv('SEARCH_MAX_RESULTS', '25'))
+_SEARCH_PARALLEL = os.getenv('SEARCH_PARALLEL', 'true').lower() == 'true'
+_MIN_SCORE_THRESHOLD = float(os.getenv('MIN_SCORE_THRESHOLD', '0.05'))
+_SEARCH_CACHE_SIZE = int(os.getenv('SEARCH_CACHE_SIZE', '256'))
+_SEARCH_CACHE_TTL = float(os.getenv('SEARCH_CACHE_TTL', '60'))
+
+# Process-wide caps on concurrent Gmail/Drive searches, keeps multi-user load under quota
+_GMAIL_SEM = threading.BoundedSemaphore(_GMAIL_QPS_BUDGET)
+_DRIVE_SEM = threading.BoundedSemaphore(_DRIVE_QPS_BUDGET)
+
+# Each source is asked for more than the final K so rerank + diversify pick from a wider pool
+_OVERSEARCH_FACTOR = 2
+_SOURCE_RESULT_CAP = 100
+
+# Circuit breakers kept for the most recently active (source, user) pairs
+_BREAKER_CACHE_SIZE = 1024
+
+# Shared interpreter - interpret_query memoizes repeat queries internally
+_query_interpreter = QueryInterpreter()
+
+
+# Exact-match operators; an operator-only query using them is a literal lookup
+_LITERAL_OPERATORS = ('subject', 'from', 'to', 'name', 'fullText')
+
+
+def _is_literal(spec: SearchSpec) -> bool:
+    """
+    Literal lookup: exact operators and no free text, so every lexical score
+    is zero and reranking would only reproduce the API's recency ordering
+    """
+    return not spec.free_text_terms and any(op in spec.operators for op in _LITERAL_OPERATORS)
+
+
+class _CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one search source
+    Opens after fail_threshold failures in a row and lets a single probe through after reset_timeout
+    """
+    
+    def __init__(self, fail_threshold: int = 5, reset_timeout: float = 30.0):
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    def is_open(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+                return True
+            # Half-open: this caller is the probe, everyone else stays blocked until it reports
+            self._probing = True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            # A failed probe re-opens for another full reset_timeout
+            if self._probing or self._failures >= self.fail_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class _SingleFlight:
+    """
+    Request coalescing: concurrent calls with the same key share one in-flight execution
+    The first caller runs the function, the others wait on its Future
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: Tuple, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight[key] = Future()
+        
+        if not is_leader:
+            return future.result()
+        
+        try:
+            result = fn()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            # Waiters must be released even on KeyboardInterrupt/SystemExit in the leader
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+
+@lru_cache(maxsize=256)
+def _get_gmail_client(user_id: Optional[str]) -> GmailClient:
+    """Per-user GmailClient, reused so the built service and its HTTP pool stay warm"""
+    return GmailClient(user_id)
 
-@dataclass
+
+@lru_cache(maxsize=256)
+def _get_drive_client(user_id: Optional[str]) -> DriveClient:
+    """Per-user DriveClient, reused so the built service and folder path cache stay warm"""
+    return DriveClient(user_id)
+
+
+@dataclass(slots=True)
 class SearchRequest:
     """Unified search request"""
     query: str
@@ -29,10 +159,32 @@ class SearchRequest:
     folder_filter: Optional[str] = None
 
 
-@dataclass
+class LazyResultDicts(abc.Sequence):
+    """
+    Read-only view over ranked results that builds each result dict on access
+    Iterating streams one dict at a time; call list() where a real list is required
+    """
+    __slots__ = ('_ranked',)
+    
+    def __init__(self, ranked_results: List[RankingResult]):
+        self._ranked = ranked_results
+    
+    def __len__(self) -> int:
+        return len(self._ranked)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (result.to_dict() for result in self._ranked)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [result.to_dict() for result in self._ranked[index]]
+        return self._ranked[index].to_dict()
+
+
+@dataclass(slots=True)
 class SearchResponse:
     """Unified search response"""
-    results: List[Dict[str, Any]]
+    results: Sequence[Dict[str, Any]]
     total_results: int
     sources_searched: List[str]
     query_interpretation: Dict[str, Any]
@@ -47,7 +199,7 @@ class HybridSearchOrchestrator:
     """
     
     def __init__(self, 
-                 max_workers: int = 2,
+                 max_workers: int = _SEARCH_MAX_WORKERS,
                  default_max_results: int = 25,
                  enable_parallel_search: bool = True):
         """
@@ -63,9 +215,35 @@ class HybridSearchOrchestrator:
         self.enable_parallel_search = enable_parallel_search
         
         # Initialize components
-        self.query_interpreter = QueryInterpreter()
+        self.query_interpreter = _query_interpreter
         self.reranker = create_reranker()
         
+        # Precomputed source dispatch and env-derived filter settings
+        self._source_map = {
+            SearchSource.AUTO: [SearchSource.GMAIL, SearchSource.DRIVE],
+            SearchSource.GMAIL: [SearchSource.GMAIL],
+            SearchSource.DRIVE: [SearchSource.DRIVE]
+        }
+        self._min_score_threshold = _MIN_SCORE_THRESHOLD
+        
+        # Circuit breakers per (source, user) - credentials and quota are per user;
+        # LRU-bounded so users who stop searching don't accumulate
+        self._breakers: LRUCache = LRUCache(maxsize=_BREAKER_CACHE_SIZE)
+        self._breakers_lock = threading.Lock()
+        
+        # Coalesces identical concurrent source searches (same user, same query)
+        self._inflight = _SingleFlight()
+        
+        # Long-lived worker pool for parallel source searches
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search")
+        
+        # Final responses for identical back-to-back requests (pagination, UI refresh)
+        self._result_cache = TTLCache(
+            maxsize=_SEARCH_CACHE_SIZE,
+            ttl=_SEARCH_CACHE_TTL
+        )
+        self._result_cache_lock = threading.RLock()
+        
         # Performance tracking
         self._search_count = 0
         self._total_search_time = 0.0
@@ -83,30 +261,46 @@ class HybridSearchOrchestrator:
         Returns:
             SearchResponse with unified, ranked results
         """
-        import uuid
-        request_id = str(uuid.uuid4())[:8]
+        request_id = token_hex(4)
         start_time = time.time()
         
-        logger.info(f"🔍 [{request_id}] Search request: '{request.query}' "
-                   f"(max: {request.max_results}, user: {request.user_id})")
+        logger.info("🔍 [%s] Search request: '%s' (max: %d, user: %s)",
+                   request_id, request.query, request.max_results, request.user_id)
+        
+        cache_key = self._result_cache_key(request)
+        with self._result_cache_lock:
+            cached_response = self._result_cache.get(cache_key)
+        if cached_response is not None:
+            logger.info("⚡ [%s] Serving cached response from [%s]", request_id, cached_response.request_id)
+            return self._copy_cached_response(cached_response, request_id)
         
         try:
             # Step 1: Interpret query
-            spec = self.query_interpreter.interpret_query(request.query)
-            logger.info(f"🧠 [{request_id}] Query interpreted: source={spec.source.value}, "
-                       f"language={spec.language}, operators={len(spec.operators)}")
+            spec = _query_interpreter.interpret_query(request.query)
+            logger.info("🧠 [%s] Query interpreted: source=%s, language=%s, operators=%d",
+                       request_id, spec.source.value, spec.language, len(spec.operators))
             
             # Step 2: Determine sources to search
             sources_to_search = self._determine_sources(spec, request.sources)
             
-            # Step 3: Execute searches
-            gmail_results, drive_results = self._execute_searches(
-                spec, sources_to_search, request, request_id
-            )
+            # Step 3: Execute searches, scanning each source for query terms while the slower one is in flight
+            source_batches = []
+            degraded = False
+            for _, results in self._execute_searches(spec, sources_to_search, request, request_id):
+                if results is None:
+                    degraded = True  # Source failed or its circuit is open
+                    continue
+                source_batches.append((results, self._count_terms(results, spec, sources_to_search)))
             
-            # Step 4: Combine and rerank results
-            combined_results = gmail_results + drive_results
-            ranked_results = self._rerank_results(combined_results, spec, request_id)
+            # Step 4: Rerank every source with IDF weights from the combined results, then merge
+            idf = self.reranker.global_idf([counts for _, counts in source_batches if counts is not None])
+            ranked_batches = [
+                self._rerank_results(results, spec, sources_to_search, request_id,
+                                     top_k=self._max_per_source(request), term_counts=counts, idf=idf)
+                for results, counts in source_batches
+            ]
+            ranked_results = self.reranker.merge_rankings(ranked_batches)
+            self._log_ranking_stats(ranked_results, request_id)
             
             # Step 5: Apply final filtering and limits
             final_results = self._apply_final_filters(ranked_results, request)
@@ -120,13 +314,18 @@ class HybridSearchOrchestrator:
             # Update performance metrics
             self._update_metrics(duration)
             
-            logger.info(f"✅ [{request_id}] Search completed: {len(final_results)} results in {duration:.2f}s")
+            # Partial results from a failed source are not worth replaying
+            if not degraded:
+                with self._result_cache_lock:
+                    self._result_cache[cache_key] = response
+            
+            logger.info("✅ [%s] Search completed: %d results in %.2fs", request_id, len(final_results), duration)
             
             return response
             
         except Exception as e:
             duration = time.time() - start_time
-            logger.error(f"❌ [{request_id}] Search failed after {duration:.2f}s: {e}")
+            logger.error("❌ [%s] Search failed after %.2fs: %s", request_id, duration, e)
             
             # Return error response
             return SearchResponse(
@@ -138,157 +337,273 @@ class HybridSearchOrchestrator:
                 request_id=request_id
             )
 
+    async def search_async(self, request: SearchRequest) -> SearchResponse:
+        """
+        Execute unified search without blocking the running event loop
+        
+        The Gmail/Drive clients are built on the synchronous googleapiclient,
+        so the pipeline runs in a worker thread and async callers just await it.
+        
+        Args:
+            request: SearchRequest with query and parameters
+            
+        Returns:
+            SearchResponse with unified, ranked results
+        """
+        return await asyncio.to_thread(self.search, request)
+
+    def _result_cache_key(self, request: SearchRequest) -> tuple:
+        """Build result cache key from every request field that affects the response"""
+        sources = tuple(s.value for s in request.sources) if request.sources else ()
+        return (
+            request.user_id,
+            request.query,
+            sources,
+            request.max_results,
+            request.include_content,
+            request.folder_filter
+        )
+
+    @staticmethod
+    def _copy_cached_response(cached_response: SearchResponse, request_id: str) -> SearchResponse:
+        """
+        Per-request copy of a cached response under the new request id
+        
+        The interpretation and metrics dicts are copied so callers can't mutate the cached entry;
+        the lazy results view is read-only and builds fresh dicts, so it is shared.
+        """
+        performance_metrics = dict(cached_response.performance_metrics)
+        performance_metrics.update(request_id=request_id, cached_from=cached_response.request_id)
+        return replace(
+            cached_response,
+            query_interpretation=copy.deepcopy(cached_response.query_interpretation),
+            performance_metrics=performance_metrics,
+            request_id=request_id
+        )
+
+    def clear_cache(self, user_id: Optional[str] = None):
+        """
+        Drop cached search responses
+        
+        Args:
+            user_id: Only drop responses for this user; all users if omitted
+        """
+        with self._result_cache_lock:
+            if user_id is None:
+                self._result_cache.clear()
+            else:
+                for key in [k for k in self._result_cache.keys() if k[0] == user_id]:
+                    self._result_cache.pop(key, None)
+        
+        logger.info(f"🧹 Search result cache cleared for: {user_id or 'all users'}")
+
     def _determine_sources(self, 
                           spec: SearchSpec, 
                           requested_sources: Optional[List[SearchSource]]) -> List[SearchSource]:
         """Determine which sources to search based on query and request"""
-        if requested_sources:
-            return requested_sources
-        
-        if spec.source == SearchSource.AUTO:
-            # Search both sources for auto-detected queries
-            return [SearchSource.GMAIL, SearchSource.DRIVE]
-        else:
-            return [spec.source]
+        return requested_sources or self._source_map[spec.source]
 
     def _execute_searches(self, 
                          spec: SearchSpec, 
                          sources: List[SearchSource], 
                          request: SearchRequest,
-                         request_id: str) -> tuple[List[GmailMessage], List[DriveFile]]:
-        """Execute searches across specified sources"""
-        gmail_results = []
-        drive_results = []
-        
+                         request_id: str) -> Iterator[Tuple[SearchSource, Optional[List[Union[GmailMessage, DriveFile]]]]]:
+        """
+        Execute searches across specified sources, yielding each source's results as it completes
+        A source that failed or was skipped by its circuit breaker yields None
+        """
         if self.enable_parallel_search and len(sources) > 1:
-            # Parallel execution
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                future_to_source = {}
-                
-                if SearchSource.GMAIL in sources:
-                    future_to_source[executor.submit(
-                        self._search_gmail, spec, request, request_id
-                    )] = SearchSource.GMAIL
-                
-                if SearchSource.DRIVE in sources:
-                    future_to_source[executor.submit(
-                        self._search_drive, spec, request, request_id
-                    )] = SearchSource.DRIVE
+            # Parallel execution on the persistent pool
+            future_to_source = {}
+            
+            if SearchSource.GMAIL in sources:
+                future_to_source[self._executor.submit(
+                    self._search_gmail, spec, request, request_id
+                )] = SearchSource.GMAIL
+            
+            if SearchSource.DRIVE in sources:
+                future_to_source[self._executor.submit(
+                    self._search_drive, spec, request, request_id
+                )] = SearchSource.DRIVE
+            
+            # Hand results over in completion order
+            for future in as_completed(future_to_source):
+                source = future_to_source[future]
+                exc = future.exception()
+                if exc is not None:
+                    logger.error("❌ [%s] %s search failed: %s", request_id, source.value, exc)
+                    yield source, None
+                    continue
                 
-                # Collect results
-                for future in as_completed(future_to_source):
-                    source = future_to_source[future]
-                    try:
-                        results = future.result()
-                        if source == SearchSource.GMAIL:
-                            gmail_results = results
-                        else:
-                            drive_results = results
-                    except Exception as e:
-                        logger.error(f"❌ [{request_id}] {source.value} search failed: {e}")
+                yield source, future.result()
         else:
             # Sequential execution
             if SearchSource.GMAIL in sources:
-                gmail_results = self._search_gmail(spec, request, request_id)
+                yield SearchSource.GMAIL, self._search_gmail(spec, request, request_id)
             
             if SearchSource.DRIVE in sources:
-                drive_results = self._search_drive(spec, request, request_id)
-        
-        return gmail_results, drive_results
+                yield SearchSource.DRIVE, self._search_drive(spec, request, request_id)
+
+    def _get_breaker(self, source: SearchSource, user_id: Optional[str]) -> _CircuitBreaker:
+        """Get (or create) the circuit breaker for a source/user pair"""
+        key = (source, user_id)
+        with self._breakers_lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = _CircuitBreaker()
+            return breaker
+
+    def _source_max_results(self, request: SearchRequest) -> int:
+        """Per-source fetch size (oversearch); final filters trim back to request.max_results"""
+        return min(request.max_results * _OVERSEARCH_FACTOR, _SOURCE_RESULT_CAP)
 
     def _search_gmail(self, 
                      spec: SearchSpec, 
                      request: SearchRequest, 
-                     request_id: str) -> List[GmailMessage]:
-        """Execute Gmail search"""
+                     request_id: str) -> Optional[List[GmailMessage]]:
+        """Execute Gmail search; None when the search failed or the source's circuit is open"""
+        breaker = self._get_breaker(SearchSource.GMAIL, request.user_id)
+        if breaker.is_open():
+            logger.warning("⚡ [%s] Gmail circuit open for user %s, skipping", request_id, request.user_id)
+            return None
+        
         try:
-            gmail_client = GmailClient(request.user_id)
+            gmail_client = _get_gmail_client(request.user_id)
             query = gmail_client.build_query_from_spec(spec)
             
-            logger.info(f"📧 [{request_id}] Gmail query: '{query}'")
+            logger.info("📧 [%s] Gmail query: '%s'", request_id, query)
             
-            results = gmail_client.search_messages(
-                query=query,
-                max_results=request.max_results,
-                include_content=request.include_content
-            )
+            max_results = self._source_max_results(request)
+            
+            def run_search():
+                with _GMAIL_SEM:
+                    return gmail_client.search_messages(
+                        query=query,
+                        max_results=max_results,
+                        include_content=request.include_content
+                    )
             
-            logger.info(f"📧 [{request_id}] Gmail results: {len(results)} messages")
+            flight_key = (SearchSource.GMAIL, request.user_id, query, max_results, request.include_content)
+            results = self._inflight.do(flight_key, run_search)
+            
+            logger.info("📧 [%s] Gmail results: %d messages", request_id, len(results))
+            breaker.record_success()
             return results
             
         except Exception as e:
-            logger.error(f"❌ [{request_id}] Gmail search error: {e}")
-            return []
+            logger.error("❌ [%s] Gmail search error: %s", request_id, e)
+            breaker.record_failure()
+            return None
 
     def _search_drive(self, 
                      spec: SearchSpec, 
                      request: SearchRequest, 
-                     request_id: str) -> List[DriveFile]:
-        """Execute Drive search"""
+                     request_id: str) -> Optional[List[DriveFile]]:
+        """Execute Drive search; None when the search failed or the source's circuit is open"""
+        breaker = self._get_breaker(SearchSource.DRIVE, request.user_id)
+        if breaker.is_open():
+            logger.warning("⚡ [%s] Drive circuit open for user %s, skipping", request_id, request.user_id)
+            return None
+        
         try:
-            drive_client = DriveClient(request.user_id)
+            drive_client = _get_drive_client(request.user_id)
             query = drive_client.build_query_from_spec(spec)
             
-            logger.info(f"📁 [{request_id}] Drive query: '{query}'")
+            logger.info("📁 [%s] Drive query: '%s'", request_id, query)
             
-            results = drive_client.search_files(
-                query=query,
-                max_results=request.max_results,
-                folder_filter=request.folder_filter
-            )
+            max_results = self._source_max_results(request)
+            
+            def run_search():
+                with _DRIVE_SEM:
+                    return drive_client.search_files(
+                        query=query,
+                        max_results=max_results,
+                        folder_filter=request.folder_filter
+                    )
+            
+            flight_key = (SearchSource.DRIVE, request.user_id, query, max_results, request.folder_filter)
+            results = self._inflight.do(flight_key, run_search)
             
-            logger.info(f"📁 [{request_id}] Drive results: {len(results)} files")
+            logger.info("📁 [%s] Drive results: %d files", request_id, len(results))
+            breaker.record_success()
             return results
             
         except Exception as e:
-            logger.error(f"❌ [{request_id}] Drive search error: {e}")
-            return []
+            logger.error("❌ [%s] Drive search error: %s", request_id, e)
+            breaker.record_failure()
+            return None
+
+    def _count_terms(self, 
+                     results: List[Union[GmailMessage, DriveFile]], 
+                     spec: SearchSpec, 
+                     sources: List[SearchSource]) -> Optional[np.ndarray]:
+        """Query term counts for one source's results; None when the batch won't be reranked"""
+        if not results or (len(sources) == 1 and _is_literal(spec)):
+            return None
+        return self.reranker.count_terms(results, spec.free_text_terms, spec.language)
 
     def _rerank_results(self, 
                        results: List[Union[GmailMessage, DriveFile]], 
                        spec: SearchSpec, 
-                       request_id: str) -> List[RankingResult]:
-        """Rerank combined results using hybrid scoring"""
+                       sources: List[SearchSource],
+                       request_id: str,
+                       top_k: Optional[int] = None,
+                       term_counts: Optional[np.ndarray] = None,
+                       idf: Optional[np.ndarray] = None) -> List[RankingResult]:
+        """
+        Rerank one source's results using hybrid scoring
+        
+        top_k bounds the batch to what the final per-source filter can keep anyway;
+        idf comes from every searched source so the batches' scores are comparable
+        """
         if not results:
             return []
         
-        logger.info(f"🎯 [{request_id}] Reranking {len(results)} combined results")
+        # Single-source literal lookups keep the API's (recency) order
+        if len(sources) == 1 and _is_literal(spec):
+            logger.info("🎯 [%s] Literal %s lookup, skipping rerank", request_id, sources[0].value)
+            return [RankingResult.from_native(result) for result in results[:top_k]]
+        
+        logger.info("🎯 [%s] Reranking %d results", request_id, len(results))
         
-        # Rerank using query terms and language
-        ranked_results = self.reranker.rerank_results(
+        # Shared IDF keeps per-source scores on one scale, so batches merge directly
+        return self.reranker.partial_rerank(
             results=results,
             query_terms=spec.free_text_terms,
-            language=spec.language
+            language=spec.language,
+            top_k=top_k,
+            term_counts=term_counts,
+            idf=idf
         )
+
+    @staticmethod
+    def _max_per_source(request: SearchRequest) -> int:
+        """Per-source cap applied by the final filter"""
+        return max(1, request.max_results // 2)
+
+    def _log_ranking_stats(self, ranked_results: List[RankingResult], request_id: str):
+        """Log score statistics for the merged ranking (skipped entirely when INFO is off)"""
+        if not ranked_results or not logger.isEnabledFor(logging.INFO):
+            return
         
-        # Log score statistics
         stats = self.reranker.get_score_statistics(ranked_results)
-        logger.info(f"🎯 [{request_id}] Ranking stats: "
-                   f"range {stats['score_range']['min']:.3f}-{stats['score_range']['max']:.3f}, "
-                   f"mean {stats['score_range']['mean']:.3f}")
-        
-        return ranked_results
+        logger.info("🎯 [%s] Ranking stats: range %.3f-%.3f, mean %.3f",
+                   request_id,
+                   stats['score_range']['min'],
+                   stats['score_range']['max'],
+                   stats['score_range']['mean'])
 
     def _apply_final_filters(self, 
                            ranked_results: List[RankingResult], 
                            request: SearchRequest) -> List[RankingResult]:
         """Apply final filtering and result limits"""
-        # Filter by minimum score threshold
-        min_score_threshold = float(os.getenv('MIN_SCORE_THRESHOLD', '0.05'))
-        filtered_results = self.reranker.filter_by_score_threshold(
-            ranked_results, min_score_threshold
+        # Threshold + per-source diversification + limit in one pass
+        return self.reranker.fused_filter(
+            ranked_results,
+            min_score=self._min_score_threshold,
+            max_per_source=self._max_per_source(request),
+            limit=request.max_results
         )
-        
-        # Apply diversification if needed
-        max_per_source = max(1, request.max_results // 2)
-        diversified_results = self.reranker.diversify_results(
-            filtered_results, max_per_source
-        )
-        
-        # Apply final limit
-        final_results = diversified_results[:request.max_results]
-        
-        return final_results
 
     def _build_response(self, 
                        final_results: List[RankingResult], 
@@ -297,8 +612,8 @@ class HybridSearchOrchestrator:
                        duration: float, 
                        request_id: str) -> SearchResponse:
         """Build final search response"""
-        # Convert results to dictionaries
-        result_dicts = [result.to_dict() for result in final_results]
+        # Result dicts are built lazily when the response is consumed
+        result_dicts = LazyResultDicts(final_results)
         
         # Build query interpretation summary
         query_interpretation = {
@@ -306,8 +621,9 @@ class HybridSearchOrchestrator:
             "processed_query": spec.query_text,
             "language": spec.language,
             "detected_source": spec.source.value,
-            "operators": spec.operators,
-            "free_text_terms": spec.free_text_terms
+            # Copies, the spec is shared with the interpreter's cache
+            "operators": dict(spec.operators),
+            "free_text_terms": list(spec.free_text_terms)
         }
         
         # Build performance metrics
@@ -333,6 +649,11 @@ class HybridSearchOrchestrator:
         self._search_count += 1
         self._total_search_time += duration
 
+    def close(self):
+        """Release the search worker pool"""
+        self._executor.shutdown(wait=False)
+        logger.info("🛑 HybridSearchOrchestrator worker pool shut down")
+
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get orchestrator performance statistics"""
         avg_time = self._total_search_time / self._search_count if self._search_count > 0 else 0
@@ -357,14 +678,14 @@ class HybridSearchOrchestrator:
         
         try:
             # Test Gmail
-            gmail_client = GmailClient(user_id)
+            gmail_client = _get_gmail_client(user_id)
             results["gmail"] = gmail_client.test_connectivity()
         except Exception as e:
             logger.error(f"❌ Gmail connectivity test failed: {e}")
         
         try:
             # Test Drive
-            drive_client = DriveClient(user_id)
+            drive_client = _get_drive_client(user_id)
             results["drive"] = drive_client.test_connectivity()
         except Exception as e:
             logger.error(f"❌ Drive connectivity test failed: {e}")
@@ -381,29 +702,20 @@ class HybridSearchOrchestrator:
 
 # Global orchestrator instance
 _orchestrator = None
-_orchestrator_lock = None
+_orchestrator_lock = threading.Lock()
 
 
 def get_search_orchestrator() -> HybridSearchOrchestrator:
     """Get singleton HybridSearchOrchestrator instance"""
-    global _orchestrator, _orchestrator_lock
-    
-    if _orchestrator_lock is None:
-        import threading
-        _orchestrator_lock = threading.Lock()
+    global _orchestrator
     
     if _orchestrator is None:
         with _orchestrator_lock:
             if _orchestrator is None:
-                # Configure from environment
-                max_workers = int(os.getenv('SEARCH_MAX_WORKERS', '2'))
-                max_results = int(os.getenv('SEARCH_MAX_RESULTS', '25'))
-                parallel_enabled = os.getenv('SEARCH_PARALLEL', 'true').lower() == 'true'
-                
                 _orchestrator = HybridSearchOrchestrator(
-                    max_workers=max_workers,
-                    default_max_results=max_results,
-                    enable_parallel_search=parallel_enabled
+                    max_workers=_SEARCH_MAX_WORKERS,
+                    default_max_results=_SEARCH_MAX_RESULTS,
+                    enable_parallel_search=_SEARCH_PARALLEL
                 )
     
     return _orchestrator
@@ -436,7 +748,7 @@ def search(query: str,
     
     return {
         "success": len(response.results) > 0,
-        "results": response.results,
+        "results": list(response.results),
         "total_results": response.total_results,
         "query_interpretation": response.query_interpretation,
         "performance": response.performance_metrics
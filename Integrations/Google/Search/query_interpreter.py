@@ -6,13 +6,89 @@ Transforms natural language queries into typed specifications for Gmail/Drive
 import re
 import logging
 import unicodedata
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+from dataclasses import dataclass, replace
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Distinct normalized queries memoized per interpreter
+_INTERPRET_CACHE_SIZE = 512
+
+# Precompiled patterns (compiled once at import instead of per query)
+_WS_RE = re.compile(r'\s+')
+
+# Operators each source cannot express, dropped during source-specific optimization
+_GMAIL_DROP = frozenset({'name', 'fullText'})
+_DRIVE_DROP = frozenset({'from', 'to', 'has', 'label'})
+_DATE_OPERATORS = frozenset({'before', 'after'})
+
+
+def _alternation(words: List[str]) -> re.Pattern:
+    """Compile a literal word list into one longest-first alternation regex"""
+    return re.compile('|'.join(re.escape(w) for w in sorted(set(words), key=lambda w: -len(w))))
+
+
+# Word tokens for keyword detection (splits "are:atașament" into "are", "atașament")
+_TOKEN_RE = re.compile(r'\w+')
+
+
+# Romanian noun stems, matched as word prefixes so articulated, genitive and plural
+# forms ("fișierului", "atașamentele", "mesajelor") are found without listing each one.
+# Stems shared with English words ("document", "folder") spell out the Romanian endings.
+_RO_EMAIL_STEMS = [
+    r'mesaj', r'emailu', r'coresponden[tțţ]', r'comunic[aă]r',
+]
+_RO_FILE_STEMS = [
+    r'fi[sșş]ier', r'dosar', r'document(?:ul|ului|e|ele|elor)\b', r'folder(?:ul|ului|e|ele|elor)\b',
+]
+_RO_INDICATOR_STEMS = [
+    r'ata[sșş]ament', r'con[tțţ]inut', r'etichet', r'subiect', r'g[aă]se[sșş]te',
+] + _RO_EMAIL_STEMS + _RO_FILE_STEMS
+
+
+class _KeywordMatcher:
+    """
+    Keyword test: single words via frozenset lookup; multi-word phrases (whole words)
+    and stems (word prefixes) via one regex
+    """
+    
+    __slots__ = ('words', 'pattern_re')
+    
+    def __init__(self, keywords: List[str], stems: Optional[List[str]] = None):
+        self.words = frozenset(k for k in keywords if ' ' not in k)
+        patterns = []
+        phrases = [k for k in keywords if ' ' in k]
+        if phrases:
+            patterns.append(r'\b(?:' + _alternation(phrases).pattern + r')\b')
+        if stems:
+            patterns.append(r'\b(?:' + '|'.join(stems) + ')')
+        self.pattern_re = re.compile('|'.join(patterns)) if patterns else None
+    
+    def matches(self, tokens: frozenset, text: str) -> bool:
+        if not self.words.isdisjoint(tokens):
+            return True
+        return self.pattern_re is not None and self.pattern_re.search(text) is not None
+
+
+# Common operators for both Gmail and Drive, one named group per operator so a
+# single scan finds them all (matched against the lowercased query, so no
+# IGNORECASE folding is needed)
+_OPERATORS_RE = re.compile('|'.join((
+    r'from:(?P<from>\S+)',
+    r'to:(?P<to>\S+)',
+    r'subject:"(?P<subject>[^"]+)"',
+    r'before:(?P<before>\S+)',
+    r'after:(?P<after>\S+)',
+    r'has:(?P<has>\S+)',
+    r'label:(?P<label>\S+)',
+    r"mimetype:'(?P<mimeType>[^']+)'",
+    r'name:"(?P<name>[^"]+)"',
+    r'fulltext:"(?P<fullText>[^"]+)"',
+)))
+
 
 class SearchSource(Enum):
     """Search source types"""
@@ -21,15 +97,20 @@ class SearchSource(Enum):
     AUTO = "auto"
 
 
-@dataclass
+@dataclass(frozen=True)
 class SearchSpec:
-    """Typed search specification from natural language query"""
+    """
+    Typed search specification from natural language query
+    Instances are shared through the interpretation cache - treat operators/terms as read-only
+    """
     source: SearchSource
     query_text: str
     operators: Dict[str, Any]
     free_text_terms: List[str]
     original_query: str
     language: str = "auto"
+    # Diacritic-stripped free_text_terms, precomputed once for the query builders
+    stripped_terms: Optional[List[str]] = None
 
 
 class QueryInterpreter:
@@ -38,7 +119,19 @@ class QueryInterpreter:
     Supports Romanian and English with operator aliasing and date parsing
     """
     
+    # Romanian diacritic mappings
+    _DIACRITIC_TABLE = str.maketrans({
+        'ș': 's', 'ş': 's', 'Ș': 'S', 'Ş': 'S',
+        'ț': 't', 'ţ': 't', 'Ț': 'T', 'Ţ': 'T',
+        'ă': 'a', 'Ă': 'A',
+        'â': 'a', 'Â': 'A',
+        'î': 'i', 'Î': 'I'
+    })
+    
     def __init__(self):
+        # Repeat queries (pagination, UI retries) skip all parsing work
+        self._interpret_cached = lru_cache(maxsize=_INTERPRET_CACHE_SIZE)(self._interpret_impl)
+        
         # Romanian → English operator mappings
         self.ro_operator_map = {
             # Basic operators
@@ -64,15 +157,21 @@ class QueryInterpreter:
             "continut:": "",  # Will be handled specially for fullText
             
             # File type mappings
-            "tip:pdf": "mimeType:'application/pdf'",
-            "tip:docx": "mimeType:'application/vnd.openxmlformats-officedocument.wordprocessingml.document'",
-            "tip:xlsx": "mimeType:'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'",
-            "tip:pptx": "mimeType:'application/vnd.openxmlformats-officedocument.presentationml.presentation'",
-            "tip:doc": "mimeType:'application/msword'",
-            "tip:xls": "mimeType:'application/vnd.ms-excel'",
-            "tip:ppt": "mimeType:'application/vnd.ms-powerpoint'",
+            "tip:pdf": "mimetype:'application/pdf'",
+            "tip:docx": "mimetype:'application/vnd.openxmlformats-officedocument.wordprocessingml.document'",
+            "tip:xlsx": "mimetype:'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'",
+            "tip:pptx": "mimetype:'application/vnd.openxmlformats-officedocument.presentationml.presentation'",
+            "tip:doc": "mimetype:'application/msword'",
+            "tip:xls": "mimetype:'application/vnd.ms-excel'",
+            "tip:ppt": "mimetype:'application/vnd.ms-powerpoint'",
         }
         
+        # Single alternation over all aliases, longest first so that
+        # "tip:pdf" wins over its "tip:" prefix at the same position
+        sorted_aliases = sorted(self.ro_operator_map, key=lambda k: -len(k))
+        self._ro_alias_re = re.compile('|'.join(re.escape(k) for k in sorted_aliases))
+        self._ro_alias_table = dict(self.ro_operator_map)
+        
         # Romanian month names
         self.ro_months = {
             "ianuarie": 1, "februarie": 2, "martie": 3, "aprilie": 4,
@@ -80,17 +179,24 @@ class QueryInterpreter:
             "septembrie": 9, "octombrie": 10, "noiembrie": 11, "decembrie": 12
         }
         
-        # Romanian relative date terms
+        # Pattern: "12 iulie 2025"
+        self._ro_date_re = re.compile(
+            r'(\d{1,2})\s+(' + '|'.join(self.ro_months) + r')\s+(\d{4})'
+        )
+        
+        # Romanian relative date terms, as offsets back from today
         self.ro_relative_dates = {
-            "azi": lambda: datetime.now().date(),
-            "astăzi": lambda: datetime.now().date(),
-            "astazi": lambda: datetime.now().date(),
-            "ieri": lambda: (datetime.now() - timedelta(days=1)).date(),
-            "săptămâna trecută": lambda: (datetime.now() - timedelta(weeks=1)).date(),
-            "saptamana trecuta": lambda: (datetime.now() - timedelta(weeks=1)).date(),
-            "luna trecută": lambda: (datetime.now() - timedelta(days=30)).date(),
-            "luna trecuta": lambda: (datetime.now() - timedelta(days=30)).date(),
+            "azi": timedelta(0),
+            "astăzi": timedelta(0),
+            "astazi": timedelta(0),
+            "ieri": timedelta(days=1),
+            "săptămâna trecută": timedelta(weeks=1),
+            "saptamana trecuta": timedelta(weeks=1),
+            "luna trecută": timedelta(days=30),
+            "luna trecuta": timedelta(days=30),
         }
+        # Longest first so "astazi" is not rewritten through its "azi" suffix
+        self._ro_reldate_re = _alternation(list(self.ro_relative_dates))
         
         # Email detection keywords
         self.email_keywords = {
@@ -106,6 +212,29 @@ class QueryInterpreter:
             "ro": ["fișier", "fisier", "fișiere", "fisiere", "document", "documente", 
                    "folder", "dosare"]
         }
+        
+        # Romanian-specific indicators for language detection
+        ro_indicators = [
+            'de la', 'către', 'catre', 'subiect', 'înainte', 'inainte', 
+            'după', 'dupa', 'etichetă', 'eticheta', 'atașament', 'atasament',
+            'conținut', 'continut', 'fișier', 'fisier', 'găsește', 'gaseste'
+        ]
+        
+        # Whole-word detection sets, plus Romanian stems matched from the start of a word;
+        # neither finds substrings such as "mai" inside "emails" or "to" inside "photos"
+        self._ro_lang_kw = _KeywordMatcher(ro_indicators + list(self.ro_months), _RO_INDICATOR_STEMS)
+        ro_stems = {"email": _RO_EMAIL_STEMS, "file": _RO_FILE_STEMS}
+        self._email_kw = {
+            lang: _KeywordMatcher(kws + self.email_keywords["en"], ro_stems["email"] if lang == "ro" else None)
+            for lang, kws in self.email_keywords.items()
+        }
+        self._file_kw = {
+            lang: _KeywordMatcher(kws + self.file_keywords["en"], ro_stems["file"] if lang == "ro" else None)
+            for lang, kws in self.file_keywords.items()
+        }
+        # Operator sentinels anchored on a word boundary, so "photo:" or "rename:" don't count
+        self._email_op_re = re.compile(r'\b(?:from|to|subject|de la|către|subiect):')
+        self._file_op_re = re.compile(r'\b(?:tip|nume|conținut|continut|mimetype|name):')
 
     def interpret_query(self, query: str) -> SearchSpec:
         """
@@ -122,15 +251,28 @@ class QueryInterpreter:
         # Normalize query
         normalized_query = self._normalize_text(query)
         
+        # Keyed on the current day as well, since relative dates ("azi", "ieri") resolve against it
+        spec = self._interpret_cached(normalized_query, date.today().isoformat())
+        if spec.original_query != query:
+            spec = replace(spec, original_query=query)
+        
+        logger.debug(f"✅ Interpreted spec: source={spec.source.value}, operators={spec.operators}")
+        return spec
+
+    def _interpret_impl(self, normalized_query: str, today_iso: str) -> SearchSpec:
+        """Interpret an already normalized query (memoized per day by interpret_query)"""
         # Detect language and source
-        language = self._detect_language(normalized_query)
-        source = self._detect_source(normalized_query, language)
+        tokens = self._tokenize(normalized_query)
+        language = self._detect_language(normalized_query, tokens)
+        source = self._detect_source(normalized_query, language, tokens)
         
         # Apply Romanian → English operator aliasing
         processed_query = self._apply_ro_aliasing(normalized_query)
         
-        # Parse date expressions
-        processed_query = self._parse_dates(processed_query, language)
+        # Parse date expressions (Romanian only)
+        is_ro = language == "ro"
+        if is_ro:
+            processed_query = self._parse_dates(processed_query, language, today_iso)
         
         # Extract operators and free text
         operators, free_text_terms = self._extract_operators(processed_query)
@@ -141,83 +283,69 @@ class QueryInterpreter:
         elif source == SearchSource.DRIVE:
             operators = self._optimize_drive_operators(operators)
         
-        spec = SearchSpec(
+        return SearchSpec(
             source=source,
             query_text=processed_query,
             operators=operators,
             free_text_terms=free_text_terms,
-            original_query=query,
-            language=language
+            original_query=normalized_query,
+            language=language,
+            # Only the Romanian builder paths expand with stripped terms
+            stripped_terms=[self._strip_diacritics(term) for term in free_text_terms] if is_ro else None
         )
-        
-        logger.debug(f"✅ Interpreted spec: source={spec.source.value}, operators={spec.operators}")
-        return spec
 
     def _normalize_text(self, text: str) -> str:
-        """Normalize text with NFC normalization and basic cleaning"""
-        # NFC normalization for consistent diacritic handling
-        normalized = unicodedata.normalize('NFC', text)
+        """Normalize text with NFC normalization, basic cleaning and lowercasing"""
+        # NFC normalization for consistent diacritic handling; the quick
+        # check skips the rescan/copy for ASCII and already-composed input
+        if text.isascii() or unicodedata.is_normalized('NFC', text):
+            normalized = text
+        else:
+            normalized = unicodedata.normalize('NFC', text)
         
-        # Basic cleaning
-        normalized = re.sub(r'\s+', ' ', normalized.strip())
+        # Basic cleaning; lowercase once so every downstream pattern can
+        # match case-sensitively
+        normalized = _WS_RE.sub(' ', normalized.strip()).lower()
         
         return normalized
 
     def _strip_diacritics(self, text: str) -> str:
         """Strip Romanian diacritics for matching"""
-        # Romanian diacritic mappings
-        diacritic_map = {
-            'ș': 's', 'ş': 's', 'Ș': 'S', 'Ş': 'S',
-            'ț': 't', 'ţ': 't', 'Ț': 'T', 'Ţ': 'T',
-            'ă': 'a', 'Ă': 'A',
-            'â': 'a', 'Â': 'A', 
-            'î': 'i', 'Î': 'I'
-        }
-        
-        result = text
-        for diacritic, replacement in diacritic_map.items():
-            result = result.replace(diacritic, replacement)
-        
-        return result
+        if text.isascii():
+            return text
+        return text.translate(self._DIACRITIC_TABLE)
+
+    @staticmethod
+    def _has_diacritics(text: str) -> bool:
+        """Cheap pre-check: pure ASCII text has no diacritics to strip"""
+        return not text.isascii()
+
+    @staticmethod
+    def _tokenize(query: str) -> frozenset:
+        """Distinct word tokens of an already lowercased query"""
+        return frozenset(_TOKEN_RE.findall(query))
 
-    def _detect_language(self, query: str) -> str:
+    def _detect_language(self, query: str, tokens: Optional[frozenset] = None) -> str:
         """Detect if query is primarily Romanian or English"""
-        query_lower = query.lower()
-        
-        # Count Romanian-specific indicators
-        ro_indicators = [
-            'de la', 'către', 'catre', 'subiect', 'înainte', 'inainte', 
-            'după', 'dupa', 'etichetă', 'eticheta', 'atașament', 'atasament',
-            'conținut', 'continut', 'fișier', 'fisier', 'găsește', 'gaseste'
-        ]
-        
-        ro_count = sum(1 for indicator in ro_indicators if indicator in query_lower)
-        
-        # Check for Romanian months
-        ro_month_count = sum(1 for month in self.ro_months.keys() if month in query_lower)
-        
-        return "ro" if (ro_count > 0 or ro_month_count > 0) else "en"
+        # query is already lowercased by _normalize_text
+        if tokens is None:
+            tokens = self._tokenize(query)
+        return "ro" if self._ro_lang_kw.matches(tokens, query) else "en"
 
-    def _detect_source(self, query: str, language: str) -> SearchSource:
+    def _detect_source(self, query: str, language: str,
+                       tokens: Optional[frozenset] = None) -> SearchSource:
         """Detect if query is for Gmail, Drive, or auto-detect"""
-        query_lower = query.lower()
-        
-        # Check for email keywords
-        email_kw = self.email_keywords[language] + self.email_keywords["en"]
-        has_email_keywords = any(kw in query_lower for kw in email_kw)
+        # query is already lowercased by _normalize_text
+        if tokens is None:
+            tokens = self._tokenize(query)
         
-        # Check for file keywords
-        file_kw = self.file_keywords[language] + self.file_keywords["en"] 
-        has_file_keywords = any(kw in query_lower for kw in file_kw)
+        # Check for email / file keywords
+        has_email_keywords = self._email_kw[language].matches(tokens, query)
+        has_file_keywords = self._file_kw[language].matches(tokens, query)
         
         # Check for specific operators
-        has_email_operators = any(op in query_lower for op in [
-            "from:", "to:", "subject:", "de la:", "către:", "subiect:"
-        ])
-        
-        has_file_operators = any(op in query_lower for op in [
-            "tip:", "nume:", "conținut:", "continut:", "mimeType:", "name:"
-        ])
+        has_email_operators = self._email_op_re.search(query) is not None
+        has_file_operators = self._file_op_re.search(query) is not None
         
         if has_email_keywords or has_email_operators:
             return SearchSource.GMAIL
@@ -228,129 +356,95 @@ class QueryInterpreter:
 
     def _apply_ro_aliasing(self, query: str) -> str:
         """Apply Romanian → English operator aliasing"""
-        result = query
-        
-        # Sort by length (descending) to handle longer phrases first
-        sorted_mappings = sorted(self.ro_operator_map.items(), 
-                                key=lambda x: len(x[0]), reverse=True)
-        
-        for ro_op, en_op in sorted_mappings:
-            if ro_op in result:
-                result = result.replace(ro_op, en_op)
-                logger.debug(f"🔄 Aliased '{ro_op}' → '{en_op}'")
-        
-        return result
+        return self._ro_alias_re.sub(lambda m: self._ro_alias_table[m.group(0)], query)
 
-    def _parse_dates(self, query: str, language: str) -> str:
+    def _parse_dates(self, query: str, language: str, today_iso: Optional[str] = None) -> str:
         """Parse Romanian date expressions and convert to ISO format"""
         result = query
         
         if language == "ro":
-            # Handle relative dates
-            for ro_term, date_func in self.ro_relative_dates.items():
-                if ro_term in result:
-                    iso_date = date_func().isoformat()
-                    result = result.replace(ro_term, iso_date)
-                    logger.debug(f"📅 Parsed relative date '{ro_term}' → '{iso_date}'")
+            # Handle relative dates, resolved once per call against the same day
+            today = date.fromisoformat(today_iso) if today_iso else date.today()
+            reldates = {term: (today - offset).isoformat() for term, offset in self.ro_relative_dates.items()}
+            result = self._ro_reldate_re.sub(lambda m: reldates[m.group(0)], result)
             
             # Handle absolute dates with Romanian months
-            # Pattern: "12 iulie 2025"
-            ro_date_pattern = r'(\d{1,2})\s+(' + '|'.join(self.ro_months.keys()) + r')\s+(\d{4})'
-            
             def replace_ro_date(match):
                 day, month_name, year = match.groups()
                 month_num = self.ro_months[month_name]
                 try:
-                    date_obj = datetime(int(year), month_num, int(day))
-                    iso_date = date_obj.date().isoformat()
+                    iso_date = date(int(year), month_num, int(day)).isoformat()
                     logger.debug(f"📅 Parsed RO date '{match.group()}' → '{iso_date}'")
                     return iso_date
                 except ValueError:
                     return match.group()  # Invalid date, keep original
             
-            result = re.sub(ro_date_pattern, replace_ro_date, result, flags=re.IGNORECASE)
+            result = self._ro_date_re.sub(replace_ro_date, result)
         
         return result
 
     def _extract_operators(self, query: str) -> Tuple[Dict[str, Any], List[str]]:
         """Extract search operators and remaining free text"""
-        operators = {}
-        remaining_text = query
-        
-        # Common operators for both Gmail and Drive
-        operator_patterns = {
-            'from': r'from:([^\s]+)',
-            'to': r'to:([^\s]+)', 
-            'subject': r'subject:"([^"]+)"',
-            'before': r'before:([^\s]+)',
-            'after': r'after:([^\s]+)',
-            'has': r'has:([^\s]+)',
-            'label': r'label:([^\s]+)',
-            'mimeType': r'mimeType:\'([^\']+)\'',
-            'name': r'name:"([^"]+)"',
-            'fullText': r'fullText:"([^"]+)"'
-        }
+        found: Dict[str, List[str]] = {}
+        
+        def capture(match: re.Match) -> str:
+            found.setdefault(match.lastgroup, []).append(match.group(match.lastgroup))
+            return ''
+        
+        # Single pass: capture each operator value and erase it from the text
+        remaining_text = _OPERATORS_RE.sub(capture, query)
         
-        for op_name, pattern in operator_patterns.items():
-            matches = re.findall(pattern, remaining_text, re.IGNORECASE)
-            if matches:
-                operators[op_name] = matches[0] if len(matches) == 1 else matches
-                # Remove matched operators from remaining text
-                remaining_text = re.sub(pattern, '', remaining_text, flags=re.IGNORECASE)
+        # Keep the canonical operator order so built queries are stable
+        operators = {
+            op_name: values[0] if len(values) == 1 else values
+            for op_name in _OPERATORS_RE.groupindex
+            if (values := found.get(op_name))
+        }
         
         # Extract free text terms (clean up remaining text)
-        free_text = re.sub(r'\s+', ' ', remaining_text.strip())
+        free_text = _WS_RE.sub(' ', remaining_text.strip())
         free_text_terms = [term.strip() for term in free_text.split() if term.strip()]
         
         return operators, free_text_terms
 
     def _optimize_gmail_operators(self, operators: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize operators specifically for Gmail search"""
-        optimized = operators.copy()
-        
-        # Convert name/fullText to generic search terms for Gmail
-        if 'name' in optimized:
-            del optimized['name']  # Gmail doesn't support name: operator
-            
-        if 'fullText' in optimized:
-            del optimized['fullText']  # Will be handled in free text
-        
-        # Ensure dates are in Gmail format (YYYY/MM/DD)
-        for date_op in ['before', 'after']:
-            if date_op in optimized:
-                date_val = optimized[date_op]
-                if isinstance(date_val, str) and '-' in date_val:
-                    # Convert ISO format to Gmail format
-                    optimized[date_op] = date_val.replace('-', '/')
-        
-        return optimized
+        # name/fullText are dropped (Gmail has no name: operator, fullText goes to free text);
+        # ISO dates are converted to Gmail format (YYYY/MM/DD)
+        return {
+            k: (v.replace('-', '/') if k in _DATE_OPERATORS and isinstance(v, str) else v)
+            for k, v in operators.items() if k not in _GMAIL_DROP
+        }
 
     def _optimize_drive_operators(self, operators: Dict[str, Any]) -> Dict[str, Any]:
         """Optimize operators specifically for Drive search"""
-        optimized = operators.copy()
-        
-        # Remove Gmail-specific operators
-        gmail_only = ['from', 'to', 'has', 'label']
-        for op in gmail_only:
-            if op in optimized:
-                del optimized[op]
-        
-        # Drive uses different date format and field names
-        if 'before' in optimized:
-            # Convert to modifiedTime for Drive
-            optimized['modifiedTime'] = f"<{optimized['before']}"
-            del optimized['before']
-            
-        if 'after' in optimized:
-            if 'modifiedTime' in optimized:
-                # Combine into range
-                optimized['modifiedTime'] = f">{optimized['after']} and {optimized['modifiedTime']}"
-            else:
-                optimized['modifiedTime'] = f">{optimized['after']}"
-            del optimized['after']
+        # Single pass: drop Gmail-specific operators and pull out the date bounds
+        optimized = {}
+        before = after = None
+        for k, v in operators.items():
+            if k == 'before':
+                before = v
+            elif k == 'after':
+                after = v
+            elif k not in _DRIVE_DROP:
+                optimized[k] = v
+        
+        # Drive filters dates on modifiedTime instead of before/after
+        if after is not None and before is not None:
+            optimized['modifiedTime'] = f">{after} and <{before}"
+        elif before is not None:
+            optimized['modifiedTime'] = f"<{before}"
+        elif after is not None:
+            optimized['modifiedTime'] = f">{after}"
         
         return optimized
 
+    def _stripped_terms(self, spec: SearchSpec) -> List[str]:
+        """Diacritic-stripped free text terms, reusing the copy computed at interpretation"""
+        if spec.stripped_terms is not None:
+            return spec.stripped_terms
+        return [self._strip_diacritics(term) for term in spec.free_text_terms]
+
     def build_gmail_query(self, spec: SearchSpec) -> str:
         """Build Gmail API query string from SearchSpec"""
         query_parts = []
@@ -368,12 +462,14 @@ class QueryInterpreter:
         if spec.free_text_terms:
             if spec.language == "ro":
                 # Add both original and diacritic-stripped versions
-                expanded_terms = []
-                for term in spec.free_text_terms:
-                    expanded_terms.append(term)
-                    stripped = self._strip_diacritics(term)
-                    if stripped != term:
-                        expanded_terms.append(stripped)
+                if self._has_diacritics(' '.join(spec.free_text_terms)):
+                    expanded_terms = []
+                    for term, stripped in zip(spec.free_text_terms, self._stripped_terms(spec)):
+                        expanded_terms.append(term)
+                        if stripped != term:
+                            expanded_terms.append(stripped)
+                else:
+                    expanded_terms = spec.free_text_terms
                 query_parts.append(f"({' OR '.join(expanded_terms)})")
             else:
                 query_parts.append(' '.join(spec.free_text_terms))
@@ -401,9 +497,9 @@ class QueryInterpreter:
         if spec.free_text_terms:
             text_query = ' '.join(spec.free_text_terms)
             
-            if spec.language == "ro":
+            if spec.language == "ro" and self._has_diacritics(text_query):
                 # Diacritic expansion for Romanian
-                stripped_query = self._strip_diacritics(text_query)
+                stripped_query = ' '.join(self._stripped_terms(spec))
                 if stripped_query != text_query:
                     # Search both original and stripped versions
                     name_search = f"(name contains '{text_query}' or name contains '{stripped_query}')"
@@ -421,16 +517,22 @@ class QueryInterpreter:
         logger.debug(f"📁 Built Drive query: '{query_string}'")
         return query_string
 
-    def expand_free_text_for_reranking(self, text: str, language: str) -> List[str]:
-        """Expand free text terms for diacritic-insensitive reranking"""
-        terms = text.split()
-        expanded = []
+    def expand_free_text_for_reranking(self, text: str, language: str) -> Iterator[str]:
+        """
+        Expand free text terms for diacritic-insensitive reranking
         
-        for term in terms:
-            expanded.append(term)
-            if language == "ro":
+        Yields each distinct term once, followed by its diacritic-stripped form for Romanian.
+        Callers that need a list should wrap the result in list().
+        """
+        expand = language == "ro" and self._has_diacritics(text)
+        seen = set()
+        
+        for term in text.split():
+            if term not in seen:
+                seen.add(term)
+                yield term
+            if expand:
                 stripped = self._strip_diacritics(term)
-                if stripped != term:
-                    expanded.append(stripped)
-        
-        return expanded
+                if stripped not in seen:
+                    seen.add(stripped)
+                    yield stripped
@@ -3,26 +3,150 @@ Hybrid Reranker for Gmail and Drive Search Results
 Deterministic reranking with lexical overlap + recency half-life + diacritic support
 """
 
+import bisect
+import heapq
 import logging
 import math
 import re
+import threading
 import unicodedata
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Optional, Tuple, Union, Iterable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+from cachetools import LRUCache
 
 from .gmail_client import GmailMessage
 from .drive_client import DriveFile
 
 logger = logging.getLogger(__name__)
 
+# Lowercased searchable texts kept per reranker, keyed by item identity
+_LOWERED_TEXT_CACHE_SIZE = 4096
+
+# Romanian diacritic mappings, applied in one str.translate pass
+_DIACRITIC_TABLE = str.maketrans({
+    'ș': 's', 'ş': 's', 'Ș': 'S', 'Ş': 'S',
+    'ț': 't', 'ţ': 't', 'Ț': 'T', 'Ţ': 'T',
+    'ă': 'a', 'Ă': 'A',
+    'â': 'a', 'Â': 'A',
+    'î': 'i', 'Î': 'I'
+})
+
+
+class _TermMatcher:
+    """
+    Counts every query term in a text with one regex scan
+    
+    Per-term counts match str.count (non-overlapping, leftmost first), including
+    terms that are prefixes of other terms (e.g. "plan" inside "planificare").
+    """
+    
+    __slots__ = ('_pattern', '_prefixes', '_single_term')
+    
+    def __init__(self, terms: List[str]):
+        unique_terms = sorted(set(terms), key=len, reverse=True)
+        # One distinct term: str.count is already a single C-level scan
+        self._single_term = unique_terms[0] if len(unique_terms) == 1 else None
+        # Lookahead visits every position; longest-first alternation reports the longest term there
+        self._pattern = re.compile('(?=(' + '|'.join(map(re.escape, unique_terms)) + '))')
+        # Any shorter term matching at the same position is a prefix of the longest one
+        self._prefixes = {
+            term: [other for other in unique_terms if term.startswith(other)]
+            for term in unique_terms
+        }
+    
+    def count(self, text: str) -> Dict[str, int]:
+        if self._single_term is not None:
+            return {self._single_term: text.count(self._single_term) if text else 0}
+        
+        counts = dict.fromkeys(self._prefixes, 0)
+        if not text:
+            return counts  # e.g. Drive files with no description and an empty folder path
+        next_start = dict.fromkeys(self._prefixes, 0)
+        
+        for match in self._pattern.finditer(text):
+            pos = match.start()
+            for term in self._prefixes[match.group(1)]:
+                if pos >= next_start[term]:
+                    counts[term] += 1
+                    next_start[term] = pos + len(term)
+        
+        return counts
+
+
+@lru_cache(maxsize=256)
+def _get_term_matcher(terms: Tuple[str, ...]) -> _TermMatcher:
+    """Shared, immutable matcher per expanded term set (repeat queries, per-source batches)"""
+    return _TermMatcher(list(terms))
+
+
+def _nfc(text: str) -> str:
+    """
+    NFC-normalize text, skipping the copy for ASCII and already-composed input
+    
+    Normalizing both sides (rather than only stripping diacritics) keeps matches
+    diacritic-exact and avoids NFC/NFD mismatches between queries and API content.
+    """
+    if text.isascii() or unicodedata.is_normalized('NFC', text):
+        return text
+    return unicodedata.normalize('NFC', text)
+
+
+def _gmail_searchable_text(message: GmailMessage) -> str:
+    """Gmail: subject + sender + snippet + content"""
+    parts = (message.subject, message.sender, message.snippet, message.content)
+    return " ".join([part for part in parts if part])
+
+
+def _drive_searchable_text(file: DriveFile) -> str:
+    """Drive: name + description + folder_path"""
+    parts = (file.name, file.description, file.folder_path)
+    return " ".join([part for part in parts if part])
+
+
+_SEARCHABLE_TEXT_BUILDERS = {
+    GmailMessage: _gmail_searchable_text,
+    DriveFile: _drive_searchable_text
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class RankingResult:
-    """Result with ranking score"""
+    """
+    Result with ranking score
+    
+    Component scores are stored flat; the score_breakdown dict is only assembled when
+    requested (serialization). weights is the reranker's shared (lexical, recency)
+    tuple, or None for results kept in native API order without hybrid scoring.
+    """
     item: Union[GmailMessage, DriveFile]
     score: float
-    score_breakdown: Dict[str, float]
+    lexical: float = 0.0
+    recency: float = 0.0
+    weights: Optional[Tuple[float, float]] = None
+    
+    @classmethod
+    def from_native(cls, 
+                    item: Union[GmailMessage, DriveFile], 
+                    score: float = 1.0) -> "RankingResult":
+        """Wrap a result in its native API order without hybrid scoring"""
+        return cls(item=item, score=score)
+    
+    @property
+    def score_breakdown(self) -> Dict[str, float]:
+        breakdown = {
+            "lexical": self.lexical,
+            "recency": self.recency,
+            "total": self.score
+        }
+        if self.weights is None:
+            breakdown["literal_match"] = 1.0
+        else:
+            breakdown["lexical_weight"], breakdown["recency_weight"] = self.weights
+        return breakdown
     
     def to_dict(self) -> Dict[str, Any]:
         result = self.item.to_dict()
@@ -63,215 +187,270 @@ class HybridReranker:
             self.lexical_weight = lexical_weight / total_weight
             self.recency_weight = recency_weight / total_weight
         
+        # Repeat items (pagination, re-searches) skip re-lowering their full content
+        self._lowered_text_cache = LRUCache(maxsize=_LOWERED_TEXT_CACHE_SIZE)
+        self._lowered_text_lock = threading.Lock()
+        
         logger.info(f"🎯 HybridReranker initialized: lexical={self.lexical_weight:.2f}, "
                    f"recency={self.recency_weight:.2f}, halflife={recency_halflife_days}d")
 
     def rerank_results(self, 
-                      results: List[Union[GmailMessage, DriveFile]], 
+                      results: Iterable[Union[GmailMessage, DriveFile]], 
                       query_terms: List[str],
-                      language: str = "auto") -> List[RankingResult]:
+                      language: str = "auto",
+                      top_k: Optional[int] = None,
+                      term_counts: Optional[np.ndarray] = None,
+                      idf: Optional[np.ndarray] = None) -> List[RankingResult]:
         """
         Rerank search results using hybrid scoring
         
         Args:
-            results: List of Gmail or Drive results
+            results: Gmail or Drive results (list or any iterable)
             query_terms: Original query terms for lexical matching
             language: Query language for diacritic expansion
+            top_k: Keep only the K best results (partial selection instead of a full sort)
+            term_counts: count_terms() matrix for these results, if already computed
+            idf: Term weights from global_idf(); computed from this batch when omitted
             
         Returns:
             List of RankingResult objects sorted by score (highest first)
         """
-        logger.info(f"🎯 Reranking {len(results)} results with {len(query_terms)} query terms")
+        # Materialize once (any iterable) so the whole batch is scored with array ops
+        results = list(results)
+        
+        logger.info("🎯 Reranking %d results with %d query terms", len(results), len(query_terms))
         
         if not results:
             return []
         
-        # Expand query terms for diacritic matching
-        expanded_terms = self._expand_query_terms(query_terms, language)
-        
-        # Score all results
-        ranking_results = []
-        for result in results:
-            score, breakdown = self._calculate_score(result, expanded_terms)
-            ranking_results.append(RankingResult(
+        # Term count matrix (one scan per document), then lexical scores for the batch
+        if term_counts is None:
+            term_counts = self.count_terms(results, query_terms, language)
+        if term_counts.shape[1]:
+            lexical_scores = self._calculate_lexical_scores(term_counts, idf)
+        else:
+            lexical_scores = np.zeros(len(results))
+        
+        # Single reference instant for the whole batch
+        now_utc = datetime.now(timezone.utc)
+        recency_scores = self._calculate_recency_scores(results, now_utc)
+        total_scores = self.lexical_weight * lexical_scores + self.recency_weight * recency_scores
+        
+        weights = (self.lexical_weight, self.recency_weight)
+        ranking_results = [
+            RankingResult(
                 item=result,
-                score=score,
-                score_breakdown=breakdown
-            ))
+                score=total,
+                lexical=lexical,
+                recency=recency,
+                weights=weights
+            )
+            for result, lexical, recency, total in zip(
+                results, lexical_scores.tolist(), recency_scores.tolist(), total_scores.tolist()
+            )
+        ]
+        
+        # Sort by score (highest first); nlargest is O(N log K) and keeps the same tie order
+        if top_k is not None and top_k < len(ranking_results):
+            ranking_results = heapq.nlargest(top_k, ranking_results, key=lambda x: x.score)
+        else:
+            ranking_results.sort(key=lambda x: x.score, reverse=True)
+        
+        logger.info("✅ Reranking completed: scores range %.3f - %.3f",
+                   ranking_results[-1].score, ranking_results[0].score)
         
-        # Sort by score (highest first)
-        ranking_results.sort(key=lambda x: x.score, reverse=True)
+        return ranking_results
+
+    def partial_rerank(self, 
+                       results: List[Union[GmailMessage, DriveFile]], 
+                       query_terms: List[str],
+                       language: str = "auto",
+                       top_k: Optional[int] = None,
+                       term_counts: Optional[np.ndarray] = None,
+                       idf: Optional[np.ndarray] = None) -> List[RankingResult]:
+        """
+        Rerank a partial result set (e.g. one source) for merging with merge_rankings()
         
-        logger.info(f"✅ Reranking completed: scores range {ranking_results[-1].score:.3f} - {ranking_results[0].score:.3f}")
+        Pass the global_idf() of all batches so every source weighs query terms by
+        their rarity across the combined results, keeping scores comparable.
+        """
+        return self.rerank_results(results, query_terms, language, top_k, term_counts, idf)
+
+    def count_terms(self, 
+                    results: Sequence[Union[GmailMessage, DriveFile]], 
+                    query_terms: List[str],
+                    language: str = "auto") -> np.ndarray:
+        """
+        Occurrences of each expanded query term in each result
         
-        return ranking_results
+        Returns:
+            (results x expanded terms) count matrix; no columns when there are no terms
+        """
+        # Expand query terms for diacritic matching
+        expanded_terms = self._expand_query_terms(query_terms, language)
+        if not expanded_terms:
+            return np.zeros((len(results), 0))
+        
+        # One matcher per term set (reused across calls); each document is then scanned once for all terms
+        matcher = _get_term_matcher(tuple(expanded_terms))
+        return np.array(
+            [[counts[term] for term in expanded_terms]
+             for counts in (matcher.count(self._get_lowered_text(result)) for result in results)],
+            dtype=np.float64
+        ).reshape(len(results), len(expanded_terms))
+
+    @staticmethod
+    def global_idf(term_count_batches: Sequence[np.ndarray]) -> Optional[np.ndarray]:
+        """
+        Smoothed IDF over the combined documents of several count_terms() batches
+        
+        Document frequencies add up across batches, so the batches never need to be
+        rescanned or concatenated. None when there are no terms or no documents.
+        """
+        batches = [counts for counts in term_count_batches if counts.shape[0] and counts.shape[1]]
+        if not batches:
+            return None
+        num_docs = sum(counts.shape[0] for counts in batches)
+        document_frequency = sum((counts > 0).sum(axis=0) for counts in batches)
+        return np.log((num_docs + 1) / (document_frequency + 1)) + 1
+
+    def merge_rankings(self, ranked_batches: List[List[RankingResult]]) -> List[RankingResult]:
+        """Merge independently ranked (score-descending) batches into one ranking"""
+        if len(ranked_batches) == 1:
+            return ranked_batches[0]
+        
+        return list(heapq.merge(*ranked_batches, key=lambda x: x.score, reverse=True))
 
     def _expand_query_terms(self, query_terms: List[str], language: str) -> List[str]:
-        """Expand query terms with diacritic variants for Romanian"""
+        """Expand query terms with diacritic variants for Romanian (order-preserving, deduplicated)"""
         expanded = []
+        seen = set()
+        add_stripped = self.diacritic_insensitive and language == "ro"
         
         for term in query_terms:
-            expanded.append(term.lower())
+            # Lowercase once; same NFC form as the document text, so composed/decomposed input still matches
+            normalized = _nfc(term.lower())
+            variants = (normalized, self._strip_diacritics(normalized)) if add_stripped else (normalized,)
             
-            if self.diacritic_insensitive and language == "ro":
-                stripped = self._strip_diacritics(term.lower())
-                if stripped != term.lower():
-                    expanded.append(stripped)
+            # Stripped variant only as a Romanian fallback; repeats are dropped so they
+            # don't skew the overlap ratio or get counted twice
+            for variant in variants:
+                if variant not in seen:
+                    seen.add(variant)
+                    expanded.append(variant)
         
         return expanded
 
-    def _calculate_score(self, 
-                        result: Union[GmailMessage, DriveFile], 
-                        expanded_terms: List[str]) -> tuple[float, Dict[str, float]]:
-        """Calculate hybrid score for a single result"""
-        # Calculate individual component scores
-        lexical_score = self._calculate_lexical_score(result, expanded_terms)
-        recency_score = self._calculate_recency_score(result)
-        
-        # Calculate weighted total
-        total_score = (
-            self.lexical_weight * lexical_score +
-            self.recency_weight * recency_score
-        )
-        
-        breakdown = {
-            "lexical": lexical_score,
-            "recency": recency_score,
-            "total": total_score,
-            "lexical_weight": self.lexical_weight,
-            "recency_weight": self.recency_weight
-        }
-        
-        return total_score, breakdown
-
-    def _calculate_lexical_score(self, 
-                                result: Union[GmailMessage, DriveFile], 
-                                expanded_terms: List[str]) -> float:
-        """Calculate lexical overlap score"""
-        if not expanded_terms:
-            return 0.0
-        
-        # Get searchable text from result
-        searchable_text = self._get_searchable_text(result).lower()
-        
-        # Count term matches
-        matches = 0
-        total_terms = len(expanded_terms)
+    @classmethod
+    def _calculate_lexical_scores(cls, term_counts: np.ndarray, idf: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Lexical scores for a batch from its (documents x expanded terms) count matrix
         
-        for term in expanded_terms:
-            if term in searchable_text:
-                matches += 1
+        Overlap is IDF-weighted coverage: matching a term that is rare across the results
+        counts more than matching one every result contains. Smoothed IDF is
+        log((N+1)/(df+1)) + 1, over the given idf's documents or else this batch. A log
+        boost for repeated occurrences is applied on top, capped at 1.0.
+        """
+        present = term_counts > 0
+        if idf is None:
+            idf = cls.global_idf([term_counts])
         
-        # Calculate overlap ratio
-        overlap_ratio = matches / total_terms if total_terms > 0 else 0.0
+        overlap_ratio = (present @ idf) / idf.sum()
         
         # Apply TF-like boost for multiple occurrences
-        boosted_score = self._apply_frequency_boost(searchable_text, expanded_terms, overlap_ratio)
+        total_occurrences = term_counts.sum(axis=1)
+        frequency_boost = 1 + np.log1p(total_occurrences) * 0.1
         
-        return min(boosted_score, 1.0)  # Cap at 1.0
+        return np.minimum(overlap_ratio * frequency_boost, 1.0)  # Cap at 1.0
+
+    def _get_lowered_text(self, result: Union[GmailMessage, DriveFile]) -> str:
+        """Lowercased searchable text, memoized across rerank calls"""
+        key = self._text_cache_key(result)
+        with self._lowered_text_lock:
+            lowered = self._lowered_text_cache.get(key)
+        
+        if lowered is None:
+            lowered = self._get_searchable_text(result).lower()
+            with self._lowered_text_lock:
+                self._lowered_text_cache[key] = lowered
+        
+        return lowered
+
+    def _text_cache_key(self, result: Union[GmailMessage, DriveFile]) -> tuple:
+        """Cache key that changes whenever the searchable text can change"""
+        if isinstance(result, GmailMessage):
+            # Messages are immutable; content is only present when fetched with include_content
+            return ('gmail', result.id, len(result.content))
+        return ('drive', result.id, result.modified_time_str, result.name,
+                result.description, result.folder_path)
 
     def _get_searchable_text(self, result: Union[GmailMessage, DriveFile]) -> str:
         """Extract searchable text from result"""
-        if isinstance(result, GmailMessage):
-            # For Gmail: subject + sender + snippet + content
-            parts = [
-                result.subject,
-                result.sender,
-                result.snippet,
-                result.content
-            ]
-        else:  # DriveFile
-            # For Drive: name + description + folder_path
-            parts = [
-                result.name,
-                result.description or "",
-                result.folder_path
-            ]
-        
-        return " ".join(part for part in parts if part)
-
-    def _apply_frequency_boost(self, 
-                              text: str, 
-                              terms: List[str], 
-                              base_score: float) -> float:
-        """Apply frequency-based boost to lexical score"""
-        if base_score == 0:
-            return 0.0
-        
-        # Count total occurrences of all terms
-        total_occurrences = sum(text.count(term) for term in terms)
-        
-        # Apply logarithmic boost for frequency
-        frequency_boost = 1 + math.log(1 + total_occurrences) * 0.1
-        
-        return base_score * frequency_boost
-
-    def _calculate_recency_score(self, result: Union[GmailMessage, DriveFile]) -> float:
-        """Calculate recency score using exponential decay"""
-        try:
-            # Get the relevant date
-            if isinstance(result, GmailMessage):
-                item_date = result.date
-            else:  # DriveFile
-                item_date = result.modified_time
-            
-            # Calculate age in days
-            now = datetime.now(item_date.tzinfo) if item_date.tzinfo else datetime.now()
-            age_days = (now - item_date).total_seconds() / (24 * 3600)
-            
-            # Apply exponential decay with configurable half-life
-            # Score = 0.5^(age_days / halflife_days)
-            recency_score = 0.5 ** (age_days / self.recency_halflife_days)
-            
-            return recency_score
-            
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to calculate recency score: {e}")
-            return 0.5  # Default moderate score
+        # Exact-type dispatch; anything that isn't a GmailMessage is treated as a Drive file
+        text_builder = _SEARCHABLE_TEXT_BUILDERS.get(type(result), _drive_searchable_text)
+        
+        # NFC once here (cached with the lowered text) rather than per query term
+        return _nfc(text_builder(result))
+
+    def _calculate_recency_scores(self, 
+                                  results: List[Union[GmailMessage, DriveFile]], 
+                                  now_utc: Optional[datetime] = None) -> np.ndarray:
+        """Batch recency scores: one clock read and one vectorized exp2 for all results"""
+        if now_utc is None:
+            now_utc = datetime.now(timezone.utc)
+        # Naive dates (parse fallbacks) are local wall time; derive local "now" from the same instant
+        now_local = now_utc.astimezone().replace(tzinfo=None)
+        
+        age_seconds = np.empty(len(results), dtype=np.float64)
+        for i, result in enumerate(results):
+            try:
+                item_date = result.date if isinstance(result, GmailMessage) else result.modified_time
+                now = now_utc if item_date.tzinfo else now_local
+                age_seconds[i] = (now - item_date).total_seconds()
+            except Exception as e:
+                logger.warning("⚠️ Failed to calculate recency score: %s", e)
+                age_seconds[i] = np.nan
+        
+        # Score = 0.5^(age_days / halflife_days) = exp2(-age_days / halflife_days)
+        ages_days = age_seconds / (24 * 3600)
+        recency = np.exp2(-ages_days / self.recency_halflife_days)
+        
+        # Malformed dates get the default moderate score
+        return np.where(np.isnan(recency), 0.5, recency)
 
     def _strip_diacritics(self, text: str) -> str:
         """Strip Romanian diacritics for matching"""
-        # Romanian diacritic mappings
-        diacritic_map = {
-            'ș': 's', 'ş': 's', 'Ș': 'S', 'Ş': 'S',
-            'ț': 't', 'ţ': 't', 'Ț': 'T', 'Ţ': 'T',
-            'ă': 'a', 'Ă': 'A',
-            'â': 'a', 'Â': 'A', 
-            'î': 'i', 'Î': 'I'
-        }
-        
-        result = text
-        for diacritic, replacement in diacritic_map.items():
-            result = result.replace(diacritic, replacement)
-        
-        return result
+        if text.isascii():
+            return text
+        return text.translate(_DIACRITIC_TABLE)
 
     def get_score_statistics(self, ranking_results: List[RankingResult]) -> Dict[str, Any]:
         """Get statistical summary of ranking scores"""
         if not ranking_results:
             return {}
         
-        scores = [r.score for r in ranking_results]
-        lexical_scores = [r.score_breakdown["lexical"] for r in ranking_results]
-        recency_scores = [r.score_breakdown["recency"] for r in ranking_results]
+        count = len(ranking_results)
+        scores = np.fromiter((r.score for r in ranking_results), dtype=np.float64, count=count)
+        lexical_scores = np.fromiter((r.lexical for r in ranking_results), dtype=np.float64, count=count)
+        recency_scores = np.fromiter((r.recency for r in ranking_results), dtype=np.float64, count=count)
         
         return {
-            "total_results": len(ranking_results),
+            "total_results": count,
             "score_range": {
-                "min": min(scores),
-                "max": max(scores),
-                "mean": sum(scores) / len(scores),
-                "median": sorted(scores)[len(scores) // 2]
+                "min": float(scores.min()),
+                "max": float(scores.max()),
+                "mean": float(scores.mean()),
+                "median": float(np.median(scores))
             },
             "lexical_range": {
-                "min": min(lexical_scores),
-                "max": max(lexical_scores),
-                "mean": sum(lexical_scores) / len(lexical_scores)
+                "min": float(lexical_scores.min()),
+                "max": float(lexical_scores.max()),
+                "mean": float(lexical_scores.mean())
             },
             "recency_range": {
-                "min": min(recency_scores),
-                "max": max(recency_scores),
-                "mean": sum(recency_scores) / len(recency_scores)
+                "min": float(recency_scores.min()),
+                "max": float(recency_scores.max()),
+                "mean": float(recency_scores.mean())
             },
             "weights": {
                 "lexical": self.lexical_weight,
@@ -281,39 +460,92 @@ class HybridReranker:
 
     def filter_by_score_threshold(self, 
                                  ranking_results: List[RankingResult], 
-                                 min_score: float = 0.1) -> List[RankingResult]:
-        """Filter results by minimum score threshold"""
-        filtered = [r for r in ranking_results if r.score >= min_score]
+                                 min_score: float = 0.1,
+                                 presorted: bool = True) -> List[RankingResult]:
+        """
+        Filter results by minimum score threshold
         
-        logger.info(f"🎯 Score filtering: {len(filtered)}/{len(ranking_results)} results above {min_score}")
+        Score-sorted input (highest first, as returned by rerank_results) is cut with a
+        binary search; pass presorted=False to scan arbitrary input instead
+        """
+        if presorted:
+            # -score is ascending over descending input
+            cutoff = bisect.bisect_right(ranking_results, -min_score, key=lambda r: -r.score)
+            filtered = ranking_results[:cutoff]
+        else:
+            filtered = [r for r in ranking_results if r.score >= min_score]
+        
+        logger.info("🎯 Score filtering: %d/%d results above %s", len(filtered), len(ranking_results), min_score)
         
         return filtered
 
     def diversify_results(self, 
                          ranking_results: List[RankingResult], 
                          max_per_source: int = 10) -> List[RankingResult]:
-        """Diversify results to balance Gmail vs Drive sources"""
-        gmail_results = []
-        drive_results = []
+        """
+        Diversify results to balance Gmail vs Drive sources
+        
+        Expects score-sorted input (highest first), as returned by rerank_results; the
+        kept results are a subsequence of it, so no re-sort or merge is needed
+        """
+        diversified = []
+        gmail_count = 0
+        drive_count = 0
         
-        # Separate by source
+        # Single walk, stopping once both sources are full
         for result in ranking_results:
             if isinstance(result.item, GmailMessage):
-                gmail_results.append(result)
+                if gmail_count >= max_per_source:
+                    continue
+                gmail_count += 1
             else:
-                drive_results.append(result)
+                if drive_count >= max_per_source:
+                    continue
+                drive_count += 1
+            
+            diversified.append(result)
+            if gmail_count >= max_per_source and drive_count >= max_per_source:
+                break
         
-        # Take top N from each source
-        top_gmail = gmail_results[:max_per_source]
-        top_drive = drive_results[:max_per_source]
+        logger.info("🎯 Diversified results: %d Gmail + %d Drive", gmail_count, drive_count)
         
-        # Merge and re-sort by score
-        diversified = top_gmail + top_drive
-        diversified.sort(key=lambda x: x.score, reverse=True)
+        return diversified
+
+    def fused_filter(self, 
+                     ranking_results: List[RankingResult], 
+                     min_score: float = 0.1,
+                     max_per_source: int = 10,
+                     limit: Optional[int] = None) -> List[RankingResult]:
+        """
+        Single-pass equivalent of filter_by_score_threshold + diversify_results + [:limit]
         
-        logger.info(f"🎯 Diversified results: {len(top_gmail)} Gmail + {len(top_drive)} Drive")
+        Expects score-sorted input (highest first), as returned by rerank_results
+        """
+        filtered = []
+        gmail_count = 0
+        drive_count = 0
         
-        return diversified
+        for result in ranking_results:
+            if result.score < min_score:
+                break  # Sorted input: nothing further can pass the threshold
+            
+            if isinstance(result.item, GmailMessage):
+                if gmail_count >= max_per_source:
+                    continue
+                gmail_count += 1
+            else:
+                if drive_count >= max_per_source:
+                    continue
+                drive_count += 1
+            
+            filtered.append(result)
+            if limit is not None and len(filtered) >= limit:
+                break
+        
+        logger.info("🎯 Fused filtering: %d/%d results kept (%d Gmail + %d Drive, min score %s)",
+                   len(filtered), len(ranking_results), gmail_count, drive_count, min_score)
+        
+        return filtered
 
 
 # Factory function for easy instantiation
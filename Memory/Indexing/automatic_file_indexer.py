@@ -3,13 +3,30 @@ Automatic File Indexer with Dual Memory RBAC Integration
 Monitors Google Drive folders and automatically indexes files with proper access controls.
 """
 
+import io
 import os
 import sys
+import json
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any
+import multiprocessing
+import sqlite3
+import threading
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
+import httplib2
+from cachetools import LRUCache, TTLCache
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaIoBaseDownload
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -21,15 +38,136 @@ from Auth.User_management.auth_manager import AuthManager
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of files processed concurrently within a folder
+_FILE_CONCURRENCY = 8
+# Maximum number of concurrent Drive API listing calls
+_DRIVE_CONCURRENCY = 16
+# Folder ids OR-ed into a single bulk files.list query
+_BULK_LIST_CHUNK = 40
+# Largest page size files.list accepts
+_LIST_PAGE_SIZE = 1000
+# Brain folder id and folder listings change rarely; reuse them for this long
+_META_CACHE_TTL = 600
+# Characters of extracted text each indexer keeps, across runs, for files it sees again
+# (copies of the same content, files whose indexing failed and is retried)
+_CONTENT_CACHE_CHARS = 8 * 1024 * 1024
+# Most recent per-file details kept in the scan results when no sink is given
+_MAX_FILE_DETAILS = 1000
+# Long-lived indexers kept per user; the least recently used one is closed beyond this
+_MAX_INDEXERS = 32
+
+# Drive queries and the minimal field projections each lister consumes
+_BRAIN_QUERY = "name='DigitalTwin_Brain' and mimeType='application/vnd.google-apps.folder'"
+_SUBFOLDERS_QUERY = "'{}' in parents and mimeType='application/vnd.google-apps.folder'"
+_FILES_QUERY = "{} and mimeType!='application/vnd.google-apps.folder'"
+_FOLDER_FIELDS = 'files(id, name, modifiedTime)'
+_FILE_FIELDS = 'files(id, name, md5Checksum, modifiedTime)'
+_BULK_FILE_FIELDS = 'files(id, name, md5Checksum, modifiedTime, parents)'
+_CHANGE_FIELDS = ('nextPageToken, newStartPageToken, '
+                  'changes(fileId, removed, file(id, name, md5Checksum, modifiedTime, parents, mimeType, trashed))')
+_FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+# changes.list statuses meaning the saved page token is no longer usable
+_INVALID_TOKEN_STATUSES = frozenset({400, 404, 410})
+
+DetailsSink = Callable[[Dict[str, Any]], None]
+# Default location of the indexed-file database used to skip unchanged files
+_INDEX_DB_PATH = Path("~/.digitaltwin/index_state.db").expanduser()
+# Default location of the per-user Drive changes page tokens
+_DRIVE_STATE_PATH = Path("~/.digitaltwin/drive_state.json").expanduser()
+# Filename characters replaced with '_' when building memory ids
+_MEMORY_ID_TRANS = str.maketrans({'.': '_', ' ': '_'})
+
+# Agent name -> (agent type, department)
+_AGENT_MAPPINGS = types.MappingProxyType({
+    "bdm": (AgentType.BDM, "business_development"),
+    "ipm": (AgentType.IPM, "business_development"),
+    "presales_engineer": (AgentType.PRESALES_ENGINEER, "business_development"),
+    "content": (AgentType.CONTENT, "marketing"),
+    "seo": (AgentType.SEO, "marketing"),
+    "analytics": (AgentType.ANALYTICS, "marketing"),
+    "cmo": (AgentType.CMO, "executive"),
+    "head_of_operations": (AgentType.HEAD_OF_OPERATIONS, "operations"),
+    "senior_csm": (AgentType.SENIOR_CSM, "operations"),
+    "legal": (AgentType.LEGAL, "operations"),
+})
+
+# Agent type -> role of the synthetic indexer user; unlisted types map to EMPLOYEE
+_ROLE_MAPPINGS = types.MappingProxyType({
+    AgentType.BDM: UserRole.BDM_AGENT,
+    AgentType.CONTENT: UserRole.CONTENT_AGENT,
+    AgentType.CMO: UserRole.CMO,
+    AgentType.LEGAL: UserRole.LEGAL_AGENT,
+})
+
+# Drive errors worth retrying, and the cap on any single wait between attempts
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_RETRY_WAIT = 60
+_retry_backoff = wait_exponential_jitter(initial=1, max=_MAX_RETRY_WAIT)
+
+
+def _is_retryable_drive_error(exc: BaseException) -> bool:
+    """Throttling (429) and transient server errors from the Drive API"""
+    return isinstance(exc, HttpError) and getattr(exc.resp, 'status', None) in _RETRYABLE_STATUSES
+
+
+def _retry_wait(retry_state) -> float:
+    """Honor a server-given Retry-After (in seconds), else exponential backoff with jitter"""
+    exc = retry_state.outcome.exception()
+    try:
+        retry_after = float(exc.resp.get('retry-after'))
+    except (AttributeError, TypeError, ValueError):
+        return _retry_backoff(retry_state)
+    return min(max(retry_after, 0.0), _MAX_RETRY_WAIT)
+
+
+# Retry policy shared by every Drive call the indexer makes
+_drive_retry = retry(
+    retry=retry_if_exception(_is_retryable_drive_error),
+    wait=_retry_wait,
+    stop=stop_after_attempt(6),
+    before_sleep=lambda retry_state: logger.warning(
+        "⏳ Drive backoff (attempt %d): %s", retry_state.attempt_number, retry_state.outcome.exception()
+    ),
+    reraise=True
+)
+
+
+@_drive_retry
+def _execute_with_retry(request, http: Optional[httplib2.Http] = None):
+    """Execute a googleapiclient request, retrying throttled and transient failures"""
+    return request.execute(http=http)
+
+
+@_drive_retry
+def _next_chunk_with_retry(downloader: MediaIoBaseDownload):
+    """Fetch the next chunk of a media download; a failed chunk is re-requested from the same offset"""
+    return downloader.next_chunk()
+
+
+# FileProcessor owned by each extraction worker process
+_worker_processor: Optional[FileProcessor] = None
+
+
+def _extract_text_worker(file_content: bytes, file_name: str) -> Optional[str]:
+    """Extract text in a worker process; module-level so the process pool can pickle it"""
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = FileProcessor()
+    return _worker_processor.extract_text_from_bytes(file_content, file_name)
+
+
 class AutomaticFileIndexer:
     """Automatically indexes Google Drive files into the dual memory RBAC system"""
     
-    def __init__(self, user_id: str):
+    def __init__(self, user_id: str, index_db_path: Optional[str] = None,
+                 drive_state_path: Optional[str] = None):
         """
         Initialize the automatic file indexer
         
         Args:
             user_id: User ID to use for Google Drive access
+            index_db_path: SQLite database recording which file versions are indexed
+            drive_state_path: JSON file holding the Drive changes page token per user
         """
         self.user_id = user_id
         self.rbac_service = get_unified_rbac_service()
@@ -37,8 +175,34 @@ class AutomaticFileIndexer:
         self.file_processor = FileProcessor()
         self.auth_manager = AuthManager()
         
-        # Cache for processed files to avoid reprocessing
-        self.processed_files = set()
+        # Persistent record of indexed file versions and folder states, shared by every indexer process
+        self.index_db_path = Path(index_db_path) if index_db_path else _INDEX_DB_PATH
+        self._db = self._open_index_db(self.index_db_path)
+        
+        # Drive changes.list page tokens for incremental sync
+        self.drive_state_path = Path(drive_state_path) if drive_state_path else _DRIVE_STATE_PATH
+        
+        # Cached Drive lookups for the Brain folder and its subfolder listing
+        self._meta_cache = TTLCache(maxsize=64, ttl=_META_CACHE_TTL)
+        
+        # Extracted text per file version, so repeated references skip download + extraction;
+        # lives as long as the indexer, which run_automatic_indexing keeps per user
+        self._content_cache = LRUCache(maxsize=_CONTENT_CACHE_CHARS, getsizeof=len)
+        
+        # Synthetic indexer users, built once per agent
+        self._user_cache: Dict[str, User] = {}
+        
+        # Bounds on files indexed and Drive listing calls at once; asyncio primitives
+        # belong to one event loop, so they are (re)created by _bind_loop on each run
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._drive_sem: Optional[asyncio.Semaphore] = None
+        # Blocking googleapiclient calls run here so they don't stall the event loop
+        self._executor = ThreadPoolExecutor(max_workers=_DRIVE_CONCURRENCY, thread_name_prefix="indexer")
+        # httplib2.Http is not thread-safe, so each executor thread gets its own authorized client
+        self._thread_state = threading.local()
+        # CPU-bound text extraction (PDF/DOCX parsing) runs across cores; started on first use
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
         
         # Folder mapping for determining agent and department
         self.folder_mappings = {
@@ -50,11 +214,162 @@ class AutomaticFileIndexer:
             
             # Private folder patterns (will be detected by name ending with "_private")
         }
+        
+        # Public folder configs expanded once, with the metadata shared by all their files
+        self._public_folders = {
+            folder: {
+                "department": cfg["department"],
+                "agents": tuple(cfg["agents"]),
+                "base_metadata": {
+                    "source": "google_drive",
+                    "folder": folder,
+                    "department": cfg["department"],
+                    "confidentiality": "public"
+                }
+            }
+            for folder, cfg in self.folder_mappings.items() if cfg["type"] == "public"
+        }
     
-    async def scan_and_index_all_files(self) -> Dict[str, Any]:
-        """Scan all files in DigitalTwin_Brain and index them appropriately"""
-        logger.info(f"🔍 Starting automatic file indexing for user {self.user_id}")
+    async def scan_and_index_all_files(self, details_sink: Optional[DetailsSink] = None) -> Dict[str, Any]:
+        """
+        Scan all files in DigitalTwin_Brain and index them appropriately
+        
+        Args:
+            details_sink: Called with a detail dict for every indexed file. When omitted,
+                the last _MAX_FILE_DETAILS details are returned in "file_details".
+        
+        Returns:
+            Aggregated indexing counts and file details
+        """
+        logger.info("🔍 Starting automatic file indexing for user %s", self.user_id)
+        self._bind_loop()
+        return await self._index(self._collect_all_files, details_sink)
+    
+    async def sync_changes(self, details_sink: Optional[DetailsSink] = None) -> Dict[str, Any]:
+        """
+        Index only the files changed since the previous sync, using Drive's changes feed
+        
+        The first call records a start page token and runs a full scan; later calls read
+        changes.list from the saved token and route changed files through the usual
+        folder processing. Removed or trashed files are deleted from memory, and a saved
+        token Drive no longer accepts falls back to a full scan that re-seeds it.
+        
+        Args:
+            details_sink: Called with a detail dict for every indexed file
+        
+        Returns:
+            Aggregated indexing counts and file details, as for scan_and_index_all_files,
+            plus the number of "removed_files"
+        """
+        self._bind_loop()
+        page_token = self._load_page_token()
+        
+        if not page_token:
+            return await self._full_sync(details_sink)
+        
+        logger.info("🔄 Starting incremental Drive sync for user %s", self.user_id)
+        new_token = None
+        token_rejected = False
+        removal_results = {"removed": 0, "errors": 0}
         
+        async def collect_changed_files():
+            nonlocal new_token, token_rejected, removal_results
+            try:
+                changed_files, removed_ids, new_token = await self._list_changes(page_token)
+            except HttpError as e:
+                if getattr(e.resp, 'status', None) not in _INVALID_TOKEN_STATUSES:
+                    raise
+                logger.warning("⚠️ Drive rejected the saved page token for user %s: %s", self.user_id, e)
+                token_rejected = True
+                return None
+            removal_results = await self._remove_files(removed_ids)
+            return await self._group_changed_files(changed_files)
+        
+        results = await self._index(collect_changed_files, details_sink)
+        if token_rejected:
+            logger.info("🔍 Falling back to a full scan for user %s", self.user_id)
+            return await self._full_sync(details_sink)
+        
+        results["removed_files"] = removal_results["removed"]
+        results["errors"] += removal_results["errors"]
+        if new_token:
+            self._save_page_token(new_token)
+        return results
+    
+    async def _full_sync(self, details_sink: Optional[DetailsSink] = None) -> Dict[str, Any]:
+        """Full scan that (re)seeds the changes page token for later incremental syncs"""
+        # Take the token before scanning so changes made during the scan are not lost
+        try:
+            start_token = await self._get_start_page_token()
+        except Exception as e:
+            logger.error("Error getting Drive start page token: %s", e)
+            start_token = None
+        
+        results = await self.scan_and_index_all_files(details_sink)
+        results["removed_files"] = 0
+        if start_token:
+            self._save_page_token(start_token)
+        return results
+    
+    async def _remove_files(self, file_ids: List[str]) -> Dict[str, int]:
+        """
+        Delete the memories of files removed from Drive, and forget their indexed versions
+        
+        A file's index row is only dropped once its memories are gone, so a failed delete
+        still leaves the row describing memories that exist.
+        
+        Args:
+            file_ids: Drive ids of removed or trashed files
+            
+        Returns:
+            Counts of "removed" files and delete "errors"
+        """
+        results = {"removed": 0, "errors": 0}
+        
+        for file_id in file_ids:
+            entry = self._indexed_entry(file_id)
+            if entry is None:
+                continue
+            memory_id, confidentiality, agent_names = entry
+            
+            if memory_id and agent_names:
+                is_private = confidentiality == "private"
+                delete_memories = (self.rbac_service.delete_private_memory_bulk if is_private
+                                   else self.rbac_service.delete_public_memory_bulk)
+                user = self._get_user_for_agent(agent_names[0])
+                items = [{"agent_name": agent_name, "memory_id": memory_id} for agent_name in agent_names]
+                try:
+                    successes = await self._run_blocking(delete_memories, user, items) if user else []
+                except Exception as e:
+                    logger.error("❌ Error removing memories of file %s: %s", file_id, e)
+                    successes = []
+                if not successes or not all(successes):
+                    results["errors"] += 1
+                    logger.error("❌ Failed to remove %s memory %s for removed file %s",
+                                 confidentiality, memory_id, file_id)
+                    continue
+            else:
+                logger.info("No memory recorded for removed file %s; forgetting its index state", file_id)
+            
+            self._forget_indexed(file_id)
+            results["removed"] += 1
+            logger.info("🗑️ Removed file %s from memory", file_id)
+        
+        return results
+    
+    async def _index(self, collect_files: Callable[[], Any],
+                     details_sink: Optional[DetailsSink] = None) -> Dict[str, Any]:
+        """
+        Index the files gathered by collect_files, folder by folder
+        
+        Args:
+            collect_files: Coroutine function returning (folders, files_by_folder), or None
+                when there is nothing to index
+            details_sink: Called with a detail dict for every indexed file
+        
+        Returns:
+            Aggregated indexing counts and file details
+        """
         results = {
             "public_files_indexed": 0,
             "private_files_indexed": 0,
@@ -63,81 +378,163 @@ class AutomaticFileIndexer:
             "file_details": []
         }
         
+        recent_details = None
+        if details_sink is None:
+            recent_details = deque(maxlen=_MAX_FILE_DETAILS)
+            details_sink = recent_details.append
+        
         try:
-            # Find the DigitalTwin_Brain folder
-            brain_folder = await self._find_brain_folder()
-            if not brain_folder:
-                logger.error("DigitalTwin_Brain folder not found")
+            collected = await collect_files()
+            if collected is None:
                 return results
+            folders, files_by_folder = collected
             
-            logger.info(f"Found DigitalTwin_Brain folder: {brain_folder['name']}")
-            
-            # Get all folders in DigitalTwin_Brain
-            folders = await self._get_folders_in_brain(brain_folder['id'])
+            # Process all folders concurrently; files inside each folder are
+            # further bounded by the file semaphore
+            folder_results_list = await asyncio.gather(
+                *(self._process_folder(folder, files_by_folder.get(folder['id'], []), details_sink)
+                  for folder in folders),
+                return_exceptions=True
+            )
             
-            # Process each folder
-            for folder in folders:
-                folder_results = await self._process_folder(folder)
+            for folder, folder_results in zip(folders, folder_results_list):
+                if isinstance(folder_results, BaseException):
+                    results["errors"] += 1
+                    logger.error("Error processing folder '%s': %s", folder['name'], folder_results)
+                    continue
                 
                 # Aggregate results
                 results["public_files_indexed"] += folder_results["public_files"]
                 results["private_files_indexed"] += folder_results["private_files"]
                 results["errors"] += folder_results["errors"]
                 results["skipped_files"] += folder_results["skipped"]
-                results["file_details"].extend(folder_results["details"])
                 
-                logger.info(f"📁 Processed folder '{folder['name']}': "
-                          f"{folder_results['public_files']} public, "
-                          f"{folder_results['private_files']} private, "
-                          f"{folder_results['errors']} errors")
+                logger.info("📁 Processed folder '%s': %d public, %d private, %d errors",
+                            folder['name'], folder_results['public_files'],
+                            folder_results['private_files'], folder_results['errors'])
             
             total_indexed = results["public_files_indexed"] + results["private_files_indexed"]
-            logger.info(f"✅ Indexing complete: {total_indexed} files indexed, {results['errors']} errors")
+            logger.info("✅ Indexing complete: %d files indexed, %d errors", total_indexed, results['errors'])
             
         except Exception as e:
-            logger.error(f"Error during automatic file indexing: {e}")
+            logger.error("Error during automatic file indexing: %s", e)
             results["errors"] += 1
         
+        finally:
+            if recent_details is not None:
+                results["file_details"] = list(recent_details)
+        
         return results
     
+    async def _collect_all_files(self) -> Optional[Tuple[List[Dict], Dict[str, List[Dict]]]]:
+        """List every Brain folder and the files of the indexable ones"""
+        # Find the DigitalTwin_Brain folder
+        brain_folder = await self._find_brain_folder()
+        if not brain_folder:
+            logger.error("DigitalTwin_Brain folder not found")
+            return None
+        
+        logger.info("Found DigitalTwin_Brain folder: %s", brain_folder['name'])
+        
+        # Get all folders in DigitalTwin_Brain; always fresh here, since their
+        # modifiedTime is what tells us whether a known-empty folder changed
+        folders = await self._get_folders_in_brain(brain_folder['id'], refresh=True)
+        
+        # List the files of every folder we index in one bulk query, leaving out
+        # folders that were empty last time and have not changed since
+        folder_states = self._load_folder_states()
+        indexable_ids = [
+            folder['id'] for folder in folders
+            if (folder['name'] in self._public_folders or folder['name'].endswith('_private'))
+            and not self._is_known_empty(folder, folder_states)
+        ]
+        files_by_folder = await self._get_files_in_folders_bulk(indexable_ids)
+        self._record_folder_states(folders, files_by_folder)
+        
+        return folders, files_by_folder
+    
+    async def _group_changed_files(self, changed_files: List[Dict]) -> Optional[Tuple[List[Dict], Dict[str, List[Dict]]]]:
+        """Group changed files under the Brain folders that contain them"""
+        brain_folder = await self._find_brain_folder()
+        if not brain_folder:
+            logger.error("DigitalTwin_Brain folder not found")
+            return None
+        
+        folders_by_id = {folder['id']: folder for folder in await self._get_folders_in_brain(brain_folder['id'])}
+        
+        files_by_folder: Dict[str, List[Dict]] = {}
+        for file_info in changed_files:
+            for parent_id in file_info.get('parents', []):
+                if parent_id in folders_by_id:
+                    files_by_folder.setdefault(parent_id, []).append(file_info)
+        
+        logger.info("Found %d changed files in %d Brain folders",
+                    sum(len(files) for files in files_by_folder.values()), len(files_by_folder))
+        return [folders_by_id[folder_id] for folder_id in files_by_folder], files_by_folder
+    
     async def _find_brain_folder(self) -> Optional[Dict]:
         """Find the DigitalTwin_Brain folder"""
+        cached = self._meta_cache.get('brain')
+        if cached is not None:
+            return cached
+        
         try:
-            query = "name='DigitalTwin_Brain' and mimeType='application/vnd.google-apps.folder'"
-            response = self.drive_manager.service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(id, name, parents, mimeType)'
-            ).execute()
-            
-            files = response.get('files', [])
+            files = await self._list_all(_BRAIN_QUERY, _FOLDER_FIELDS)
             if files:
+                self._meta_cache['brain'] = files[0]
                 return files[0]  # Return the first match
             return None
             
         except Exception as e:
-            logger.error(f"Error finding DigitalTwin_Brain folder: {e}")
+            logger.error("Error finding DigitalTwin_Brain folder: %s", e)
             return None
     
-    async def _get_folders_in_brain(self, brain_folder_id: str) -> List[Dict]:
-        """Get all folders inside DigitalTwin_Brain"""
+    async def _get_folders_in_brain(self, brain_folder_id: str, refresh: bool = False) -> List[Dict]:
+        """Get all folders inside DigitalTwin_Brain, from the cache unless refresh is set"""
+        cache_key = ('folders', brain_folder_id)
+        cached = None if refresh else self._meta_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            query = f"'{brain_folder_id}' in parents and mimeType='application/vnd.google-apps.folder'"
-            response = self.drive_manager.service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(id, name, parents, mimeType)'
-            ).execute()
-            
-            return response.get('files', [])
+            folders = await self._list_all(_SUBFOLDERS_QUERY.format(brain_folder_id), _FOLDER_FIELDS)
+            self._meta_cache[cache_key] = folders
+            return folders
             
         except Exception as e:
-            logger.error(f"Error getting folders in DigitalTwin_Brain: {e}")
+            logger.error("Error getting folders in DigitalTwin_Brain: %s", e)
             return []
     
-    async def _process_folder(self, folder: Dict) -> Dict[str, Any]:
-        """Process all files in a folder"""
-        results = {"public_files": 0, "private_files": 0, "errors": 0, "skipped": 0, "details": []}
+    @staticmethod
+    def _is_known_empty(folder: Dict, folder_states: Dict[str, Tuple[str, int]]) -> bool:
+        """Whether the folder had no files on a previous scan and its modifiedTime is unchanged"""
+        modified_time = folder.get('modifiedTime')
+        return modified_time is not None and folder_states.get(folder['id']) == (modified_time, 0)
+    
+    def _load_folder_states(self) -> Dict[str, Tuple[str, int]]:
+        """(modifiedTime, file count) per folder, as recorded by previous scans"""
+        try:
+            rows = self._db.execute('SELECT folder_id, modified_time, file_count FROM folder_state').fetchall()
+        except sqlite3.Error as e:
+            logger.warning("Could not read folder states: %s", e)
+            return {}
+        return {folder_id: (modified_time, file_count) for folder_id, modified_time, file_count in rows}
+    
+    def _record_folder_states(self, folders: List[Dict], files_by_folder: Dict[str, List[Dict]]):
+        """Persist (modifiedTime, file count) for every folder successfully listed in this scan"""
+        rows = [
+            (folder['id'], folder.get('modifiedTime'), len(files_by_folder[folder['id']]))
+            for folder in folders if folder['id'] in files_by_folder
+        ]
+        try:
+            self._db.executemany('INSERT OR REPLACE INTO folder_state VALUES(?,?,?)', rows)
+        except sqlite3.Error as e:
+            logger.error("Error saving folder states: %s", e)
+    
+    async def _process_folder(self, folder: Dict, files: Optional[List[Dict]] = None,
+                              details_sink: Optional[DetailsSink] = None) -> Dict[str, Any]:
+        """Process all files in a folder, listing them unless already provided"""
+        results = {"public_files": 0, "private_files": 0, "errors": 0, "skipped": 0}
         
         folder_name = folder['name']
         folder_id = folder['id']
@@ -151,235 +548,525 @@ class AutomaticFileIndexer:
             agent_type, department = self._get_agent_info(agent_name)
             
             if not agent_type:
-                logger.warning(f"Unknown agent for private folder: {folder_name}")
+                logger.warning("Unknown agent for private folder: %s", folder_name)
                 results["errors"] += 1
                 return results
             
             # Process private files
-            folder_results = await self._process_private_folder(folder_id, agent_name, agent_type, department)
+            folder_results = await self._process_private_folder(
+                folder_id, agent_name, agent_type, department, files, details_sink
+            )
             
         else:
             # Check if this is a known department folder
-            if folder_name in self.folder_mappings:
-                dept_config = self.folder_mappings[folder_name]
-                
+            dept_config = self._public_folders.get(folder_name)
+            if dept_config:
                 # Process public department files
-                folder_results = await self._process_public_folder(folder_id, folder_name, dept_config)
+                folder_results = await self._process_public_folder(folder_id, folder_name, dept_config, files, details_sink)
             else:
-                logger.info(f"Skipping unknown folder: {folder_name}")
+                logger.info("Skipping unknown folder: %s", folder_name)
                 results["skipped"] += 1
                 return results
         
         # Merge results
         for key in ["public_files", "private_files", "errors", "skipped"]:
             results[key] += folder_results.get(key, 0)
-        results["details"].extend(folder_results.get("details", []))
         
         return results
     
-    async def _process_public_folder(self, folder_id: str, folder_name: str, dept_config: Dict) -> Dict[str, Any]:
+    async def _process_public_folder(self, folder_id: str, folder_name: str, dept_config: Dict,
+                                     files: Optional[List[Dict]] = None,
+                                     details_sink: Optional[DetailsSink] = None) -> Dict[str, Any]:
         """Process files in a public department folder"""
-        results = {"public_files": 0, "private_files": 0, "errors": 0, "skipped": 0, "details": []}
+        results = {"public_files": 0, "private_files": 0, "errors": 0, "skipped": 0}
         
         try:
             # Get all files in the folder
-            files = await self._get_files_in_folder(folder_id)
+            if files is None:
+                files = await self._get_files_in_folder(folder_id)
             
             # Get a representative user for this department (use first agent)
-            user = await self._get_user_for_agent(dept_config["agents"][0])
+            user = self._get_user_for_agent(dept_config["agents"][0])
             if not user:
-                logger.error(f"No user found for department {folder_name}")
+                logger.error("No user found for department %s", folder_name)
                 results["errors"] += 1
                 return results
             
-            # Process each file
-            for file_info in files:
-                try:
-                    # Download and extract content
-                    content = await self._extract_file_content(file_info)
-                    if not content:
-                        results["skipped"] += 1
-                        continue
-                    
-                    # Index into public memory for each agent in the department
-                    for agent_name in dept_config["agents"]:
-                        memory_id = f"public_{file_info['name'].replace('.', '_').replace(' ', '_').lower()}_{file_info['id']}"
-                        
-                        success = self.rbac_service.add_public_memory(
-                            user=user,
-                            agent_name=agent_name,
-                            memory_id=memory_id,
-                            content=content,
-                            metadata={
-                                "filename": file_info['name'],
-                                "source": "google_drive",
-                                "folder": folder_name,
-                                "file_id": file_info['id'],
-                                "department": dept_config["department"],
-                                "confidentiality": "public"
-                            }
-                        )
-                        
-                        if success:
-                            results["public_files"] += 1
-                            results["details"].append({
-                                "file": file_info['name'],
-                                "type": "public",
-                                "agent": agent_name,
-                                "department": dept_config["department"]
-                            })
-                            logger.info(f"✅ Indexed public file '{file_info['name']}' for agent {agent_name}")
-                        else:
-                            results["errors"] += 1
-                            logger.error(f"❌ Failed to index public file '{file_info['name']}' for agent {agent_name}")
-                
-                except Exception as e:
-                    results["errors"] += 1
-                    logger.error(f"Error processing public file {file_info.get('name', 'unknown')}: {e}")
+            # Process files concurrently, bounded by the file semaphore
+            file_results = await asyncio.gather(
+                *(self._handle_file(file_info, user, dept_config["agents"], dept_config["base_metadata"],
+                                    details_sink)
+                  for file_info in files),
+                return_exceptions=True
+            )
+            self._merge_file_results(results, files, file_results, "public")
         
         except Exception as e:
             results["errors"] += 1
-            logger.error(f"Error processing public folder {folder_name}: {e}")
+            logger.error("Error processing public folder %s: %s", folder_name, e)
         
         return results
     
-    async def _process_private_folder(self, folder_id: str, agent_name: str, agent_type: AgentType, department: str) -> Dict[str, Any]:
+    async def _process_private_folder(self, folder_id: str, agent_name: str, agent_type: AgentType, department: str,
+                                      files: Optional[List[Dict]] = None,
+                                      details_sink: Optional[DetailsSink] = None) -> Dict[str, Any]:
         """Process files in a private agent folder"""
-        results = {"public_files": 0, "private_files": 0, "errors": 0, "skipped": 0, "details": []}
+        results = {"public_files": 0, "private_files": 0, "errors": 0, "skipped": 0}
         
         try:
             # Get user for this agent
-            user = await self._get_user_for_agent(agent_name)
+            user = self._get_user_for_agent(agent_name)
             if not user:
-                logger.error(f"No user found for agent {agent_name}")
+                logger.error("No user found for agent %s", agent_name)
                 results["errors"] += 1
                 return results
             
             # Get all files in the private folder
-            files = await self._get_files_in_folder(folder_id)
+            if files is None:
+                files = await self._get_files_in_folder(folder_id)
             
-            # Process each file
-            for file_info in files:
-                try:
-                    # Download and extract content
-                    content = await self._extract_file_content(file_info)
-                    if not content:
-                        results["skipped"] += 1
-                        continue
-                    
-                    # Index into private memory
-                    memory_id = f"private_{file_info['name'].replace('.', '_').replace(' ', '_').lower()}_{file_info['id']}"
-                    
-                    success = self.rbac_service.add_private_memory(
-                        user=user,
-                        agent_name=agent_name,
-                        memory_id=memory_id,
-                        content=content,
-                        metadata={
-                            "filename": file_info['name'],
-                            "source": "google_drive", 
-                            "folder": f"{agent_name}_private",
-                            "file_id": file_info['id'],
-                            "agent": agent_name,
-                            "department": department,
-                            "confidentiality": "private"
-                        }
-                    )
-                    
-                    if success:
-                        results["private_files"] += 1
-                        results["details"].append({
+            base_metadata = {
+                "source": "google_drive",
+                "folder": f"{agent_name}_private",
+                "agent": agent_name,
+                "department": department,
+                "confidentiality": "private"
+            }
+            
+            # Process files concurrently, bounded by the file semaphore
+            file_results = await asyncio.gather(
+                *(self._handle_file(file_info, user, (agent_name,), base_metadata, details_sink)
+                  for file_info in files),
+                return_exceptions=True
+            )
+            self._merge_file_results(results, files, file_results, "private")
+        
+        except Exception as e:
+            results["errors"] += 1
+            logger.error("Error processing private folder for agent %s: %s", agent_name, e)
+        
+        return results
+    
+    async def _handle_file(self, file_info: Dict, user: User, agent_names: Tuple[str, ...],
+                           base_metadata: Dict[str, str],
+                           details_sink: Optional[DetailsSink] = None) -> Dict[str, Any]:
+        """
+        Extract a single file and index it for each of the given agents
+        
+        Args:
+            file_info: Drive file metadata (id, name, ...)
+            user: User performing the memory writes
+            agent_names: Agents whose memory receives the file
+            base_metadata: Folder-level metadata (source, folder, department, confidentiality, ...)
+            details_sink: Receives a detail dict for every successful agent write
+            
+        Returns:
+            Per-file results dict with the same keys as the folder results
+        """
+        results = {"public_files": 0, "private_files": 0, "errors": 0, "skipped": 0}
+        confidentiality = base_metadata["confidentiality"]
+        department = base_metadata["department"]
+        is_private = confidentiality == "private"
+        add_memories = (self.rbac_service.add_private_memory_bulk if is_private
+                        else self.rbac_service.add_public_memory_bulk)
+        counter = "private_files" if is_private else "public_files"
+        
+        # Skip files whose Drive version was already indexed
+        version = self._file_version(file_info)
+        if version and self._indexed_version(file_info['id']) == version:
+            results["skipped"] += 1
+            return results
+        
+        async with self._sem:
+            # Download and extract content
+            content = await self._extract_file_content(file_info)
+            if not content:
+                results["skipped"] += 1
+                return results
+            
+            # Built once per file and shared by every agent write
+            memory_id = f"{confidentiality}_{file_info['name'].lower().translate(_MEMORY_ID_TRANS)}_{file_info['id']}"
+            metadata = {**base_metadata, "filename": file_info['name'], "file_id": file_info['id']}
+            
+            # Write to every agent in one bulk call; each item gets its own
+            # metadata copy since the memory manager updates it in place
+            items = [
+                {"agent_name": agent_name, "memory_id": memory_id, "content": content, "metadata": dict(metadata)}
+                for agent_name in agent_names
+            ]
+            try:
+                successes = await self._run_blocking(add_memories, user, items)
+            except Exception as e:
+                successes = [e] * len(agent_names)
+            
+            for agent_name, success in zip(agent_names, successes):
+                if isinstance(success, BaseException):
+                    results["errors"] += 1
+                    logger.error("❌ Error indexing %s file '%s' for agent %s: %s",
+                                 confidentiality, file_info['name'], agent_name, success)
+                elif success:
+                    results[counter] += 1
+                    if details_sink is not None:
+                        details_sink({
                             "file": file_info['name'],
-                            "type": "private",
+                            "type": confidentiality,
                             "agent": agent_name,
                             "department": department
                         })
-                        logger.info(f"🔒 Indexed private file '{file_info['name']}' for agent {agent_name}")
-                    else:
-                        results["errors"] += 1
-                        logger.error(f"❌ Failed to index private file '{file_info['name']}' for agent {agent_name}")
-                
-                except Exception as e:
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info("%s Indexed %s file '%s' for agent %s",
+                                    "🔒" if is_private else "✅", confidentiality, file_info['name'], agent_name)
+                else:
                     results["errors"] += 1
-                    logger.error(f"Error processing private file {file_info.get('name', 'unknown')}: {e}")
+                    logger.error("❌ Failed to index %s file '%s' for agent %s",
+                                 confidentiality, file_info['name'], agent_name)
         
-        except Exception as e:
-            results["errors"] += 1
-            logger.error(f"Error processing private folder for agent {agent_name}: {e}")
+        if version and not results["errors"]:
+            self._record_indexed(file_info['id'], version, memory_id, confidentiality, agent_names)
         
         return results
     
+    @staticmethod
+    def _file_version(file_info: Dict) -> Optional[str]:
+        """Content version of a Drive file: md5Checksum, or modifiedTime for native Google files"""
+        return file_info.get('md5Checksum') or file_info.get('modifiedTime')
+    
+    @staticmethod
+    def _open_index_db(path: Path) -> sqlite3.Connection:
+        """Open the indexer state database (indexed files, folder states) in WAL mode so parallel indexers can share it"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # A long-lived indexer may be driven from more than one thread over its lifetime
+        db = sqlite3.connect(path, isolation_level=None, timeout=30, check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.execute('CREATE TABLE IF NOT EXISTS indexed(file_id TEXT PRIMARY KEY, md5 TEXT, ts REAL, '
+                   'memory_id TEXT, confidentiality TEXT, agents TEXT)')
+        # Databases from before memories were recorded per file gain the columns in place
+        columns = {row[1] for row in db.execute('PRAGMA table_info(indexed)')}
+        for column in ('memory_id', 'confidentiality', 'agents'):
+            if column not in columns:
+                try:
+                    db.execute(f'ALTER TABLE indexed ADD COLUMN {column} TEXT')
+                except sqlite3.OperationalError:
+                    pass  # added concurrently by another indexer
+        db.execute('CREATE TABLE IF NOT EXISTS folder_state('
+                   'folder_id TEXT PRIMARY KEY, modified_time TEXT, file_count INTEGER)')
+        return db
+    
+    def _indexed_version(self, file_id: str) -> Optional[str]:
+        """Version of a file recorded at its last successful indexing, if any"""
+        try:
+            row = self._db.execute('SELECT md5 FROM indexed WHERE file_id=?', (file_id,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Could not read index state for %s: %s", file_id, e)
+            return None
+        return row[0] if row else None
+    
+    def _record_indexed(self, file_id: str, version: str, memory_id: str, confidentiality: str,
+                        agent_names: Tuple[str, ...]):
+        """Record that this version of a file is fully indexed, and which memories hold it"""
+        try:
+            self._db.execute(
+                'INSERT OR REPLACE INTO indexed(file_id, md5, ts, memory_id, confidentiality, agents) '
+                'VALUES(?,?,?,?,?,?)',
+                (file_id, version, time.time(), memory_id, confidentiality, json.dumps(list(agent_names)))
+            )
+        except sqlite3.Error as e:
+            logger.error("Error saving index state for %s: %s", file_id, e)
+    
+    def _indexed_entry(self, file_id: str) -> Optional[Tuple[Optional[str], Optional[str], List[str]]]:
+        """(memory id, confidentiality, agent names) recorded for an indexed file, or None if not indexed"""
+        try:
+            row = self._db.execute('SELECT memory_id, confidentiality, agents FROM indexed WHERE file_id=?',
+                                   (file_id,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Could not read index state for %s: %s", file_id, e)
+            return None
+        if row is None:
+            return None
+        memory_id, confidentiality, agents = row
+        return memory_id, confidentiality, json.loads(agents) if agents else []
+    
+    def _forget_indexed(self, file_id: str):
+        """Drop a file's indexed version, so it is indexed afresh if it comes back"""
+        try:
+            self._db.execute('DELETE FROM indexed WHERE file_id=?', (file_id,))
+        except sqlite3.Error as e:
+            logger.error("Error clearing index state for %s: %s", file_id, e)
+    
+    def _load_drive_state(self) -> Dict[str, Dict[str, str]]:
+        """Load the per-user Drive changes state from disk"""
+        try:
+            if self.drive_state_path.exists():
+                with open(self.drive_state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning("Could not load Drive state %s: %s", self.drive_state_path, e)
+        return {}
+    
+    def _load_page_token(self) -> Optional[str]:
+        """Saved changes.list page token for this user, if any"""
+        return self._load_drive_state().get(self.user_id, {}).get("pageToken")
+    
+    def _save_page_token(self, page_token: str):
+        """Persist the changes.list page token for this user"""
+        try:
+            state = self._load_drive_state()
+            state[self.user_id] = {"pageToken": page_token, "synced_at": datetime.now().isoformat()}
+            self._write_json_atomic(self.drive_state_path, state)
+        except Exception as e:
+            logger.error("Error saving Drive state %s: %s", self.drive_state_path, e)
+    
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Any):
+        """Write JSON through a temp file and os.replace so readers never see a partial file"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        os.replace(temp_path, path)
+    
+    @staticmethod
+    def _merge_file_results(results: Dict[str, Any], files: List[Dict], file_results: List[Any],
+                            confidentiality: str) -> None:
+        """Fold per-file results from asyncio.gather into the folder results"""
+        for file_info, file_result in zip(files, file_results):
+            if isinstance(file_result, BaseException):
+                results["errors"] += 1
+                logger.error("Error processing %s file %s: %s",
+                             confidentiality, file_info.get('name', 'unknown'), file_result)
+                continue
+            
+            for key in ["public_files", "private_files", "errors", "skipped"]:
+                results[key] += file_result[key]
+    
+    def _bind_loop(self):
+        """Create the concurrency semaphores for the running event loop, if not already bound to it"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._sem = asyncio.Semaphore(_FILE_CONCURRENCY)
+            self._drive_sem = asyncio.Semaphore(_DRIVE_CONCURRENCY)
+    
+    async def aclose(self):
+        """Shut down the indexer's thread and process pools and close the index database"""
+        self._executor.shutdown(wait=False)
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown(wait=False)
+        self._db.close()
+    
+    def _get_cpu_pool(self) -> ProcessPoolExecutor:
+        """Extraction process pool, created on first use"""
+        if self._cpu_pool is None:
+            # Workers come from a forkserver, not a fork of this process: forking while the
+            # Drive threads and event loop hold locks can deadlock the child
+            self._cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                                 mp_context=multiprocessing.get_context("forkserver"))
+        return self._cpu_pool
+    
+    async def _run_blocking(self, func, *args):
+        """Run a blocking call on the indexer thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    async def _execute(self, request) -> Dict:
+        """Execute a Drive request on the thread pool, with retries, over that thread's own HTTP client"""
+        return await self._run_blocking(self._execute_on_thread, request)
+    
+    def _execute_on_thread(self, request) -> Dict:
+        """Executor-side half of _execute"""
+        return _execute_with_retry(request, self._thread_http())
+    
+    def _download_on_thread(self, file_id: str) -> bytes:
+        """Download a file's bytes over the calling thread's HTTP client"""
+        request = self.drive_manager.service.files().get_media(fileId=file_id)
+        request.http = self._thread_http()
+        
+        buffer = io.BytesIO()
+        downloader = MediaIoBaseDownload(buffer, request)
+        done = False
+        while not done:
+            _, done = _next_chunk_with_retry(downloader)
+        return buffer.getvalue()
+    
+    def _thread_http(self) -> AuthorizedHttp:
+        """Authorized HTTP client owned by the calling thread, created on first use"""
+        http = getattr(self._thread_state, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self.drive_manager.credentials, http=httplib2.Http())
+            self._thread_state.http = http
+        return http
+    
+    async def _list_all(self, query: str, fields: str) -> List[Dict]:
+        """
+        Run a files.list query and follow nextPageToken until every page is read
+        
+        Args:
+            query: Drive search query
+            fields: Partial-response projection for the files, e.g. 'files(id, name)'
+            
+        Returns:
+            All matching files across pages
+        """
+        files = []
+        page_token = None
+        
+        while True:
+            async with self._drive_sem:
+                request = self.drive_manager.service.files().list(
+                    q=query,
+                    spaces='drive',
+                    pageSize=_LIST_PAGE_SIZE,
+                    pageToken=page_token,
+                    fields=f'nextPageToken, {fields}'
+                )
+                response = await self._execute(request)
+            
+            files.extend(response.get('files', []))
+            
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return files
+    
+    async def _get_start_page_token(self) -> Optional[str]:
+        """Get the Drive changes token marking the current state"""
+        async with self._drive_sem:
+            request = self.drive_manager.service.changes().getStartPageToken()
+            response = await self._execute(request)
+        return response.get('startPageToken')
+    
+    async def _list_changes(self, page_token: str) -> Tuple[List[Dict], List[str], Optional[str]]:
+        """
+        Read the Drive changes feed from a saved page token
+        
+        Args:
+            page_token: Token saved by the previous sync
+            
+        Returns:
+            Changed, non-trashed files (folders excluded), ids of removed or trashed
+            files, and the token for the next sync
+        """
+        changed_files = []
+        removed_ids = []
+        new_start_token = None
+        
+        while page_token:
+            async with self._drive_sem:
+                request = self.drive_manager.service.changes().list(
+                    pageToken=page_token,
+                    spaces='drive',
+                    pageSize=_LIST_PAGE_SIZE,
+                    fields=_CHANGE_FIELDS
+                )
+                response = await self._execute(request)
+            
+            for change in response.get('changes', []):
+                file_info = change.get('file')
+                if change.get('removed'):
+                    removed_ids.append(change['fileId'])
+                    continue
+                if not file_info or file_info.get('mimeType') == _FOLDER_MIME_TYPE:
+                    continue
+                if file_info.get('trashed'):
+                    removed_ids.append(file_info['id'])
+                    continue
+                changed_files.append(file_info)
+            
+            new_start_token = response.get('newStartPageToken', new_start_token)
+            page_token = response.get('nextPageToken')
+        
+        return changed_files, removed_ids, new_start_token
+    
     async def _get_files_in_folder(self, folder_id: str) -> List[Dict]:
         """Get all files in a folder (excluding subfolders)"""
         try:
-            query = f"'{folder_id}' in parents and mimeType!='application/vnd.google-apps.folder'"
-            response = self.drive_manager.service.files().list(
-                q=query,
-                spaces='drive',
-                fields='files(id, name, mimeType, size, modifiedTime)'
-            ).execute()
-            
-            return response.get('files', [])
+            query = _FILES_QUERY.format(f"'{folder_id}' in parents")
+            return await self._list_all(query, _FILE_FIELDS)
             
         except Exception as e:
-            logger.error(f"Error getting files in folder {folder_id}: {e}")
+            logger.error("Error getting files in folder %s: %s", folder_id, e)
             return []
     
-    async def _extract_file_content(self, file_info: Dict) -> Optional[str]:
-        """Extract text content from a file"""
-        try:
-            # Download file content
-            file_id = file_info['id']
-            file_name = file_info['name']
+    async def _get_files_in_folders_bulk(self, folder_ids: List[str]) -> Dict[str, List[Dict]]:
+        """
+        List the files (excluding subfolders) of many folders with OR-ed parent queries
+        
+        Args:
+            folder_ids: Drive folder ids to list
             
-            # Use GoogleDriveManager to download
-            content = self.drive_manager.download_file_content(file_id)
-            if not content:
-                logger.warning(f"No content downloaded for file {file_name}")
-                return None
+        Returns:
+            Mapping of folder id to the files it contains; folders whose listing
+            failed are absent
+        """
+        files_by_folder: Dict[str, List[Dict]] = {}
+        
+        for start in range(0, len(folder_ids), _BULK_LIST_CHUNK):
+            chunk = folder_ids[start:start + _BULK_LIST_CHUNK]
+            parents = " or ".join(f"'{folder_id}' in parents" for folder_id in chunk)
+            query = _FILES_QUERY.format(f"({parents})")
             
-            # Extract text using FileProcessor
-            if isinstance(content, bytes):
-                # Save to temp file for processing
-                import tempfile
-                with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file_name).suffix) as temp_file:
-                    temp_file.write(content)
-                    temp_path = temp_file.name
-                
-                try:
-                    text_content = self.file_processor.extract_text(temp_path)
-                finally:
-                    os.unlink(temp_path)  # Clean up temp file
-                
-                return text_content
-            else:
-                # Assume it's already text
-                return str(content)
+            try:
+                files = await self._list_all(query, _BULK_FILE_FIELDS)
+                chunk_files = {folder_id: [] for folder_id in chunk}
+                for file_info in files:
+                    for parent_id in file_info.get('parents', []):
+                        if parent_id in chunk_files:
+                            chunk_files[parent_id].append(file_info)
+                files_by_folder.update(chunk_files)
+            
+            except Exception as e:
+                logger.error("Error bulk listing files in %d folders: %s", len(chunk), e)
+        
+        return files_by_folder
+    
+    async def _extract_file_content(self, file_info: Dict) -> Optional[str]:
+        """Extract text content from a file, reusing text already extracted for the same content"""
+        cache_key = file_info.get('md5Checksum') or (file_info['id'], file_info.get('modifiedTime'))
+        content = self._content_cache.get(cache_key)
+        if content is not None:
+            return content
+        
+        content = await self._download_and_extract(file_info)
+        if content and len(content) <= self._content_cache.maxsize:
+            self._content_cache[cache_key] = content
+        return content
+    
+    async def _download_and_extract(self, file_info: Dict) -> Optional[str]:
+        """
+        Download a file from Drive and extract its text
+        
+        Drive errors that outlast the retries propagate, so the file is counted as an
+        error rather than skipped as empty.
+        """
+        file_id = file_info['id']
+        file_name = file_info['name']
+        
+        # Stream the file into memory, retrying throttled chunks like every other Drive call
+        content = await self._run_blocking(self._download_on_thread, file_id)
+        if not content:
+            logger.warning("No content downloaded for file %s", file_name)
+            return None
+        
+        try:
+            # Extract text straight from the downloaded bytes in the process pool
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_cpu_pool(), _extract_text_worker, content, file_name)
         
         except Exception as e:
-            logger.error(f"Error extracting content from file {file_info.get('name', 'unknown')}: {e}")
+            logger.error("Error extracting content from file %s: %s", file_info.get('name', 'unknown'), e)
             return None
     
-    def _get_agent_info(self, agent_name: str) -> tuple[Optional[AgentType], Optional[str]]:
+    @staticmethod
+    def _get_agent_info(agent_name: str) -> tuple[Optional[AgentType], Optional[str]]:
         """Get agent type and department for an agent name"""
-        # Map agent names to types and departments
-        agent_mappings = {
-            "bdm": (AgentType.BDM, "business_development"),
-            "ipm": (AgentType.IPM, "business_development"),
-            "presales_engineer": (AgentType.PRESALES_ENGINEER, "business_development"),
-            "content": (AgentType.CONTENT, "marketing"),
-            "seo": (AgentType.SEO, "marketing"),
-            "analytics": (AgentType.ANALYTICS, "marketing"),
-            "cmo": (AgentType.CMO, "executive"),
-            "head_of_operations": (AgentType.HEAD_OF_OPERATIONS, "operations"),
-            "senior_csm": (AgentType.SENIOR_CSM, "operations"),
-            "legal": (AgentType.LEGAL, "operations"),
-        }
-        
-        return agent_mappings.get(agent_name.lower(), (None, None))
+        return _AGENT_MAPPINGS.get(agent_name.lower(), (None, None))
     
-    async def _get_user_for_agent(self, agent_name: str) -> Optional[User]:
+    def _get_user_for_agent(self, agent_name: str) -> Optional[User]:
         """Get a user that has access to the specified agent"""
+        user = self._user_cache.get(agent_name)
+        if user is not None:
+            return user
+        
         try:
             # For demo purposes, create a synthetic user with appropriate access
             agent_type, department = self._get_agent_info(agent_name)
@@ -404,27 +1091,48 @@ class AutomaticFileIndexer:
             )
             user.agent_assignments = [assignment]
             
+            self._user_cache[agent_name] = user
             return user
             
         except Exception as e:
-            logger.error(f"Error creating user for agent {agent_name}: {e}")
+            logger.error("Error creating user for agent %s: %s", agent_name, e)
             return None
     
-    def _get_role_for_agent(self, agent_type: AgentType) -> UserRole:
+    @staticmethod
+    def _get_role_for_agent(agent_type: AgentType) -> UserRole:
         """Map agent type to appropriate user role"""
-        role_mappings = {
-            AgentType.BDM: UserRole.BDM_AGENT,
-            AgentType.CONTENT: UserRole.CONTENT_AGENT,
-            AgentType.CMO: UserRole.EXECUTIVE,
-            AgentType.LEGAL: UserRole.OPERATIONS_AGENT,
-        }
-        
-        return role_mappings.get(agent_type, UserRole.EMPLOYEE)
+        return _ROLE_MAPPINGS.get(agent_type, UserRole.EMPLOYEE)
+
+# Long-lived indexers per user, most recently used last, so Drive lookups and
+# extracted content stay cached from one indexing run to the next
+_indexers: Dict[str, AutomaticFileIndexer] = {}
+
+async def get_automatic_indexer(user_id: str) -> AutomaticFileIndexer:
+    """Get the long-lived indexer for a user, creating it on first use"""
+    indexer = _indexers.pop(user_id, None)
+    if indexer is None:
+        indexer = AutomaticFileIndexer(user_id)
+    _indexers[user_id] = indexer
+    
+    while len(_indexers) > _MAX_INDEXERS:
+        evicted = _indexers.pop(next(iter(_indexers)))
+        await evicted.aclose()
+    
+    return indexer
+
+async def close_automatic_indexers():
+    """Close every long-lived indexer, e.g. on application shutdown"""
+    while _indexers:
+        _, indexer = _indexers.popitem()
+        await indexer.aclose()
 
-async def run_automatic_indexing(user_id: str) -> Dict[str, Any]:
-    """Run automatic file indexing for a user"""
-    indexer = AutomaticFileIndexer(user_id)
-    return await indexer.scan_and_index_all_files()
+async def run_automatic_indexing(user_id: str, details_sink: Optional[DetailsSink] = None,
+                                 incremental: bool = False) -> Dict[str, Any]:
+    """Run automatic file indexing for a user, optionally only for files changed since the last sync"""
+    indexer = await get_automatic_indexer(user_id)
+    if incremental:
+        return await indexer.sync_changes(details_sink)
+    return await indexer.scan_and_index_all_files(details_sink)
 
 if __name__ == "__main__":
     import asyncio
@@ -441,6 +1149,7 @@ if __name__ == "__main__":
         print(f"Errors: {results['errors']}")
         print(f"Skipped files: {results['skipped_files']}")
         print("="*60)
+        await close_automatic_indexers()
     
     asyncio.run(main())
 
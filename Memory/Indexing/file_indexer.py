@@ -3,6 +3,7 @@ File Indexer for Semantic Search
 Handles content extraction, preprocessing, and embedding generation for files
 """
 
+import atexit
 import logging
 import os
 import io
@@ -11,10 +12,16 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 from pathlib import Path
 import asyncio
+import hashlib
 import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from cachetools import LRUCache
 
 try:
     import numpy as np
+    import torch
     from sentence_transformers import SentenceTransformer
     import PyPDF2
     from docx import Document
@@ -24,8 +31,52 @@ except ImportError as e:
     print(f"⚠️ File indexer dependencies not available: {e}")
     INDEXER_AVAILABLE = False
 
+# pdfium's C++ text extraction is much faster than PyPDF2; PyPDF2 remains the fallback
+try:
+    import pypdfium2 as pdfium
+    PDFIUM_AVAILABLE = True
+except ImportError:
+    PDFIUM_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Patterns applied to every indexed file, compiled once
+_FILENAME_SEPARATORS = re.compile(r'[_\-\.]')
+_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+_WHITESPACE = re.compile(r'\s+')
+# Intent buckets triggered by terms in a file's name or content; the lookahead
+# reports every occurrence, including terms that overlap
+_INTENT_TERMS = re.compile(
+    r'(?=(?P<contract>contract|agreement|deal|terms)'
+    r'|(?P<report>report|analysis|briefing|summary)'
+    r'|(?P<financial>earnings|financial|revenue|profit))'
+)
+
+# Extracted text kept per PDF, and pages read to reach it
+MAX_CONTENT_CHARS = 2000
+MAX_PDF_PAGES = 5
+
+# Embeddings kept per distinct searchable text, so unchanged files are not re-encoded
+EMBEDDING_CACHE_SIZE = 8192
+
+# Removed-slot share of an index above which remove_file_from_index compacts it
+TOMBSTONE_COMPACT_RATIO = 0.25
+
+# Texts per SentenceTransformer.encode batch; half precision leaves room for larger batches
+ENCODE_BATCH_SIZE = 128
+
+# Downloaded files below which parsing stays in-process; shipping bytes to workers costs more
+PARALLEL_EXTRACT_MIN_FILES = 8
+
+def _cpu_supports_bf16() -> bool:
+    """Whether the CPU has native bf16 matmul (AVX512-BF16 or AMX); emulated bf16 is slower than fp32"""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            flags = f.read()
+    except OSError:
+        return False
+    return 'avx512_bf16' in flags or 'amx_bf16' in flags
+
 class ContentExtractor:
     """Extract text content from various file types"""
     
@@ -69,27 +120,58 @@ class ContentExtractor:
             return self._extract_metadata_content(file_data)
     
     def _extract_pdf_content(self, content: bytes) -> str:
-        """Extract text from PDF content"""
-        if not INDEXER_AVAILABLE:
+        """Extract text from PDF content, stopping at the first page that fills the length limit"""
+        if PDFIUM_AVAILABLE:
+            page_texts = self._iter_pdfium_pages(content)
+        elif INDEXER_AVAILABLE:
+            page_texts = self._iter_pypdf2_pages(content)
+        else:
             return ""
         
         try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
             text_parts = []
+            joined_length = 0
             
             # Extract text from first few pages (limit for performance)
-            max_pages = min(5, len(pdf_reader.pages))
-            for page_num in range(max_pages):
-                page = pdf_reader.pages[page_num]
-                text = page.extract_text()
-                if text.strip():
-                    text_parts.append(text.strip())
+            for text in page_texts:
+                text = text.strip()
+                if not text:
+                    continue
+                joined_length += len(text) + (1 if text_parts else 0)
+                text_parts.append(text)
+                if joined_length >= MAX_CONTENT_CHARS:
+                    break
             
-            return ' '.join(text_parts)[:2000]  # Limit length
+            return ' '.join(text_parts)[:MAX_CONTENT_CHARS]  # Limit length
             
         except Exception as e:
             logger.debug(f"PDF extraction error: {e}")
             return ""
+        finally:
+            page_texts.close()
+    
+    @staticmethod
+    def _iter_pdfium_pages(content: bytes):
+        """Yield the text of the first pages of a PDF using pdfium"""
+        pdf = pdfium.PdfDocument(content)
+        try:
+            for page_num in range(min(MAX_PDF_PAGES, len(pdf))):
+                page = pdf[page_num]
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_range()
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+    
+    @staticmethod
+    def _iter_pypdf2_pages(content: bytes):
+        """Yield the text of the first pages of a PDF using PyPDF2"""
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(content))
+        for page_num in range(min(MAX_PDF_PAGES, len(pdf_reader.pages))):
+            yield pdf_reader.pages[page_num].extract_text()
     
     def _extract_docx_content(self, content: bytes) -> str:
         """Extract text from DOCX content"""
@@ -141,8 +223,8 @@ class ContentExtractor:
         name = file_data.get('name', '')
         if name:
             # Clean filename
-            clean_name = re.sub(r'[_\-\.]', ' ', name)
-            clean_name = re.sub(r'\d{4}-\d{2}-\d{2}', '', clean_name)  # Remove dates
+            clean_name = _FILENAME_SEPARATORS.sub(' ', name)
+            clean_name = _DATE_PATTERN.sub('', clean_name)  # Remove dates
             content_parts.append(clean_name)
         
         # Folder path context
@@ -160,6 +242,16 @@ class ContentExtractor:
         
         return ' '.join(content_parts)
 
+# ContentExtractor owned by each extraction worker process
+_worker_extractor: Optional[ContentExtractor] = None
+
+def _extract_one(file_data: Dict, file_content: Optional[bytes]) -> str:
+    """Extract one file's text in a worker process; module-level so the process pool can pickle it"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = ContentExtractor()
+    return _worker_extractor.extract_content(file_data, file_content)
+
 class FileIndexer:
     """Main file indexer for semantic search"""
     
@@ -168,13 +260,26 @@ class FileIndexer:
         self.content_extractor = ContentExtractor()
         self.index_cache = {}
         self.last_update = None
+        self._prepared_model = None
+        # Embedding per searchable-text hash for the prepared model
+        self._embed_cache = LRUCache(maxsize=EMBEDDING_CACHE_SIZE)
+        # Over-allocated storage behind the embeddings view last returned by update_file_in_index
+        self._emb_buf: Optional[np.ndarray] = None
+        self._size = 0
+        # Content extraction workers, started on the first large batch and reused after that
+        self._extract_pool: Optional[ProcessPoolExecutor] = None
+        # Rows removed from the indexed_files list last seen, kept in place until compact()
+        self._tombstoned_files: Optional[List[Dict]] = None
+        self._tombstones: set = set()
     
-    def create_file_index(self, files: List[Dict]) -> Tuple[np.ndarray, List[Dict]]:
+    def create_file_index(self, files: List[Dict],
+                          file_contents: Optional[Dict[str, bytes]] = None) -> Tuple[np.ndarray, List[Dict]]:
         """
         Create semantic index for a list of files
         
         Args:
             files: List of file dictionaries from Google Drive
+            file_contents: Optional downloaded bytes per file_id, parsed across CPU cores
             
         Returns:
             Tuple of (embeddings_matrix, indexed_file_metadata)
@@ -189,10 +294,9 @@ class FileIndexer:
             indexed_files = []
             texts_to_embed = []
             
-            for file_data in files:
-                # Extract and process content
-                content = self.content_extractor.extract_content(file_data)
-                
+            contents = self._extract_contents(files, file_contents)
+            
+            for file_data, content in zip(files, contents):
                 if content.strip():
                     # Create enhanced searchable text
                     searchable_text = self._create_enhanced_searchable_text(file_data, content)
@@ -216,7 +320,7 @@ class FileIndexer:
             
             # Generate embeddings in batches for efficiency
             logger.info(f"🧠 Generating embeddings for {len(texts_to_embed)} files...")
-            embeddings = self.model.encode(texts_to_embed, batch_size=32, show_progress_bar=False)
+            embeddings = self._encode(texts_to_embed)
             
             logger.info(f"✅ Created semantic index: {embeddings.shape}")
             return embeddings, indexed_files
@@ -225,6 +329,109 @@ class FileIndexer:
             logger.error(f"Failed to create file index: {e}")
             return np.array([]), []
     
+    def _extract_contents(self, files: List[Dict], file_contents: Optional[Dict[str, bytes]]) -> List[str]:
+        """Extract text for every file, in input order"""
+        contents = [file_contents.get(file_data.get('file_id')) for file_data in files] if file_contents else []
+        if sum(content is not None for content in contents) < PARALLEL_EXTRACT_MIN_FILES:
+            # Metadata-only or small batches are too cheap to be worth shipping to other processes
+            return [self.content_extractor.extract_content(file_data, content)
+                    for file_data, content in zip(files, contents or [None] * len(files))]
+        
+        # PDF/DOCX/HTML parsing is CPU-bound, so spread it across cores before the encode
+        workers = os.cpu_count() or 1
+        return list(self._get_extract_pool().map(
+            _extract_one,
+            files,
+            contents,
+            chunksize=max(1, len(files) // (workers * 4))
+        ))
+    
+    def _get_extract_pool(self) -> ProcessPoolExecutor:
+        """Extraction process pool, created on first use"""
+        if self._extract_pool is None:
+            # Workers come from a forkserver rather than a fork of this process, which
+            # already holds torch/OpenMP thread state that does not survive fork()
+            self._extract_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                                     mp_context=multiprocessing.get_context("forkserver"))
+        return self._extract_pool
+    
+    def close(self):
+        """Shut down the extraction worker pool, if one was started"""
+        if self._extract_pool is not None:
+            self._extract_pool.shutdown(wait=False)
+            self._extract_pool = None
+    
+    def _prepare_model(self):
+        """Run the model in half precision where the hardware supports it (once per model)"""
+        if self._prepared_model is self.model:
+            return
+        
+        try:
+            if self.model.device.type == 'cuda':
+                self.model.half()
+            elif _cpu_supports_bf16():
+                self.model.to(torch.bfloat16)
+        except Exception as e:
+            logger.debug(f"Keeping embedding model in fp32: {e}")
+        self._prepared_model = self.model
+        self._embed_cache.clear()
+    
+    @staticmethod
+    def _text_key(text: str) -> bytes:
+        """Embedding cache key for a searchable text"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed texts into unit-length float32 vectors, reusing cached embeddings
+        
+        Args:
+            texts: Searchable texts to embed
+            
+        Returns:
+            Embeddings matrix with one row per text
+        """
+        self._prepare_model()
+        keys = [self._text_key(text) for text in texts]
+        
+        # Take cached rows first so encoding new texts can't evict them mid-call
+        rows = {}
+        for key in keys:
+            cached = self._embed_cache.get(key)
+            if cached is not None:
+                rows[key] = cached
+        
+        missing = {key: text for key, text in zip(keys, texts) if key not in rows}
+        if missing:
+            for key, embedding in zip(missing, self._encode_uncached(list(missing.values()))):
+                rows[key] = self._embed_cache[key] = embedding.copy()
+        
+        return np.stack([rows[key] for key in keys])
+    
+    def _encode_uncached(self, texts: List[str]) -> np.ndarray:
+        """Run the model over texts in token-length buckets and return unit-length float32 rows"""
+        # Tokenize everything in one call; the tokenizer's setup cost is paid once, not per batch
+        tokens = self.model.tokenizer(texts, truncation=True, max_length=self.model.max_seq_length)
+        
+        # Run in token-length order so each batch only pads to its own longest text
+        order = np.argsort([len(ids) for ids in tokens['input_ids']], kind='stable')
+        batches = []
+        with torch.inference_mode():
+            for start in range(0, len(texts), ENCODE_BATCH_SIZE):
+                bucket = order[start:start + ENCODE_BATCH_SIZE]
+                features = self.model.tokenizer.pad(
+                    {name: [values[i] for i in bucket] for name, values in tokens.items()},
+                    return_tensors='pt'
+                )
+                features = {name: tensor.to(self.model.device) for name, tensor in features.items()}
+                batches.append(self.model(features)['sentence_embedding'])
+        
+        # Upcast before normalizing so fp16/bf16 rounding doesn't skew the norms
+        sorted_embeddings = torch.nn.functional.normalize(torch.cat(batches).float(), p=2, dim=1).cpu().numpy()
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+    
     def _create_enhanced_searchable_text(self, file_data: Dict, content: str) -> str:
         """Create enhanced searchable text combining metadata and content"""
         components = []
@@ -232,7 +439,7 @@ class FileIndexer:
         # File name (highest weight - add multiple times)
         name = file_data.get('name', '')
         if name:
-            clean_name = re.sub(r'[_\-\.]', ' ', name)
+            clean_name = _FILENAME_SEPARATORS.sub(' ', name)
             components.append(clean_name)
             components.append(clean_name)  # Add twice for higher weight
         
@@ -261,7 +468,7 @@ class FileIndexer:
         
         # Join and clean
         searchable_text = ' '.join(components)
-        searchable_text = re.sub(r'\s+', ' ', searchable_text).strip()
+        searchable_text = _WHITESPACE.sub(' ', searchable_text).strip()
         
         return searchable_text
     
@@ -273,8 +480,11 @@ class FileIndexer:
         content_lower = content.lower()
         folder_lower = file_data.get('folder_path', '').lower()
         
+        # One scan over name and content finds every intent bucket present
+        matched = {match.lastgroup for match in _INTENT_TERMS.finditer(f"{name_lower} {content_lower}")}
+        
         # Contract-related
-        if any(term in name_lower + content_lower for term in ['contract', 'agreement', 'deal', 'terms']):
+        if 'contract' in matched:
             keywords.extend(['contract', 'agreement', 'legal document'])
         
         # Email-related
@@ -282,11 +492,11 @@ class FileIndexer:
             keywords.extend(['email', 'communication', 'message'])
         
         # Report-related
-        if any(term in name_lower + content_lower for term in ['report', 'analysis', 'briefing', 'summary']):
+        if 'report' in matched:
             keywords.extend(['report', 'analysis', 'business document'])
         
         # Financial
-        if any(term in name_lower + content_lower for term in ['earnings', 'financial', 'revenue', 'profit']):
+        if 'financial' in matched:
             keywords.extend(['financial', 'earnings', 'business metrics'])
         
         # Internal vs external
@@ -322,7 +532,7 @@ class FileIndexer:
             if not file_id:
                 return embeddings, indexed_files
             
-            # Find existing file index
+            # Find existing file index (a removed file's row is revived in place)
             existing_index = None
             for i, existing_file in enumerate(indexed_files):
                 if existing_file.get('file_id') == file_id:
@@ -332,7 +542,7 @@ class FileIndexer:
             # Extract content and create embedding
             content = self.content_extractor.extract_content(file_data)
             searchable_text = self._create_enhanced_searchable_text(file_data, content)
-            new_embedding = self.model.encode([searchable_text])
+            new_embedding = self._encode([searchable_text])
             
             enhanced_file_data = {
                 **file_data,
@@ -346,12 +556,10 @@ class FileIndexer:
                 # Update existing
                 embeddings[existing_index] = new_embedding[0]
                 indexed_files[existing_index] = enhanced_file_data
+                self._tombstones_for(indexed_files).discard(existing_index)
             else:
                 # Add new
-                if embeddings.size > 0:
-                    embeddings = np.vstack([embeddings, new_embedding])
-                else:
-                    embeddings = new_embedding
+                embeddings = self._append_embedding(embeddings, new_embedding[0])
                 indexed_files.append(enhanced_file_data)
             
             return embeddings, indexed_files
@@ -360,10 +568,45 @@ class FileIndexer:
             logger.error(f"Failed to update file in index: {e}")
             return embeddings, indexed_files
     
+    def _append_embedding(self, embeddings: np.ndarray, row: np.ndarray) -> np.ndarray:
+        """
+        Append a row with amortized O(1) cost by growing a buffer geometrically
+        
+        Args:
+            embeddings: Current embeddings matrix
+            row: Embedding to append
+            
+        Returns:
+            View of the buffer holding embeddings plus the new row
+        """
+        buf = self._emb_buf
+        # Only the exact view handed out last can grow in place; anything else is copied in
+        owns_view = (
+            buf is not None and embeddings.base is buf
+            and embeddings.shape[0] == self._size
+            and embeddings.ctypes.data == buf.ctypes.data
+        )
+        if not owns_view or self._size == buf.shape[0]:
+            rows = embeddings.shape[0] if embeddings.size > 0 else 0
+            new_buf = np.empty((max(2 * (rows + 1), 16), row.shape[0]),
+                               dtype=embeddings.dtype if rows else row.dtype)
+            if rows:
+                new_buf[:rows] = embeddings
+            self._emb_buf, self._size = new_buf, rows
+        
+        self._emb_buf[self._size] = row
+        self._size += 1
+        return self._emb_buf[:self._size]
+    
     def remove_file_from_index(self, file_id: str, embeddings: np.ndarray, indexed_files: List[Dict]) -> Tuple[np.ndarray, List[Dict]]:
         """
         Remove a file from the index
         
+        The file's row is tombstoned rather than copied out: its entry and embedding
+        stay in place until tombstones exceed TOMBSTONE_COMPACT_RATIO of the index,
+        when both are compacted away. Until then search_index() skips it; other
+        readers of the index exclude it with live_mask().
+        
         Args:
             file_id: ID of file to remove
             embeddings: Current embeddings matrix
@@ -373,6 +616,8 @@ class FileIndexer:
             Updated (embeddings, indexed_files)
         """
         try:
+            tombstones = self._track_tombstones(indexed_files)
+            
             # Find file index
             remove_index = None
             for i, file_data in enumerate(indexed_files):
@@ -380,11 +625,13 @@ class FileIndexer:
                     remove_index = i
                     break
             
-            if remove_index is not None:
-                # Remove from both arrays
-                indexed_files.pop(remove_index)
-                if embeddings.size > 0:
-                    embeddings = np.delete(embeddings, remove_index, axis=0)
+            if remove_index is not None and remove_index not in tombstones:
+                tombstones.add(remove_index)
+                removed = indexed_files[remove_index]
+                self._embed_cache.pop(self._text_key(removed.get('searchable_text', '')), None)
+                
+                if len(tombstones) > TOMBSTONE_COMPACT_RATIO * len(indexed_files):
+                    embeddings, indexed_files = self.compact(embeddings, indexed_files)
             
             return embeddings, indexed_files
             
@@ -392,23 +639,135 @@ class FileIndexer:
             logger.error(f"Failed to remove file from index: {e}")
             return embeddings, indexed_files
     
+    def _track_tombstones(self, indexed_files: List[Dict]) -> set:
+        """Removed row numbers of indexed_files, starting a fresh set if another list was tracked"""
+        if self._tombstoned_files is not indexed_files:
+            self._tombstoned_files = indexed_files
+            self._tombstones = set()
+        return self._tombstones
+    
+    def _tombstones_for(self, indexed_files: List[Dict]) -> set:
+        """Removed row numbers of indexed_files; empty, and nothing tracked, for any other list"""
+        return self._tombstones if self._tombstoned_files is indexed_files else set()
+    
+    def live_mask(self, indexed_files: List[Dict]) -> np.ndarray:
+        """
+        Rows of the index that have not been removed
+        
+        search_index() applies it; any other scoring over an index between compactions
+        should drop the other rows too, e.g. scores[~mask] = -np.inf, before ranking.
+        
+        Args:
+            indexed_files: Current indexed files list
+            
+        Returns:
+            Boolean array with one entry per row, True for live files
+        """
+        mask = np.ones(len(indexed_files), dtype=bool)
+        tombstones = self._tombstones_for(indexed_files)
+        if tombstones:
+            mask[list(tombstones)] = False
+        return mask
+    
+    def search_index(self, query: str, embeddings: np.ndarray, indexed_files: List[Dict],
+                     top_k: int = 10) -> List[Tuple[Dict, float]]:
+        """
+        Rank indexed files by cosine similarity to a query, skipping removed files
+        
+        Args:
+            query: Search text
+            embeddings: Current embeddings matrix
+            indexed_files: Current indexed files list
+            top_k: Maximum number of results
+            
+        Returns:
+            (file data, similarity) pairs, best first
+        """
+        if not self.model or not INDEXER_AVAILABLE or embeddings.size == 0:
+            return []
+        
+        try:
+            live = self.live_mask(indexed_files)
+            top_k = min(top_k, int(live.sum()))
+            if top_k <= 0:
+                return []
+            
+            # Rows are unit length, so the dot product is the cosine similarity
+            scores = embeddings.astype(np.float32, copy=False) @ self._encode([query])[0]
+            scores[~live] = -np.inf
+            
+            top = np.argpartition(-scores, top_k - 1)[:top_k]
+            top = top[np.argsort(-scores[top], kind='stable')]
+            return [(indexed_files[i], float(scores[i])) for i in top]
+            
+        except Exception as e:
+            logger.error(f"Failed to search index: {e}")
+            return []
+    
+    def compact(self, embeddings: np.ndarray, indexed_files: List[Dict]) -> Tuple[np.ndarray, List[Dict]]:
+        """
+        Drop rows tombstoned by remove_file_from_index
+        
+        Args:
+            embeddings: Current embeddings matrix
+            indexed_files: Current indexed files list
+            
+        Returns:
+            (embeddings, indexed_files) holding only live files
+        """
+        if not self._tombstones_for(indexed_files):
+            return embeddings, indexed_files
+        
+        embeddings, indexed_files = self._live_rows(embeddings, indexed_files)
+        self._tombstoned_files, self._tombstones = indexed_files, set()
+        return embeddings, indexed_files
+    
+    def _live_rows(self, embeddings: np.ndarray, indexed_files: List[Dict]) -> Tuple[np.ndarray, List[Dict]]:
+        """embeddings and indexed_files without tombstoned rows (the inputs when none are); tombstone state is untouched"""
+        live = self.live_mask(indexed_files)
+        if live.all():
+            return embeddings, indexed_files
+        
+        if embeddings.size > 0:
+            embeddings = embeddings[live]
+        return embeddings, [file_data for file_data, keep in zip(indexed_files, live) if keep]
+    
     def save_index(self, embeddings: np.ndarray, indexed_files: List[Dict], file_path: str):
-        """Save index to disk"""
+        """
+        Save index to disk: file metadata as JSON, embeddings as a float16 .npy beside it
+        
+        Tombstoned rows are left out of the files, while the caller's index and its
+        tombstones stay as they are. Both files are written to temp files and moved
+        into place, the JSON last, so readers never see a partially written file.
+        """
+        npy_path = f"{file_path}.npy"
+        temp_npy_path = f"{npy_path}.{os.getpid()}.tmp"
+        temp_json_path = f"{file_path}.{os.getpid()}.tmp"
         try:
+            embeddings, indexed_files = self._live_rows(embeddings, indexed_files)
+            with open(temp_npy_path, 'wb') as f:
+                np.save(f, embeddings.astype(np.float16))
+            
             index_data = {
-                'embeddings': embeddings.tolist() if embeddings.size > 0 else [],
                 'files': indexed_files,
                 'created_at': datetime.now().isoformat(),
-                'version': '1.0'
+                'version': '2.0'
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(index_data, f, ensure_ascii=False, indent=2)
+            with open(temp_json_path, 'w', encoding='utf-8') as f:
+                json.dump(index_data, f, ensure_ascii=False, separators=(',', ':'))
+            
+            # The JSON commits the save; load_index rejects embeddings that don't match it
+            os.replace(temp_npy_path, npy_path)
+            os.replace(temp_json_path, file_path)
             
             logger.info(f"✅ Saved semantic index to {file_path}")
             
         except Exception as e:
             logger.error(f"Failed to save index: {e}")
+            for temp_path in (temp_npy_path, temp_json_path):
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
     
     def load_index(self, file_path: str) -> Tuple[np.ndarray, List[Dict]]:
         """Load index from disk"""
@@ -419,10 +778,19 @@ class FileIndexer:
             with open(file_path, 'r', encoding='utf-8') as f:
                 index_data = json.load(f)
             
-            embeddings_list = index_data.get('embeddings', [])
-            embeddings = np.array(embeddings_list) if embeddings_list else np.array([])
+            if 'embeddings' in index_data:
+                # Version 1.0 indexes stored the embeddings inline as JSON lists
+                embeddings_list = index_data['embeddings']
+                embeddings = np.array(embeddings_list) if embeddings_list else np.array([])
+            else:
+                embeddings = np.load(f"{file_path}.npy").astype(np.float32)
             
             indexed_files = index_data.get('files', [])
+            if indexed_files and embeddings.shape[0] != len(indexed_files):
+                # A save interrupted between its two renames leaves embeddings from another version
+                logger.error(f"Index {file_path} has {len(indexed_files)} files but "
+                             f"{embeddings.shape[0]} embeddings; ignoring it")
+                return np.array([]), []
             
             logger.info(f"✅ Loaded semantic index from {file_path}")
             return embeddings, indexed_files
@@ -433,6 +801,9 @@ class FileIndexer:
 
 # Global instance
 file_indexer = FileIndexer() if INDEXER_AVAILABLE else None
+if file_indexer is not None:
+    # Nothing else owns the shared instance, so stop its extraction workers at exit
+    atexit.register(file_indexer.close)
 
 def get_file_indexer() -> Optional[FileIndexer]:
     """Get the global file indexer instance"""
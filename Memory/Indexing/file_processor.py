@@ -71,22 +71,27 @@ class FileProcessor:
     async def extract_text_from_memory(self, file_content: bytes, file_name: str, mime_type: str) -> Optional[str]:
         """Extract text content from file bytes in memory"""
         try:
-            file_extension = Path(file_name).suffix.lower()
-            
-            if file_extension not in self.supported_formats:
-                logger.warning(f"Unsupported file format: {file_extension}")
-                return None
-            
             # Run extraction in thread pool to avoid blocking
             loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(None, self.extract_text_from_bytes, file_content, file_name)
+                
+        except Exception as e:
+            logger.error(f"Error extracting text from {file_name} (memory): {str(e)}")
+            return None
+    
+    def extract_text_from_bytes(self, file_content: bytes, file_name: str) -> Optional[str]:
+        """Synchronously extract and clean text from file bytes (safe to run in a worker process)"""
+        try:
+            file_extension = Path(file_name).suffix.lower()
             
             if file_extension in ['.txt', '.md']:
-                text_content = await loop.run_in_executor(None, self._extract_text_from_bytes_txt, file_content)
+                text_content = self._extract_text_from_bytes_txt(file_content)
             elif file_extension == '.pdf':
-                text_content = await loop.run_in_executor(None, self._extract_text_from_bytes_pdf, file_content)
+                text_content = self._extract_text_from_bytes_pdf(file_content)
             elif file_extension == '.docx':
-                text_content = await loop.run_in_executor(None, self._extract_text_from_bytes_docx, file_content)
+                text_content = self._extract_text_from_bytes_docx(file_content)
             else:
+                logger.warning(f"Unsupported file format: {file_extension}")
                 return None
             
             if text_content:
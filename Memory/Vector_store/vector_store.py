@@ -171,6 +171,65 @@ class VectorStoreManager:
             logger.error(f"Error adding document {document_id}: {str(e)}")
             return False
     
+    def add_documents(self, collection_name: str, documents: List[Dict[str, Any]]) -> bool:
+        """
+        Add several documents with one batched embedding pass and a single upsert
+        
+        Args:
+            collection_name: Target collection
+            documents: Dicts with "document_id", "text" and optional "metadata"
+            
+        Returns:
+            True if every document was written
+        """
+        try:
+            if not documents:
+                return True
+            
+            # Check if vector store is available
+            if not self.is_available():
+                logger.warning("Vector store not available - skipping document addition")
+                return False
+            
+            if not self._ensure_embedding_model():
+                logger.error("Embedding model not available")
+                return False
+            
+            # Embed each distinct text once, in a single batch
+            unique_texts = list(dict.fromkeys(doc["text"] for doc in documents))
+            embeddings = self.embedding_model.encode(unique_texts)
+            vectors = {text: embedding.tolist() for text, embedding in zip(unique_texts, embeddings)}
+            
+            # Documents sharing an id map to the same point; the last one wins,
+            # as it would with one upsert per document
+            points = {}
+            for doc in documents:
+                metadata = doc.get("metadata") or {}
+                metadata.update({
+                    "text": doc["text"],
+                    "document_id": doc["document_id"],
+                    "embedding_model": self.embedding_model_name
+                })
+                
+                point_id = self._generate_point_id(doc["document_id"])
+                points[point_id] = PointStruct(
+                    id=point_id,
+                    vector=vectors[doc["text"]],
+                    payload=metadata
+                )
+            
+            self.client.upsert(
+                collection_name=collection_name,
+                points=list(points.values())
+            )
+            
+            logger.info(f"Added {len(points)} documents to collection {collection_name}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error adding {len(documents)} documents to {collection_name}: {str(e)}")
+            return False
+    
     def search_similar(self, collection_name: str, query_text: str, limit: int = 5, 
                       score_threshold: float = 0.7) -> List[Dict[str, Any]]:
         """Search for similar documents"""
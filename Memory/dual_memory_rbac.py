@@ -6,6 +6,7 @@ Integrates with Google Drive folder structure and permissions.
 
 import logging
 import os
+from collections import defaultdict
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from dataclasses import dataclass
@@ -360,18 +361,14 @@ class DualMemoryRBACManager:
         logger.info(f"Collection setup: {success_count}/{total_collections} successful")
         return success_count == total_collections
     
-    def add_memory(self, user: User, agent_name: str, memory_type: MemoryType, 
-                  memory_id: str, content: str, metadata: Dict[str, Any] = None) -> bool:
-        """Add memory to appropriate collection with access control"""
-        if not self._initialize_vector_store():
-            return False
-        
+    def _get_writable_collection(self, user: User, agent_name: str, memory_type: MemoryType) -> Optional[str]:
+        """Resolve the collection for an agent's memory and check the user may write to it"""
         # Determine target collection
         if memory_type == MemoryType.PUBLIC:
             department = self.get_agent_department(agent_name)
             if not department:
                 logger.error(f"Unknown department for agent: {agent_name}")
-                return False
+                return None
             collection_name = self.get_public_collection_name(department)
         else:  # PRIVATE
             collection_name = self.get_private_collection_name(agent_name)
@@ -379,6 +376,18 @@ class DualMemoryRBACManager:
         # Validate write access
         if not self.validate_memory_access(user, collection_name, AccessType.WRITE):
             logger.warning(f"User {user.username} denied write access to {collection_name}")
+            return None
+        
+        return collection_name
+    
+    def add_memory(self, user: User, agent_name: str, memory_type: MemoryType, 
+                  memory_id: str, content: str, metadata: Dict[str, Any] = None) -> bool:
+        """Add memory to appropriate collection with access control"""
+        if not self._initialize_vector_store():
+            return False
+        
+        collection_name = self._get_writable_collection(user, agent_name, memory_type)
+        if not collection_name:
             return False
         
         # Add metadata
@@ -406,6 +415,88 @@ class DualMemoryRBACManager:
         
         return success
     
+    def add_memories(self, user: User, memory_type: MemoryType, items: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Add several memories with access control, one vector store batch per collection
+        
+        Args:
+            user: User performing the writes
+            memory_type: Public or private memory
+            items: Dicts with "agent_name", "memory_id", "content" and optional "metadata"
+            
+        Returns:
+            Per-item success flags, in the order of items
+        """
+        results = [False] * len(items)
+        if not self._initialize_vector_store():
+            return results
+        
+        created_at = datetime.now().isoformat()
+        documents_by_collection = defaultdict(list)
+        
+        for index, item in enumerate(items):
+            agent_name = item["agent_name"]
+            collection_name = self._get_writable_collection(user, agent_name, memory_type)
+            if not collection_name:
+                continue
+            
+            metadata = item.get("metadata") or {}
+            metadata.update({
+                "agent_name": agent_name,
+                "memory_type": memory_type.value,
+                "department": self.get_agent_department(agent_name),
+                "created_by": user.id,
+                "created_at": created_at
+            })
+            
+            documents_by_collection[collection_name].append((index, {
+                "document_id": item["memory_id"],
+                "text": item["content"],
+                "metadata": metadata
+            }))
+        
+        for collection_name, entries in documents_by_collection.items():
+            success = self.vector_store.add_documents(collection_name, [document for _, document in entries])
+            for index, _ in entries:
+                results[index] = success
+            
+            if success:
+                logger.info(f"Added {len(entries)} {memory_type.value} memories to {collection_name}")
+        
+        return results
+    
+    def delete_memories(self, user: User, memory_type: MemoryType, items: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Delete several memories with access control
+        
+        Args:
+            user: User performing the deletes
+            memory_type: Public or private memory
+            items: Dicts with "agent_name" and "memory_id"
+            
+        Returns:
+            Per-item success flags, in the order of items
+        """
+        results = [False] * len(items)
+        if not self._initialize_vector_store():
+            return results
+        
+        # Agents of one department share a public collection, so each point is deleted once
+        deleted: Dict[Tuple[str, str], bool] = {}
+        for index, item in enumerate(items):
+            collection_name = self._get_writable_collection(user, item["agent_name"], memory_type)
+            if not collection_name:
+                continue
+            
+            key = (collection_name, item["memory_id"])
+            if key not in deleted:
+                deleted[key] = self.vector_store.delete_document(collection_name, item["memory_id"])
+                if deleted[key]:
+                    logger.info(f"Deleted {memory_type.value} memory {item['memory_id']} from {collection_name}")
+            results[index] = deleted[key]
+        
+        return results
+    
     def search_memory(self, user: User, agent_name: str, memory_type: MemoryType,
                      query: str, limit: int = 5, score_threshold: float = 0.7) -> List[Dict[str, Any]]:
         """Search memory with access control"""
@@ -122,6 +122,38 @@ class UnifiedRBACService:
             metadata=metadata
         )
     
+    def add_public_memory_bulk(self, user: User, items: List[Dict[str, Any]]) -> List[bool]:
+        """Add several memories to public department collections in one batch per collection"""
+        return self.memory_manager.add_memories(
+            user=user,
+            memory_type=MemoryType.PUBLIC,
+            items=items
+        )
+    
+    def add_private_memory_bulk(self, user: User, items: List[Dict[str, Any]]) -> List[bool]:
+        """Add several memories to private agent collections in one batch per collection"""
+        return self.memory_manager.add_memories(
+            user=user,
+            memory_type=MemoryType.PRIVATE,
+            items=items
+        )
+    
+    def delete_public_memory_bulk(self, user: User, items: List[Dict[str, Any]]) -> List[bool]:
+        """Delete several memories from public department collections"""
+        return self.memory_manager.delete_memories(
+            user=user,
+            memory_type=MemoryType.PUBLIC,
+            items=items
+        )
+    
+    def delete_private_memory_bulk(self, user: User, items: List[Dict[str, Any]]) -> List[bool]:
+        """Delete several memories from private agent collections"""
+        return self.memory_manager.delete_memories(
+            user=user,
+            memory_type=MemoryType.PRIVATE,
+            items=items
+        )
+    
     def search_public_memory(self, user: User, agent_name: str, query: str,
                            limit: int = 5, score_threshold: float = 0.7) -> List[Dict[str, Any]]:
         """Search public department memory"""
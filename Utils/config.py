@@ -276,7 +276,8 @@ class Config:
             
             # Search behavior
             "max_results": int(os.getenv("SEARCH_MAX_RESULTS", "25")),
-            "max_workers": int(os.getenv("SEARCH_MAX_WORKERS", "2")),
+            "max_workers": int(os.getenv("SEARCH_MAX_WORKERS",
+                                         int(os.getenv("GMAIL_QPS_BUDGET", "10")) + int(os.getenv("DRIVE_QPS_BUDGET", "10")))),
             "parallel_search": os.getenv("SEARCH_PARALLEL", "true").lower() == "true",
             
             # Pagination
@@ -0,0 +1,9 @@
+"""
+Shared pytest setup
+Makes the repository packages importable however pytest is invoked
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,295 @@
+"""
+Tests for the automatic indexer's skip database and incremental Drive sync
+"""
+
+import asyncio
+import json
+import sqlite3
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+afi = pytest.importorskip("Memory.Indexing.automatic_file_indexer")
+
+
+class FakeRequest:
+    """googleapiclient request stand-in; execute returns (or raises) a canned response"""
+    
+    def __init__(self, response):
+        self.response = response
+    
+    def execute(self, http=None, **kwargs):
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class FakeDriveService:
+    """Drive v3 service answering changes.list from pages keyed by page token"""
+    
+    def __init__(self):
+        self.change_pages = {}
+        self.start_page_token = "start-token"
+    
+    def files(self):
+        return self
+    
+    def changes(self):
+        return self
+    
+    def list(self, pageToken=None, **kwargs):
+        if 'q' in kwargs:
+            return FakeRequest({'files': []})  # no DigitalTwin_Brain folder
+        return FakeRequest(self.change_pages[pageToken])
+    
+    def getStartPageToken(self, **kwargs):
+        return FakeRequest({'startPageToken': self.start_page_token})
+
+
+class FakeDriveManager:
+    
+    def __init__(self, user_id):
+        self.service = FakeDriveService()
+        self.credentials = object()
+
+
+class FakeRbacService:
+    """Records bulk deletes; delete_results overrides the per-item outcome"""
+    
+    def __init__(self):
+        self.deleted = []
+        self.delete_results = None
+    
+    def _delete(self, confidentiality, user, items):
+        self.deleted.append((confidentiality, items))
+        return self.delete_results if self.delete_results is not None else [True] * len(items)
+    
+    def delete_public_memory_bulk(self, user, items):
+        return self._delete("public", user, items)
+    
+    def delete_private_memory_bulk(self, user, items):
+        return self._delete("private", user, items)
+
+
+def http_error(status):
+    return HttpError(httplib2.Response({'status': status}), b'{"error": "invalid page token"}')
+
+
+@pytest.fixture
+def indexer(tmp_path, monkeypatch):
+    rbac_service = FakeRbacService()
+    monkeypatch.setattr(afi, "get_unified_rbac_service", lambda: rbac_service)
+    monkeypatch.setattr(afi, "GoogleDriveManager", FakeDriveManager)
+    monkeypatch.setattr(afi, "FileProcessor", lambda: None)
+    monkeypatch.setattr(afi, "AuthManager", lambda: None)
+    
+    indexer = afi.AutomaticFileIndexer(
+        "user-1",
+        index_db_path=str(tmp_path / "index_state.db"),
+        drive_state_path=str(tmp_path / "drive_state.json")
+    )
+    # Bulk deletes run as the agent's indexer user; any stand-in will do
+    for agent_name in ("content", "seo", "cmo"):
+        indexer._user_cache[agent_name] = object()
+    
+    yield indexer
+    asyncio.run(indexer.aclose())
+
+
+class TestIndexDatabase:
+    
+    def test_records_indexed_versions(self, indexer):
+        assert indexer._indexed_version("f1") is None
+        
+        indexer._record_indexed("f1", "md5-a", "mem-1", "public", ("content", "seo"))
+        assert indexer._indexed_version("f1") == "md5-a"
+        
+        indexer._record_indexed("f1", "md5-b", "mem-1", "public", ("content",))
+        assert indexer._indexed_version("f1") == "md5-b"
+    
+    def test_records_memories_and_forgets(self, indexer):
+        assert indexer._indexed_entry("f1") is None
+        
+        indexer._record_indexed("f1", "md5-a", "mem-1", "public", ("content", "seo"))
+        assert indexer._indexed_entry("f1") == ("mem-1", "public", ["content", "seo"])
+        
+        indexer._forget_indexed("f1")
+        assert indexer._indexed_version("f1") is None
+        assert indexer._indexed_entry("f1") is None
+    
+    def test_state_is_shared_between_connections(self, indexer):
+        indexer._record_indexed("f1", "md5-a", "mem-1", "private", ("cmo",))
+        
+        other = afi.AutomaticFileIndexer._open_index_db(indexer.index_db_path)
+        try:
+            assert other.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+            assert other.execute('SELECT md5 FROM indexed WHERE file_id=?', ("f1",)).fetchone() == ("md5-a",)
+        finally:
+            other.close()
+    
+    def test_migrates_database_without_memory_columns(self, tmp_path):
+        path = tmp_path / "old_index_state.db"
+        old = sqlite3.connect(path)
+        old.execute('CREATE TABLE indexed(file_id TEXT PRIMARY KEY, md5 TEXT, ts REAL)')
+        old.execute('INSERT INTO indexed VALUES(?,?,?)', ("f1", "md5-a", 1.0))
+        old.commit()
+        old.close()
+        
+        db = afi.AutomaticFileIndexer._open_index_db(path)
+        try:
+            columns = [row[1] for row in db.execute('PRAGMA table_info(indexed)')]
+            assert columns == ['file_id', 'md5', 'ts', 'memory_id', 'confidentiality', 'agents']
+            assert db.execute('SELECT * FROM indexed').fetchall() == [("f1", "md5-a", 1.0, None, None, None)]
+        finally:
+            db.close()
+        
+        # Reopening an already migrated database leaves it as is
+        afi.AutomaticFileIndexer._open_index_db(path).close()
+    
+    def test_old_rows_have_no_recorded_memories(self, indexer):
+        indexer._db.execute('INSERT INTO indexed(file_id, md5, ts) VALUES(?,?,?)', ("f1", "md5-a", 1.0))
+        assert indexer._indexed_entry("f1") == (None, None, [])
+    
+    def test_folder_states(self, indexer):
+        folders = [
+            {'id': 'empty', 'modifiedTime': '2024-01-01T00:00:00Z'},
+            {'id': 'full', 'modifiedTime': '2024-01-02T00:00:00Z'},
+            {'id': 'unlisted', 'modifiedTime': '2024-01-03T00:00:00Z'},
+        ]
+        files_by_folder = {'empty': [], 'full': [{'id': 'f1'}, {'id': 'f2'}]}
+        
+        indexer._record_folder_states(folders, files_by_folder)
+        states = indexer._load_folder_states()
+        
+        # Folders whose listing failed are not recorded
+        assert states == {
+            'empty': ('2024-01-01T00:00:00Z', 0),
+            'full': ('2024-01-02T00:00:00Z', 2),
+        }
+        assert indexer._is_known_empty(folders[0], states)
+        assert not indexer._is_known_empty(folders[1], states)
+        assert not indexer._is_known_empty(folders[2], states)
+        assert not indexer._is_known_empty({'id': 'empty', 'modifiedTime': '2024-02-01T00:00:00Z'}, states)
+        assert not indexer._is_known_empty({'id': 'empty'}, states)
+
+
+class TestChangesSync:
+    
+    @pytest.fixture
+    def service(self, indexer):
+        service = indexer.drive_manager.service
+        service.change_pages = {
+            "saved-token": {
+                'changes': [
+                    {'fileId': 'gone', 'removed': True},
+                    {'fileId': 'trashed', 'file': {'id': 'trashed', 'mimeType': 'text/plain', 'trashed': True}},
+                    {'fileId': 'folder', 'file': {'id': 'folder', 'mimeType': afi._FOLDER_MIME_TYPE}},
+                ],
+                'nextPageToken': "page-2",
+            },
+            "page-2": {
+                'changes': [
+                    {'fileId': 'edited', 'file': {'id': 'edited', 'mimeType': 'text/plain', 'parents': ['mk']}},
+                ],
+                'newStartPageToken': "next-token",
+            },
+            "BAD": http_error(410),
+        }
+        return service
+    
+    def test_list_changes_splits_changed_and_removed_files(self, indexer, service):
+        async def list_changes():
+            indexer._bind_loop()
+            return await indexer._list_changes("saved-token")
+        
+        changed, removed, new_token = asyncio.run(list_changes())
+        
+        assert [file_info['id'] for file_info in changed] == ['edited']
+        assert removed == ['gone', 'trashed']
+        assert new_token == "next-token"
+    
+    def test_removed_files_are_deleted_from_memory(self, indexer, service):
+        indexer._record_indexed("gone", "md5-a", "mem-gone", "public", ("content", "seo"))
+        indexer._record_indexed("trashed", "md5-b", "mem-trashed", "private", ("cmo",))
+        indexer._save_page_token("saved-token")
+        
+        results = asyncio.run(indexer.sync_changes())
+        
+        assert results["removed_files"] == 2
+        assert indexer.rbac_service.deleted == [
+            ("public", [{"agent_name": "content", "memory_id": "mem-gone"},
+                        {"agent_name": "seo", "memory_id": "mem-gone"}]),
+            ("private", [{"agent_name": "cmo", "memory_id": "mem-trashed"}]),
+        ]
+        assert indexer._indexed_entry("gone") is None
+        assert indexer._indexed_entry("trashed") is None
+        assert indexer._load_page_token() == "next-token"
+    
+    def test_unindexed_removals_are_ignored(self, indexer, service):
+        indexer._save_page_token("saved-token")
+        
+        results = asyncio.run(indexer.sync_changes())
+        
+        assert results["removed_files"] == 0
+        assert indexer.rbac_service.deleted == []
+    
+    def test_failed_delete_keeps_index_row(self, indexer, service):
+        indexer._record_indexed("gone", "md5-a", "mem-gone", "public", ("content", "seo"))
+        indexer.rbac_service.delete_results = [True, False]
+        
+        results = asyncio.run(indexer._remove_files(["gone"]))
+        
+        assert results == {"removed": 0, "errors": 1}
+        assert indexer._indexed_entry("gone") == ("mem-gone", "public", ["content", "seo"])
+    
+    def test_row_without_memories_is_forgotten(self, indexer):
+        indexer._db.execute('INSERT INTO indexed(file_id, md5, ts) VALUES(?,?,?)', ("old", "md5-a", 1.0))
+        
+        results = asyncio.run(indexer._remove_files(["old"]))
+        
+        assert results == {"removed": 1, "errors": 0}
+        assert indexer.rbac_service.deleted == []
+        assert indexer._indexed_entry("old") is None
+    
+    def test_rejected_token_falls_back_to_full_scan(self, indexer, service, monkeypatch):
+        scans = []
+        
+        async def scan_and_index_all_files(details_sink=None):
+            scans.append(details_sink)
+            return {"public_files_indexed": 3, "private_files_indexed": 0, "errors": 0,
+                    "skipped_files": 0, "file_details": []}
+        
+        monkeypatch.setattr(indexer, "scan_and_index_all_files", scan_and_index_all_files)
+        indexer._save_page_token("BAD")
+        service.start_page_token = "fresh-token"
+        
+        results = asyncio.run(indexer.sync_changes())
+        
+        assert len(scans) == 1
+        assert results["public_files_indexed"] == 3
+        assert results["removed_files"] == 0
+        assert indexer._load_page_token() == "fresh-token"
+    
+    def test_other_http_errors_are_not_a_token_reset(self, indexer, service, monkeypatch):
+        service.change_pages["saved-token"] = http_error(403)
+        monkeypatch.setattr(indexer, "scan_and_index_all_files",
+                            lambda details_sink=None: pytest.fail("unexpected full scan"))
+        indexer._save_page_token("saved-token")
+        
+        results = asyncio.run(indexer.sync_changes())
+        
+        assert results["errors"] == 1
+        assert indexer._load_page_token() == "saved-token"
+    
+    def test_first_sync_seeds_token(self, indexer, service, monkeypatch):
+        async def scan_and_index_all_files(details_sink=None):
+            return {"public_files_indexed": 0, "private_files_indexed": 0, "errors": 0,
+                    "skipped_files": 0, "file_details": []}
+        
+        monkeypatch.setattr(indexer, "scan_and_index_all_files", scan_and_index_all_files)
+        
+        results = asyncio.run(indexer.sync_changes())
+        
+        assert results["removed_files"] == 0
+        assert json.loads(indexer.drive_state_path.read_text())["user-1"]["pageToken"] == "start-token"
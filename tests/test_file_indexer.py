@@ -0,0 +1,298 @@
+"""
+Tests for the file indexer's in-place embedding storage and tombstoned removals
+"""
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pytest
+
+
+def load_file_indexer():
+    """Load file_indexer.py by path; the Memory package __init__ pulls in the vector store stack"""
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        "Memory", "Indexing", "file_indexer.py")
+    spec = importlib.util.spec_from_file_location("file_indexer", path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+file_indexer = load_file_indexer()
+if not file_indexer.INDEXER_AVAILABLE:
+    pytest.skip("file indexer dependencies not available", allow_module_level=True)
+
+FileIndexer = file_indexer.FileIndexer
+
+DIM = 4
+
+
+def row(value):
+    return np.full(DIM, value, dtype=np.float32)
+
+
+def make_index(count):
+    embeddings = np.stack([row(i) for i in range(count)])
+    indexed_files = [{'file_id': f'f{i}', 'name': f'file {i}.txt', 'searchable_text': f'file {i}'}
+                     for i in range(count)]
+    return embeddings, indexed_files
+
+
+class TestAppendEmbedding:
+    
+    @pytest.mark.parametrize("empty", [np.array([]), np.empty((0, DIM), dtype=np.float32)])
+    def test_appends_to_empty_index(self, empty):
+        indexer = FileIndexer()
+        
+        embeddings = indexer._append_embedding(empty, row(7))
+        
+        assert embeddings.shape == (1, DIM)
+        assert embeddings.dtype == np.float32
+        np.testing.assert_array_equal(embeddings[0], row(7))
+    
+    def test_grows_geometrically_and_keeps_rows(self):
+        indexer = FileIndexer()
+        embeddings, _ = make_index(3)
+        buffers = set()
+        
+        for i in range(3, 100):
+            embeddings = indexer._append_embedding(embeddings, row(i))
+            buffers.add(id(indexer._emb_buf))
+        
+        np.testing.assert_array_equal(embeddings, np.stack([row(i) for i in range(100)]))
+        # 97 appends reallocate only a handful of times
+        assert len(buffers) <= 4
+    
+    def test_appends_in_place_while_capacity_lasts(self):
+        indexer = FileIndexer()
+        embeddings, _ = make_index(3)
+        
+        first = indexer._append_embedding(embeddings, row(3))
+        second = indexer._append_embedding(first, row(4))
+        
+        assert second.base is first.base is indexer._emb_buf
+        assert np.shares_memory(first, second)
+        np.testing.assert_array_equal(second, np.stack([row(i) for i in range(5)]))
+    
+    def test_stale_view_is_copied_not_overwritten(self):
+        indexer = FileIndexer()
+        embeddings, _ = make_index(3)
+        
+        stale = indexer._append_embedding(embeddings, row(3))
+        current = indexer._append_embedding(stale, row(4))
+        branched = indexer._append_embedding(stale, row(9))
+        
+        np.testing.assert_array_equal(current, np.stack([row(i) for i in range(5)]))
+        np.testing.assert_array_equal(branched, np.stack([row(0), row(1), row(2), row(3), row(9)]))
+    
+    def test_foreign_array_is_copied_in(self):
+        indexer = FileIndexer()
+        embeddings, _ = make_index(3)
+        view = indexer._append_embedding(embeddings, row(3))
+        
+        copied = view.copy()
+        result = indexer._append_embedding(copied, row(4))
+        
+        assert not np.shares_memory(result, copied)
+        np.testing.assert_array_equal(copied, np.stack([row(i) for i in range(4)]))
+        np.testing.assert_array_equal(result, np.stack([row(i) for i in range(5)]))
+
+
+class TestTombstones:
+    
+    def test_remove_tombstones_row_in_place(self):
+        indexer = FileIndexer()
+        embeddings, indexed_files = make_index(8)
+        
+        new_embeddings, new_files = indexer.remove_file_from_index('f2', embeddings, indexed_files)
+        
+        assert new_embeddings is embeddings
+        assert new_files is indexed_files
+        assert len(new_files) == 8
+        assert None not in new_files
+        np.testing.assert_array_equal(new_embeddings[2], row(2))
+        assert indexer.live_mask(new_files).tolist() == [True, True, False, True, True, True, True, True]
+    
+    def test_remove_unknown_or_removed_file_is_a_no_op(self):
+        indexer = FileIndexer()
+        embeddings, indexed_files = make_index(8)
+        
+        indexer.remove_file_from_index('missing', embeddings, indexed_files)
+        assert indexer.live_mask(indexed_files).all()
+        
+        indexer.remove_file_from_index('f1', embeddings, indexed_files)
+        indexer.remove_file_from_index('f1', embeddings, indexed_files)
+        assert (~indexer.live_mask(indexed_files)).sum() == 1
+    
+    def test_compacts_once_tombstones_pass_ratio(self):
+        indexer = FileIndexer()
+        embeddings, indexed_files = make_index(8)
+        
+        # 2 of 8 is at the 0.25 ratio, the third removal passes it
+        for file_id in ('f1', 'f4'):
+            embeddings, indexed_files = indexer.remove_file_from_index(file_id, embeddings, indexed_files)
+        assert len(indexed_files) == 8
+        
+        embeddings, indexed_files = indexer.remove_file_from_index('f6', embeddings, indexed_files)
+        
+        assert [file_data['file_id'] for file_data in indexed_files] == ['f0', 'f2', 'f3', 'f5', 'f7']
+        np.testing.assert_array_equal(embeddings, np.stack([row(i) for i in (0, 2, 3, 5, 7)]))
+        assert indexer.live_mask(indexed_files).all()
+    
+    def test_compact_drops_tombstoned_rows(self):
+        indexer = FileIndexer()
+        embeddings, indexed_files = make_index(8)
+        embeddings, indexed_files = indexer.remove_file_from_index('f0', embeddings, indexed_files)
+        
+        embeddings, indexed_files = indexer.compact(embeddings, indexed_files)
+        
+        assert [file_data['file_id'] for file_data in indexed_files] == [f'f{i}' for i in range(1, 8)]
+        np.testing.assert_array_equal(embeddings, np.stack([row(i) for i in range(1, 8)]))
+        assert indexer.live_mask(indexed_files).all()
+    
+    def test_compact_without_tombstones_returns_inputs(self):
+        indexer = FileIndexer()
+        embeddings, indexed_files = make_index(4)
+        
+        result_embeddings, result_files = indexer.compact(embeddings, indexed_files)
+        
+        assert result_embeddings is embeddings
+        assert result_files is indexed_files
+    
+    def test_tombstones_belong_to_one_list(self):
+        indexer = FileIndexer()
+        embeddings, indexed_files = make_index(8)
+        indexer.remove_file_from_index('f3', embeddings, indexed_files)
+        
+        other_embeddings, other_files = make_index(8)
+        
+        assert indexer.live_mask(other_files).all()
+        assert indexer.compact(other_embeddings, other_files)[1] is other_files
+        assert not indexer.live_mask(indexed_files)[3]
+    
+    def test_save_leaves_removed_files_out_and_keeps_tombstones(self, tmp_path):
+        indexer = FileIndexer()
+        embeddings, indexed_files = make_index(10)
+        embeddings, indexed_files = indexer.remove_file_from_index('f3', embeddings, indexed_files)
+        path = str(tmp_path / "index.json")
+        
+        indexer.save_index(embeddings, indexed_files, path)
+        
+        assert len(indexed_files) == 10
+        assert not indexer.live_mask(indexed_files)[3]
+        
+        # Saving the same index again still leaves the removed file out
+        indexer.save_index(embeddings, indexed_files, path)
+        loaded_embeddings, loaded_files = indexer.load_index(path)
+        
+        assert [file_data['file_id'] for file_data in loaded_files] == [f'f{i}' for i in range(10) if i != 3]
+        np.testing.assert_array_equal(loaded_embeddings, np.stack([row(i) for i in range(10) if i != 3]))
+    
+    def test_update_revives_removed_file(self):
+        indexer = FileIndexer(model=object())
+        indexer._encode = lambda texts: np.stack([row(42) for _ in texts])
+        embeddings, indexed_files = make_index(8)
+        embeddings, indexed_files = indexer.remove_file_from_index('f5', embeddings, indexed_files)
+        
+        embeddings, indexed_files = indexer.update_file_in_index(
+            {'file_id': 'f5', 'name': 'file 5 v2.txt'}, embeddings, indexed_files
+        )
+        
+        assert len(indexed_files) == 8
+        assert indexed_files[5]['name'] == 'file 5 v2.txt'
+        np.testing.assert_array_equal(embeddings[5], row(42))
+        assert indexer.live_mask(indexed_files).all()
+    
+    def test_search_skips_removed_files(self):
+        indexer = FileIndexer(model=object())
+        embeddings = np.eye(4, dtype=np.float32)
+        indexed_files = [{'file_id': f'f{i}', 'searchable_text': f'file {i}'} for i in range(4)]
+        query = np.array([0.1, 0.2, 0.9, 0.3], dtype=np.float32)
+        indexer._encode = lambda texts: query[np.newaxis]
+        
+        assert [file_data['file_id'] for file_data, _ in indexer.search_index('q', embeddings, indexed_files)] == \
+            ['f2', 'f3', 'f1', 'f0']
+        
+        embeddings, indexed_files = indexer.remove_file_from_index('f2', embeddings, indexed_files)
+        results = indexer.search_index('q', embeddings, indexed_files, top_k=2)
+        
+        assert [file_data['file_id'] for file_data, _ in results] == ['f3', 'f1']
+        assert results[0][1] == pytest.approx(0.3)
+    
+    def test_search_with_every_file_removed(self):
+        indexer = FileIndexer(model=object())
+        indexer._encode = lambda texts: np.ones((1, DIM), dtype=np.float32)
+        embeddings, indexed_files = make_index(1)
+        embeddings, indexed_files = indexer.remove_file_from_index('f0', embeddings, indexed_files)
+        
+        assert indexer.search_index('q', embeddings, indexed_files) == []
+
+
+class TestExtractPool:
+    
+    def test_pool_is_reused_until_closed(self):
+        indexer = FileIndexer()
+        pool = indexer._get_extract_pool()
+        assert indexer._get_extract_pool() is pool
+        
+        indexer.close()
+        
+        assert indexer._extract_pool is None
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
+        indexer.close()
+    
+    def test_shared_instance_closes_at_exit(self, monkeypatch):
+        registered = []
+        monkeypatch.setattr("atexit.register", registered.append)
+        
+        module = load_file_indexer()
+        
+        assert registered == [module.file_indexer.close]
+
+
+class TestSaveIndex:
+    
+    def test_round_trip(self, tmp_path):
+        indexer = FileIndexer()
+        embeddings, indexed_files = make_index(5)
+        path = str(tmp_path / "index.json")
+        
+        indexer.save_index(embeddings, indexed_files, path)
+        loaded_embeddings, loaded_files = indexer.load_index(path)
+        
+        assert loaded_files == indexed_files
+        assert loaded_embeddings.dtype == np.float32
+        np.testing.assert_array_equal(loaded_embeddings, embeddings)
+        assert sorted(os.listdir(tmp_path)) == ["index.json", "index.json.npy"]
+    
+    def test_failed_save_keeps_previous_index(self, tmp_path, monkeypatch):
+        indexer = FileIndexer()
+        embeddings, indexed_files = make_index(3)
+        path = str(tmp_path / "index.json")
+        indexer.save_index(embeddings, indexed_files, path)
+        
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(file_indexer.json, "dump", fail)
+        indexer.save_index(*make_index(5), path)
+        
+        loaded_embeddings, loaded_files = indexer.load_index(path)
+        assert loaded_files == indexed_files
+        np.testing.assert_array_equal(loaded_embeddings, embeddings)
+        assert sorted(os.listdir(tmp_path)) == ["index.json", "index.json.npy"]
+    
+    def test_mismatched_embeddings_are_rejected(self, tmp_path):
+        indexer = FileIndexer()
+        path = str(tmp_path / "index.json")
+        indexer.save_index(*make_index(3), path)
+        np.save(f"{path}.npy", make_index(4)[0])
+        
+        loaded_embeddings, loaded_files = indexer.load_index(path)
+        
+        assert loaded_files == []
+        assert loaded_embeddings.size == 0
@@ -0,0 +1,40 @@
+"""
+Tests for Gmail search results
+"""
+
+from datetime import datetime, timezone
+
+from Integrations.Google.Search.gmail_client import GmailMessage
+
+
+def make_message(date_str):
+    return GmailMessage(
+        id="m1",
+        thread_id="t1",
+        subject="Quarterly plan",
+        sender="ana@example.com",
+        recipient="ion@example.com",
+        date_str=date_str,
+        snippet="",
+        labels=["INBOX"],
+        has_attachments=False
+    )
+
+
+def test_to_dict_keeps_raw_date_without_parsing():
+    message = make_message("Tue, 01 Jul 2025 10:00:00 +0000")
+    
+    assert message.to_dict()["date"] == "Tue, 01 Jul 2025 10:00:00 +0000"
+    assert "date" not in message.__dict__
+
+
+def test_date_is_parsed_on_access():
+    message = make_message("Tue, 01 Jul 2025 10:00:00 +0000")
+    
+    assert message.date == datetime(2025, 7, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def test_to_dict_without_date_header():
+    message = make_message("")
+    
+    assert datetime.fromisoformat(message.to_dict()["date"])
@@ -0,0 +1,68 @@
+"""
+Tests for the query interpreter's language and source detection
+"""
+
+import pytest
+
+from Integrations.Google.Search.query_interpreter import QueryInterpreter, SearchSource
+
+
+@pytest.fixture(scope="module")
+def interpreter():
+    return QueryInterpreter()
+
+
+@pytest.mark.parametrize("query, source", [
+    # Articulated
+    ("fișierul buget", SearchSource.DRIVE),
+    ("fisierul buget", SearchSource.DRIVE),
+    ("dosarul hr", SearchSource.DRIVE),
+    ("documentul final", SearchSource.DRIVE),
+    ("mesajul de ieri", SearchSource.GMAIL),
+    ("emailul trimis", SearchSource.GMAIL),
+    ("atașamentul contract", SearchSource.AUTO),
+    ("conținutul raportului", SearchSource.AUTO),
+    ("subiectul ofertei", SearchSource.AUTO),
+    # Genitive
+    ("fișierului buget", SearchSource.DRIVE),
+    ("folderului marketing", SearchSource.DRIVE),
+    ("mesajului de ieri", SearchSource.GMAIL),
+    ("emailului trimis", SearchSource.GMAIL),
+    ("corespondenței cu clientul", SearchSource.GMAIL),
+    # Plural, with and without the article
+    ("fișiere vechi", SearchSource.DRIVE),
+    ("fișierele cu bugetul", SearchSource.DRIVE),
+    ("fisierelor vechi", SearchSource.DRIVE),
+    ("documentele proiectului", SearchSource.DRIVE),
+    ("dosare vechi", SearchSource.DRIVE),
+    ("mesajele lui ion", SearchSource.GMAIL),
+    ("emailurile de la ana", SearchSource.GMAIL),
+    ("comunicările interne", SearchSource.GMAIL),
+    ("atașamentele de ieri", SearchSource.AUTO),
+    ("etichetele proiect", SearchSource.AUTO),
+])
+def test_inflected_romanian_nouns(interpreter, query, source):
+    spec = interpreter.interpret_query(query)
+    
+    assert spec.language == "ro"
+    assert spec.source == source
+    # Romanian specs carry the diacritic-stripped terms used for query expansion
+    assert spec.stripped_terms == [interpreter._strip_diacritics(term) for term in spec.free_text_terms]
+
+
+@pytest.mark.parametrize("query, source", [
+    ("marketing plan", SearchSource.AUTO),
+    ("emails from ana", SearchSource.GMAIL),
+    ("photos documents", SearchSource.DRIVE),
+    ("documented procedures", SearchSource.AUTO),
+    ("documents folder", SearchSource.DRIVE),
+    ("subject review", SearchSource.AUTO),
+    ("content strategy", SearchSource.AUTO),
+    ("the meeting notes", SearchSource.AUTO),
+])
+def test_english_queries(interpreter, query, source):
+    spec = interpreter.interpret_query(query)
+    
+    assert spec.language == "en"
+    assert spec.source == source
+    assert spec.stripped_terms is None
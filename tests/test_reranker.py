@@ -0,0 +1,51 @@
+"""
+Tests for the reranker's query term matching
+"""
+
+import pytest
+
+from Integrations.Google.Search.reranker import _TermMatcher, _get_term_matcher
+
+
+TEXTS = [
+    "",
+    "plan",
+    "planificare plan de marketing, plan anual",
+    "marketing plan planplan planificareplanificare",
+    "raport raportare raport-lunar RAPORT",
+    "aaaa",
+    "no query terms here",
+]
+
+
+def expected_counts(terms, text):
+    return {term: text.count(term) for term in set(terms)}
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("terms", [
+    ["plan", "planificare", "marketing"],
+    ["raport", "raportare", "lunar"],
+    ["a", "aa", "aaa"],
+    ["plan", "plan", "anual"],
+])
+def test_counts_match_str_count(terms, text):
+    assert _TermMatcher(terms).count(text) == expected_counts(terms, text)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_single_term(text):
+    assert _TermMatcher(["plan"]).count(text) == {"plan": text.count("plan")}
+
+
+def test_duplicate_terms_collapse_to_single_term_path():
+    assert _TermMatcher(["plan", "plan"]).count("plan plan") == {"plan": 2}
+
+
+def test_regex_metacharacters_are_literal():
+    matcher = _TermMatcher(["c++", "c", "a.b"])
+    assert matcher.count("c++ c axb a.b") == {"c++": 1, "c": 2, "a.b": 1}
+
+
+def test_shared_matcher_per_term_set():
+    assert _get_term_matcher(("plan", "marketing")) is _get_term_matcher(("plan", "marketing"))
@@ -0,0 +1,252 @@
+"""
+Tests for the search orchestrator's circuit breaker and request coalescing
+"""
+
+import threading
+import time
+
+import pytest
+
+from Integrations.Google.Search import orchestrator
+from Integrations.Google.Search.orchestrator import _CircuitBreaker, _SingleFlight
+
+
+class FakeClock:
+    """Stands in for the orchestrator's time module so breaker timeouts elapse on demand"""
+    
+    def __init__(self):
+        self.now = 1000.0
+    
+    def monotonic(self):
+        return self.now
+    
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(orchestrator, "time", fake)
+    return fake
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.fail_threshold):
+        breaker.record_failure()
+
+
+def run_concurrently(fn, count):
+    """Call fn from count threads released together; returns their results"""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+    
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = fn()
+        except Exception as e:
+            results[i] = e
+    
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+    return results
+
+
+class TestCircuitBreaker:
+    
+    def test_opens_at_threshold(self, clock):
+        breaker = _CircuitBreaker(fail_threshold=3, reset_timeout=30.0)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert not breaker.is_open()
+        breaker.record_failure()
+        assert breaker.is_open()
+    
+    def test_success_resets_failure_count(self, clock):
+        breaker = _CircuitBreaker(fail_threshold=3, reset_timeout=30.0)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert not breaker.is_open()
+    
+    def test_stays_open_until_reset_timeout(self, clock):
+        breaker = _CircuitBreaker(fail_threshold=1, reset_timeout=30.0)
+        open_breaker(breaker)
+        clock.now += 29.0
+        assert breaker.is_open()
+        clock.now += 1.0
+        assert not breaker.is_open()
+    
+    def test_half_open_lets_one_probe_through(self, clock):
+        breaker = _CircuitBreaker(fail_threshold=1, reset_timeout=30.0)
+        open_breaker(breaker)
+        clock.now += 30.0
+        
+        results = run_concurrently(breaker.is_open, 16)
+        
+        assert results.count(False) == 1
+        assert results.count(True) == 15
+        # Everyone stays blocked until the probe reports back
+        assert breaker.is_open()
+    
+    def test_successful_probe_closes(self, clock):
+        breaker = _CircuitBreaker(fail_threshold=1, reset_timeout=30.0)
+        open_breaker(breaker)
+        clock.now += 30.0
+        assert not breaker.is_open()
+        
+        breaker.record_success()
+        
+        assert not breaker.is_open()
+        assert not breaker.is_open()
+    
+    def test_failed_probe_reopens_for_full_timeout(self, clock):
+        breaker = _CircuitBreaker(fail_threshold=3, reset_timeout=30.0)
+        open_breaker(breaker)
+        clock.now += 30.0
+        assert not breaker.is_open()
+        
+        breaker.record_failure()
+        
+        clock.now += 29.0
+        assert breaker.is_open()
+        clock.now += 1.0
+        assert not breaker.is_open()
+    
+    def test_breakers_are_per_source_and_user(self):
+        search = orchestrator.HybridSearchOrchestrator(max_workers=1)
+        try:
+            gmail = search._get_breaker(orchestrator.SearchSource.GMAIL, "user-1")
+            assert search._get_breaker(orchestrator.SearchSource.GMAIL, "user-1") is gmail
+            assert search._get_breaker(orchestrator.SearchSource.GMAIL, "user-2") is not gmail
+            assert search._get_breaker(orchestrator.SearchSource.DRIVE, "user-1") is not gmail
+        finally:
+            search.close()
+
+
+class TestSingleFlight:
+    
+    def test_concurrent_calls_share_one_execution(self):
+        flight = _SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def leader_fn():
+            calls.append("leader")
+            started.set()
+            release.wait(timeout=5)
+            return ["result"]
+        
+        def follower_fn():
+            calls.append("follower")
+            return ["other"]
+        
+        leader = []
+        leader_thread = threading.Thread(target=lambda: leader.append(flight.do(("key",), leader_fn)))
+        leader_thread.start()
+        assert started.wait(timeout=5)
+        
+        followers = []
+        follower_threads = [
+            threading.Thread(target=lambda: followers.append(flight.do(("key",), follower_fn)))
+            for _ in range(4)
+        ]
+        for thread in follower_threads:
+            thread.start()
+        time.sleep(0.1)  # let the followers reach the in-flight future
+        release.set()
+        for thread in [leader_thread, *follower_threads]:
+            thread.join(timeout=5)
+        
+        assert calls == ["leader"]
+        assert leader == [["result"]]
+        assert followers == [["result"]] * 4
+    
+    def test_exception_propagates_to_followers(self):
+        flight = _SingleFlight()
+        release = threading.Event()
+        
+        def failing_fn():
+            release.wait(timeout=5)
+            raise RuntimeError("quota exceeded")
+        
+        def release_later():
+            time.sleep(0.1)
+            release.set()
+        
+        threading.Thread(target=release_later).start()
+        results = run_concurrently(lambda: flight.do(("key",), failing_fn), 4)
+        
+        assert len(results) == 4
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert all(str(result) == "quota exceeded" for result in results)
+    
+    def test_different_keys_run_separately(self):
+        flight = _SingleFlight()
+        assert flight.do(("a",), lambda: 1) == 1
+        assert flight.do(("b",), lambda: 2) == 2
+    
+    def test_completed_key_runs_again(self):
+        flight = _SingleFlight()
+        calls = []
+        
+        def fn():
+            calls.append(1)
+            return len(calls)
+        
+        assert flight.do(("key",), fn) == 1
+        assert flight.do(("key",), fn) == 2
+        
+        def failing_fn():
+            raise ValueError("boom")
+        
+        with pytest.raises(ValueError):
+            flight.do(("key",), failing_fn)
+        assert flight.do(("key",), fn) == 3
+    
+    def test_base_exception_releases_followers(self):
+        flight = _SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        
+        def interrupted_fn():
+            started.set()
+            release.wait(timeout=5)
+            raise KeyboardInterrupt
+        
+        leader = []
+        
+        def run_leader():
+            try:
+                flight.do(("key",), interrupted_fn)
+            except KeyboardInterrupt as e:
+                leader.append(e)
+        
+        leader_thread = threading.Thread(target=run_leader, daemon=True)
+        leader_thread.start()
+        assert started.wait(timeout=5)
+        
+        followers = []
+        
+        def run_follower():
+            try:
+                flight.do(("key",), lambda: "unexpected")
+            except KeyboardInterrupt as e:
+                followers.append(e)
+        
+        follower_thread = threading.Thread(target=run_follower, daemon=True)
+        follower_thread.start()
+        time.sleep(0.1)  # let the follower reach the in-flight future
+        release.set()
+        leader_thread.join(timeout=5)
+        follower_thread.join(timeout=5)
+        
+        assert not follower_thread.is_alive()
+        assert len(leader) == 1
+        assert len(followers) == 1